@@ -18,134 +18,272 @@ See [https://docs.livekit.io/agents/](https://docs.livekit.io/agents/) for quick
 documentation, and examples.
 """
 
+import importlib
 import typing
 
-from . import cli, inference, ipc, llm, metrics, stt, tokenize, tts, utils, vad, voice
-from ._exceptions import (
-    APIConnectionError,
-    APIError,
-    APIStatusError,
-    APITimeoutError,
-    AssignmentTimeoutError,
-    create_api_error_from_http,
-)
-from .job import (
-    AutoSubscribe,
-    JobContext,
-    JobExecutorType,
-    JobProcess,
-    JobRequest,
-    get_job_context,
-)
-from .language import LanguageCode
-from .llm.chat_context import (
-    AgentConfigUpdate,
-    AgentHandoff,
-    ChatContent,
-    ChatContext,
-    ChatItem,
-    ChatMessage,
-    ChatRole,
-    FunctionCall,
-    FunctionCallOutput,
-)
-from .llm.tool_context import (
-    FunctionTool,
-    ProviderTool,
-    StopResponse,
-    ToolContext,
-    ToolError,
-    function_tool,
-)
-from .plugin import Plugin
-from .simulation import (
-    Scenario,
-    ScenarioGroup,
-    ScenarioUserdata,
-    SimulationContext,
-    SimulationDispatch,
-    SimulationRun,
-    SimulationVerdict,
-)
-from .types import (
-    DEFAULT_API_CONNECT_OPTIONS,
-    NOT_GIVEN,
-    APIConnectOptions,
-    FlushSentinel,
-    NotGiven,
-    NotGivenOr,
-)
 from .version import __version__
-from .voice import (
-    Agent,
-    AgentEvent,
-    AgentFalseInterruptionEvent,
-    AgentSession,
-    AgentStateChangedEvent,
-    AgentTask,
-    CloseEvent,
-    CloseReason,
-    ConversationItemAddedEvent,
-    ErrorEvent,
-    FunctionToolsExecutedEvent,
-    MetricsCollectedEvent,
-    ModelSettings,
-    RecordingOptions,
-    RunContext,
-    SessionUsageUpdatedEvent,
-    SpeechCreatedEvent,
-    UserInputTranscribedEvent,
-    UserStateChangedEvent,
-    UserTurnExceededEvent,
-    avatar,
-    io,
-    room_io,
-    text_transforms,
-)
-from .voice.amd import (
-    AMD,
-    AMDCategory,
-    AMDPredictionEvent,
-)
-from .voice.background_audio import AudioConfig, BackgroundAudioPlayer, BuiltinAudioClip, PlayHandle
-from .voice.room_io import RoomInputOptions, RoomIO, RoomOutputOptions
-from .voice.run_result import (
-    AgentHandoffEvent,
-    ChatMessageEvent,
-    EventAssert,
-    EventRangeAssert,
-    FunctionCallEvent,
-    FunctionCallOutputEvent,
-    RunAssert,
-    RunEvent,
-    RunResult,
-    mock_tools,
-)
-from .voice.turn import (
-    EndpointingOptions,
-    InterruptionOptions,
-    PreemptiveGenerationOptions,
-    TurnHandlingOptions,
-    UserTurnLimitOptions,
-)
-from .worker import (
-    AgentServer,
-    WorkerOptions,
-    WorkerPermissions,
-    WorkerType,
-)
 
 if typing.TYPE_CHECKING:
+    from . import cli, inference, ipc, llm, metrics, stt, tokenize, tts, utils, vad, voice
+    from ._exceptions import (
+        APIConnectionError,
+        APIError,
+        APIStatusError,
+        APITimeoutError,
+        AssignmentTimeoutError,
+        create_api_error_from_http,
+    )
+    from .job import (
+        AutoSubscribe,
+        JobContext,
+        JobExecutorType,
+        JobProcess,
+        JobRequest,
+        get_job_context,
+    )
+    from .language import LanguageCode
     from .llm import mcp  # noqa: F401
+    from .llm.chat_context import (
+        AgentConfigUpdate,
+        AgentHandoff,
+        ChatContent,
+        ChatContext,
+        ChatItem,
+        ChatMessage,
+        ChatRole,
+        FunctionCall,
+        FunctionCallOutput,
+    )
+    from .llm.tool_context import (
+        FunctionTool,
+        ProviderTool,
+        StopResponse,
+        ToolContext,
+        ToolError,
+        function_tool,
+    )
+    from .plugin import Plugin
+    from .simulation import (
+        Scenario,
+        ScenarioGroup,
+        ScenarioUserdata,
+        SimulationContext,
+        SimulationDispatch,
+        SimulationRun,
+        SimulationVerdict,
+    )
+    from .types import (
+        DEFAULT_API_CONNECT_OPTIONS,
+        NOT_GIVEN,
+        APIConnectOptions,
+        FlushSentinel,
+        NotGiven,
+        NotGivenOr,
+    )
+    from .voice import (
+        Agent,
+        AgentEvent,
+        AgentFalseInterruptionEvent,
+        AgentSession,
+        AgentStateChangedEvent,
+        AgentTask,
+        CloseEvent,
+        CloseReason,
+        ConversationItemAddedEvent,
+        ErrorEvent,
+        FunctionToolsExecutedEvent,
+        MetricsCollectedEvent,
+        ModelSettings,
+        RecordingOptions,
+        RunContext,
+        SessionUsageUpdatedEvent,
+        SpeechCreatedEvent,
+        UserInputTranscribedEvent,
+        UserStateChangedEvent,
+        UserTurnExceededEvent,
+        avatar,
+        io,
+        room_io,
+        text_transforms,
+    )
+    from .voice.amd import (
+        AMD,
+        AMDCategory,
+        AMDPredictionEvent,
+    )
+    from .voice.background_audio import (
+        AudioConfig,
+        BackgroundAudioPlayer,
+        BuiltinAudioClip,
+        PlayHandle,
+    )
+    from .voice.room_io import RoomInputOptions, RoomIO, RoomOutputOptions
+    from .voice.run_result import (
+        AgentHandoffEvent,
+        ChatMessageEvent,
+        EventAssert,
+        EventRangeAssert,
+        FunctionCallEvent,
+        FunctionCallOutputEvent,
+        RunAssert,
+        RunEvent,
+        RunResult,
+        mock_tools,
+    )
+    from .voice.turn import (
+        EndpointingOptions,
+        InterruptionOptions,
+        PreemptiveGenerationOptions,
+        TurnHandlingOptions,
+        UserTurnLimitOptions,
+    )
+    from .worker import (
+        AgentServer,
+        WorkerOptions,
+        WorkerPermissions,
+        WorkerType,
+    )
+
+# The public namespace is resolved on first access (PEP 562): importing livekit.agents doesn't
+# pull in the voice pipeline, the CLI, aiohttp, OpenTelemetry and the provider SDKs until they
+# are used. Spawned job processes and the CLI only pay for what they touch.
+_LAZY_SUBMODULES = {
+    "cli",
+    "inference",
+    "ipc",
+    "llm",
+    "metrics",
+    "stt",
+    "tokenize",
+    "tts",
+    "utils",
+    "vad",
+    "voice",
+}
+
+# public name -> module it is defined in
+_LAZY_ATTRS = {
+    "APIConnectionError": "._exceptions",
+    "APIError": "._exceptions",
+    "APIStatusError": "._exceptions",
+    "APITimeoutError": "._exceptions",
+    "AssignmentTimeoutError": "._exceptions",
+    "create_api_error_from_http": "._exceptions",
+    "AutoSubscribe": ".job",
+    "JobContext": ".job",
+    "JobExecutorType": ".job",
+    "JobProcess": ".job",
+    "JobRequest": ".job",
+    "get_job_context": ".job",
+    "LanguageCode": ".language",
+    "AgentConfigUpdate": ".llm.chat_context",
+    "AgentHandoff": ".llm.chat_context",
+    "ChatContent": ".llm.chat_context",
+    "ChatContext": ".llm.chat_context",
+    "ChatItem": ".llm.chat_context",
+    "ChatMessage": ".llm.chat_context",
+    "ChatRole": ".llm.chat_context",
+    "FunctionCall": ".llm.chat_context",
+    "FunctionCallOutput": ".llm.chat_context",
+    "FunctionTool": ".llm.tool_context",
+    "ProviderTool": ".llm.tool_context",
+    "StopResponse": ".llm.tool_context",
+    "ToolContext": ".llm.tool_context",
+    "ToolError": ".llm.tool_context",
+    "function_tool": ".llm.tool_context",
+    "Plugin": ".plugin",
+    "Scenario": ".simulation",
+    "ScenarioGroup": ".simulation",
+    "ScenarioUserdata": ".simulation",
+    "SimulationContext": ".simulation",
+    "SimulationDispatch": ".simulation",
+    "SimulationRun": ".simulation",
+    "SimulationVerdict": ".simulation",
+    "DEFAULT_API_CONNECT_OPTIONS": ".types",
+    "NOT_GIVEN": ".types",
+    "APIConnectOptions": ".types",
+    "FlushSentinel": ".types",
+    "NotGiven": ".types",
+    "NotGivenOr": ".types",
+    "Agent": ".voice",
+    "AgentEvent": ".voice",
+    "AgentFalseInterruptionEvent": ".voice",
+    "AgentSession": ".voice",
+    "AgentStateChangedEvent": ".voice",
+    "AgentTask": ".voice",
+    "CloseEvent": ".voice",
+    "CloseReason": ".voice",
+    "ConversationItemAddedEvent": ".voice",
+    "ErrorEvent": ".voice",
+    "FunctionToolsExecutedEvent": ".voice",
+    "MetricsCollectedEvent": ".voice",
+    "ModelSettings": ".voice",
+    "RecordingOptions": ".voice",
+    "RunContext": ".voice",
+    "SessionUsageUpdatedEvent": ".voice",
+    "SpeechCreatedEvent": ".voice",
+    "UserInputTranscribedEvent": ".voice",
+    "UserStateChangedEvent": ".voice",
+    "UserTurnExceededEvent": ".voice",
+    "avatar": ".voice",
+    "io": ".voice",
+    "room_io": ".voice",
+    "text_transforms": ".voice",
+    "AMD": ".voice.amd",
+    "AMDCategory": ".voice.amd",
+    "AMDPredictionEvent": ".voice.amd",
+    "AudioConfig": ".voice.background_audio",
+    "BackgroundAudioPlayer": ".voice.background_audio",
+    "BuiltinAudioClip": ".voice.background_audio",
+    "PlayHandle": ".voice.background_audio",
+    "RoomInputOptions": ".voice.room_io",
+    "RoomIO": ".voice.room_io",
+    "RoomOutputOptions": ".voice.room_io",
+    "AgentHandoffEvent": ".voice.run_result",
+    "ChatMessageEvent": ".voice.run_result",
+    "EventAssert": ".voice.run_result",
+    "EventRangeAssert": ".voice.run_result",
+    "FunctionCallEvent": ".voice.run_result",
+    "FunctionCallOutputEvent": ".voice.run_result",
+    "RunAssert": ".voice.run_result",
+    "RunEvent": ".voice.run_result",
+    "RunResult": ".voice.run_result",
+    "mock_tools": ".voice.run_result",
+    "EndpointingOptions": ".voice.turn",
+    "InterruptionOptions": ".voice.turn",
+    "PreemptiveGenerationOptions": ".voice.turn",
+    "TurnHandlingOptions": ".voice.turn",
+    "UserTurnLimitOptions": ".voice.turn",
+    "AgentServer": ".worker",
+    "WorkerOptions": ".worker",
+    "WorkerPermissions": ".worker",
+    "WorkerType": ".worker",
+}
 
 
 def __getattr__(name: str) -> typing.Any:
-    if name == "mcp":
+    if name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        try:
+            value = getattr(module, name)
+        except AttributeError:
+            # subpackages not imported by their parent (e.g. voice.avatar)
+            value = importlib.import_module(f"{module.__name__}.{name}")
+    elif name == "mcp":
         from .llm import mcp
 
         return mcp
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
 
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES | set(_LAZY_ATTRS))
 
 
 __all__ = [
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any, Literal
 
 from ..job import JobExecutorType
 from ..log import logger
+from ..utils import aio
 from ..voice import AgentSession, io
 from ..voice.transcription import TranscriptSynchronizer
 from ..worker import AgentServer, WorkerOptions
@@ -308,7 +309,7 @@ def _run_worker(server: AgentServer, args: proto.CliArgs) -> None:
 
     setup_logging(args.log_level, devmode=colored_logs, console=False, compact=args.simulation)
 
-    loop = asyncio.new_event_loop()
+    loop = aio.loop.new_event_loop(server._event_loop)
     asyncio.set_event_loop(loop)
 
     loop.slow_callback_duration = 0.1  # 100ms
@@ -11,7 +11,7 @@ from __future__ import annotations
 import asyncio
 import time
 from dataclasses import dataclass
-from typing import Literal, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Literal, Protocol, runtime_checkable
 
 from livekit import rtc
 
@@ -24,9 +24,12 @@ from ...types import (
     APIConnectOptions,
 )
 from ...utils import aio
-from ...voice.turn import TurnDetectionEvent
 from .languages import ThresholdOptions, TurnDetectorModels
 
+if TYPE_CHECKING:
+    # voice imports this module, TurnDetectionEvent is resolved at runtime
+    from ...voice.turn import TurnDetectionEvent
+
 DEFAULT_SAMPLE_RATE: int = 16000
 
 MIN_SILENCE_DURATION_MS = 200
@@ -194,6 +197,8 @@ class _BaseStreamingTurnDetectorStream:
 
     @staticmethod
     def _default_event(probability: float) -> TurnDetectionEvent:
+        from ...voice.turn import TurnDetectionEvent
+
         return TurnDetectionEvent(
             type="eot_prediction",
             last_speaking_time=time.time(),
@@ -274,6 +279,8 @@ class _BaseStreamingTurnDetectorStream:
         self._request_id = None
         self._request_fut = None
         if fut is not None and not fut.done():
+            from ...voice.turn import TurnDetectionEvent
+
             fut.set_result(
                 TurnDetectionEvent(
                     type="eot_prediction",
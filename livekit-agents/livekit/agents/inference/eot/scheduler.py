@@ -0,0 +1,194 @@
+"""Per-process scheduler for the local EOT model.
+
+Every ``_LocalTransport`` submits its inference requests here instead of starting its own
+thread. A newer request from a stream supersedes the one it still has queued, the number of
+concurrent native calls is capped, and the requests that are ready when a slot frees up are
+run together (in a single native call when the model exposes ``predict_batch``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import math
+import time
+import weakref
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from livekit.local_inference import EOT as _EOT
+
+__all__ = ["_EOTResult", "_EOTScheduler"]
+
+# concurrent native calls, the model already uses several threads per prediction
+_DEFAULT_MAX_CONCURRENCY = 2
+_DEFAULT_MAX_BATCH_SIZE = 8
+
+
+@dataclass
+class _EOTResult:
+    probability: float
+    queue_wait: float
+    """time the request waited in the scheduler before its native call started"""
+    inference_duration: float
+    """duration of the native call the request was part of"""
+    batch_size: int
+    """number of requests run by that native call"""
+    num_superseded: int
+    """older requests of the same stream dropped in favor of this one"""
+
+
+@dataclass
+class _EOTRequest:
+    pcm: np.ndarray
+    fut: asyncio.Future[_EOTResult | None]
+    enqueued_at: float
+    num_superseded: int
+
+
+class _EOTScheduler:
+    """Latest-wins, concurrency-capped queue in front of the local EOT model.
+
+    Requests are keyed by their stream: only the newest request of a stream is kept while it
+    waits, the future of a superseded request resolves to None.
+    """
+
+    _instances: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _EOTScheduler] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(
+        self,
+        *,
+        predict: Callable[[np.ndarray], float],
+        predict_batch: Callable[[Sequence[np.ndarray]], Sequence[float]] | None = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        max_batch_size: int = _DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        if max_concurrency < 1 or max_batch_size < 1:
+            raise ValueError("max_concurrency and max_batch_size must be at least 1")
+
+        self._predict = predict
+        self._predict_batch = predict_batch
+        self._max_concurrency = max_concurrency
+        self._max_batch_size = max_batch_size
+        self._pending: dict[Any, _EOTRequest] = {}
+        self._inflight = 0
+
+    @classmethod
+    def get(cls) -> _EOTScheduler:
+        """scheduler shared by every local transport of the running event loop"""
+        loop = asyncio.get_running_loop()
+        if (scheduler := cls._instances.get(loop)) is None:
+            eot = _EOT()
+            scheduler = cls._instances[loop] = cls(
+                predict=eot.predict, predict_batch=getattr(eot, "predict_batch", None)
+            )
+        return scheduler
+
+    @property
+    def queued(self) -> int:
+        return len(self._pending)
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    def submit(self, key: Any, pcm: np.ndarray) -> asyncio.Future[_EOTResult | None]:
+        """Queue a prediction for ``key``, replacing the request it still has queued."""
+        num_superseded = 0
+        if (prev := self._pending.pop(key, None)) is not None:
+            num_superseded = prev.num_superseded + 1
+            if not prev.fut.done():
+                prev.fut.set_result(None)
+
+        fut: asyncio.Future[_EOTResult | None] = asyncio.get_running_loop().create_future()
+        self._pending[key] = _EOTRequest(
+            pcm=pcm, fut=fut, enqueued_at=time.perf_counter(), num_superseded=num_superseded
+        )
+        self._dispatch()
+        return fut
+
+    def cancel(self, key: Any) -> None:
+        """Drop the queued request of ``key``, a native call already running is not interrupted."""
+        if (req := self._pending.pop(key, None)) is not None and not req.fut.done():
+            req.fut.set_result(None)
+
+    def _dispatch(self) -> None:
+        while self._pending and self._inflight < self._max_concurrency:
+            if self._predict_batch is not None:
+                batch_size = self._max_batch_size
+            else:
+                # without native batching a batch is a sequence of calls in one thread, spread
+                # the backlog over every slot so the ones freeing up next get their share
+                batch_size = min(
+                    math.ceil(len(self._pending) / self._max_concurrency), self._max_batch_size
+                )
+
+            batch: list[_EOTRequest] = []
+            for key in list(self._pending)[:batch_size]:
+                req = self._pending.pop(key)
+                if not req.fut.done():  # the waiter went away
+                    batch.append(req)
+
+            if not batch:
+                continue
+
+            self._inflight += 1
+            started_at = time.perf_counter()
+            exec_fut = asyncio.get_running_loop().run_in_executor(
+                None, self._predict_many, [req.pcm for req in batch]
+            )
+            exec_fut.add_done_callback(functools.partial(self._on_batch_done, batch, started_at))
+
+    def _predict_many(self, pcms: list[np.ndarray]) -> list[float]:
+        if self._predict_batch is not None and len(pcms) > 1:
+            return [float(p) for p in self._predict_batch(pcms)]
+        return [float(self._predict(pcm)) for pcm in pcms]
+
+    def _on_batch_done(
+        self, batch: list[_EOTRequest], started_at: float, exec_fut: asyncio.Future[list[float]]
+    ) -> None:
+        self._inflight -= 1
+        try:
+            self._resolve_batch(batch, started_at, exec_fut)
+        finally:
+            self._dispatch()
+
+    def _resolve_batch(
+        self, batch: list[_EOTRequest], started_at: float, exec_fut: asyncio.Future[list[float]]
+    ) -> None:
+        inference_duration = time.perf_counter() - started_at
+        if exec_fut.cancelled():  # the event loop is shutting down
+            for req in batch:
+                req.fut.cancel()
+            return
+
+        probs: list[float] = []
+        if (error := exec_fut.exception()) is None:
+            probs = exec_fut.result()
+            if len(probs) != len(batch):
+                error = RuntimeError(
+                    f"EOT batch prediction returned {len(probs)} results for {len(batch)} inputs"
+                )
+
+        if error is not None:
+            for req in batch:
+                if not req.fut.done():
+                    req.fut.set_exception(error)
+            return
+
+        for req, prob in zip(batch, probs, strict=True):
+            if not req.fut.done():
+                req.fut.set_result(
+                    _EOTResult(
+                        probability=prob,
+                        queue_wait=started_at - req.enqueued_at,
+                        inference_duration=inference_duration,
+                        batch_size=len(batch),
+                        num_superseded=req.num_superseded,
+                    )
+                )
@@ -6,14 +6,12 @@ import asyncio
 import time
 import weakref
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 import aiohttp
-import numpy as np
 from google.protobuf.timestamp_pb2 import Timestamp
 
 from livekit import rtc
-from livekit.local_inference import EOT as _EOT
 from livekit.protocol.agent_pb.agent_inference import (
     AUDIO_ENCODING_PCM_S16LE,
     ClientMessage,
@@ -47,6 +45,7 @@ from .base import (
     _BaseStreamingTurnDetectorStream,
     _StreamingTurnDetectionTransport,
 )
+from .scheduler import _EOTResult, _EOTScheduler
 
 if TYPE_CHECKING:
     from .detector import TurnDetector
@@ -70,11 +69,70 @@ class _CloudTransportOptions:
     api_key: str
     api_secret: str
     conn_options: APIConnectOptions
+    audio_packet_duration: float = 0.04
+    """duration of the audio packets sent to the server (seconds), between 40 and 100 ms"""
 
 
 _CLIENT_BUFFER_SECONDS = 1.2
 _CLIENT_BUFFER_SAMPLES = int(_CLIENT_BUFFER_SECONDS * DEFAULT_SAMPLE_RATE)
 
+_MIN_AUDIO_PACKET_DURATION = 0.04
+_MAX_AUDIO_PACKET_DURATION = 0.1
+
+
+class _AudioPacketizer:
+    """Coalesces 16-bit PCM frames into fixed-size ``InputAudio`` packets.
+
+    Frames are copied into a single reused buffer; a packet is only built once the buffer is
+    full, or when ``flush`` is called (before an inference request, so it sees all the audio).
+    """
+
+    def __init__(self, *, sample_rate: int, packet_duration: float) -> None:
+        if not _MIN_AUDIO_PACKET_DURATION <= packet_duration <= _MAX_AUDIO_PACKET_DURATION:
+            raise ValueError(
+                f"audio_packet_duration must be between {_MIN_AUDIO_PACKET_DURATION}s "
+                f"and {_MAX_AUDIO_PACKET_DURATION}s"
+            )
+
+        self._packet_size = int(sample_rate * packet_duration) * 2
+        self._buf = bytearray(self._packet_size)
+        self._view = memoryview(self._buf)
+        self._size = 0
+        self._created_at_ns = 0
+        """capture time of the oldest audio in the buffer"""
+
+    def push(self, frame: rtc.AudioFrame) -> list[InputAudio]:
+        """Add ``frame`` to the buffer, returns the packets it completed."""
+        data = memoryview(frame.data).cast("B")
+        packets: list[InputAudio] = []
+        while data:
+            if self._size == 0:
+                self._created_at_ns = time.time_ns()
+
+            n = min(len(data), self._packet_size - self._size)
+            self._view[self._size : self._size + n] = data[:n]
+            self._size += n
+            data = data[n:]
+            if self._size == self._packet_size:
+                packets.append(self._take())
+
+        return packets
+
+    def flush(self) -> InputAudio | None:
+        """Build a packet from the buffered audio, None if there is none."""
+        return self._take() if self._size > 0 else None
+
+    def _take(self) -> InputAudio:
+        created_at = Timestamp()
+        created_at.FromNanoseconds(self._created_at_ns)
+        packet = InputAudio(
+            audio=bytes(self._view[: self._size]),
+            num_samples=self._size // 2,
+            created_at=created_at,
+        )
+        self._size = 0
+        return packet
+
 
 class _CloudTransport:
     """WebSocket transport for `turn-detector-v1`."""
@@ -97,32 +155,29 @@ class _CloudTransport:
 
         self._send_ch: aio.Chan[ClientMessage] | None = None
         self._stream_ref: weakref.ref[_BaseStreamingTurnDetectorStream] | None = None
+        self._packetizer = _AudioPacketizer(
+            sample_rate=opts.sample_rate, packet_duration=cloud_opts.audio_packet_duration
+        )
 
     def attach(self, stream: _BaseStreamingTurnDetectorStream) -> None:
         self._stream_ref = weakref.ref(stream)
 
     def run_inference(self, request_id: str) -> None:
+        self._flush_audio()
         self._send_message(ClientMessage(inference_start=InferenceStart(request_id=request_id)))
 
     def push_frame(self, frame: rtc.AudioFrame) -> None:
-        pcm_bytes = bytes(frame.data)
-        if not pcm_bytes:
-            return
-        audio_created_at = Timestamp()
-        audio_created_at.GetCurrentTime()
-        self._send_message(
-            ClientMessage(
-                input_audio=InputAudio(
-                    audio=pcm_bytes,
-                    num_samples=frame.samples_per_channel,
-                    created_at=audio_created_at,
-                )
-            )
-        )
+        for packet in self._packetizer.push(frame):
+            self._send_message(ClientMessage(input_audio=packet))
 
     def flush(self) -> None:
+        self._flush_audio()
         self._send_message(ClientMessage(session_flush=SessionFlush()))
 
+    def _flush_audio(self) -> None:
+        if (packet := self._packetizer.flush()) is not None:
+            self._send_message(ClientMessage(input_audio=packet))
+
     def detach(self) -> None:
         if self._send_ch is not None:
             self._send_ch.close()
@@ -305,6 +360,7 @@ class _CloudTransport:
         async def drain_audio_task() -> None:
             nonlocal closing_ws
             await stream._drain_audio_channel()
+            self._flush_audio()
             closing_ws = True
             self._send_message(ClientMessage(session_close=SessionClose()))
             send_ch.close()
@@ -372,38 +428,76 @@ class _CloudTransport:
 
 
 class _LocalTransport:
-    """In-process ctypes transport for `turn-detector-v1-mini`."""
+    """In-process ctypes transport for `turn-detector-v1-mini`.
+
+    Predictions go through the per-process ``_EOTScheduler``, shared with every other local
+    stream, rather than a thread of their own.
+    """
 
     def __init__(self, *, opts: TurnDetectorOptions) -> None:
         self._opts = opts
         self._buf = utils.AudioArrayBuffer(
             buffer_size=_CLIENT_BUFFER_SAMPLES, sample_rate=DEFAULT_SAMPLE_RATE
         )
-        self._eot = _EOT()
+        self._scheduler = _EOTScheduler.get()
         self._stream_ref: weakref.ref[_BaseStreamingTurnDetectorStream] | None = None
-        self._tasks: set[asyncio.Task[Any]] = set()
 
     def attach(self, stream: _BaseStreamingTurnDetectorStream) -> None:
         self._stream_ref = weakref.ref(stream)
 
     def run_inference(self, request_id: str) -> None:
-        task = asyncio.create_task(self._predict(request_id, self._buf.read()))
-        self._tasks.add(task)
-        task.add_done_callback(self._tasks.discard)
+        requested_at = time.perf_counter()
+        fut = self._scheduler.submit(self, self._buf.read())
+        fut.add_done_callback(
+            lambda f: self._on_prediction(request_id, f, time.perf_counter() - requested_at)
+        )
+
+    def _on_prediction(
+        self,
+        request_id: str,
+        fut: asyncio.Future[_EOTResult | None],
+        detection_delay: float,
+    ) -> None:
+        if fut.cancelled():
+            return
 
-    async def _predict(self, request_id: str, pcm_snapshot: np.ndarray) -> None:
-        prob = 0.0
-        t0 = time.monotonic()
+        result: _EOTResult | None = None
         try:
-            prob = float(await asyncio.to_thread(self._eot.predict, pcm_snapshot))
+            result = fut.result()
         except Exception:
             logger.exception("local audio EOT prediction failed")
-        inference_duration = time.monotonic() - t0
+        else:
+            if result is None:
+                return  # superseded by a newer request of this stream
 
         stream = self._stream_ref() if self._stream_ref is not None else None
         if stream is None:
             return
-        stream._resolve_prediction(request_id, prob, inference_duration=inference_duration)
+
+        if result is None:
+            stream._resolve_prediction(request_id, 0.0)
+            return
+
+        stream._resolve_prediction(
+            request_id,
+            result.probability,
+            detection_delay=detection_delay,
+            inference_duration=result.inference_duration,
+        )
+        detector = stream._detector
+        detector.emit(
+            "metrics_collected",
+            EOTInferenceMetrics(
+                timestamp=time.time(),
+                total_duration=detection_delay,
+                prediction_duration=result.inference_duration,
+                detection_delay=detection_delay,
+                queue_wait=result.queue_wait,
+                num_superseded=result.num_superseded,
+                batch_size=result.batch_size,
+                metadata=Metadata(model_name=stream.model, model_provider=detector.provider),
+            ),
+        )
 
     def push_frame(self, frame: rtc.AudioFrame) -> None:
         self._buf.push_frame(frame)
@@ -413,9 +507,8 @@ class _LocalTransport:
             self._buf.shift(len(self._buf))
 
     def detach(self) -> None:
-        for task in list(self._tasks):
-            task.cancel()
-        self._tasks.clear()
+        self._scheduler.cancel(self)
+        self._stream_ref = None
 
     async def run(self) -> None:
         stream = self._stream_ref() if self._stream_ref is not None else None
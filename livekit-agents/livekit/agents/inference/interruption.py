@@ -83,6 +83,8 @@ class InterruptionOptions:
     """The interval between detections, defaults to 0.1 seconds"""
     inference_timeout: float
     """The timeout for the interruption detection, defaults to 1 second"""
+    incremental_upload: bool
+    """Only send the samples added since the previous request, with a reference to the window"""
     base_url: str
     api_key: str
     api_secret: str
@@ -210,6 +212,80 @@ class OverlappingSpeechEvent(BaseModel):
 _EMPTY_CACHE_ENTRY = InterruptionCacheEntry(created_at=0)
 
 
+class _SlidingAudioWindow(AudioArrayBuffer):
+    """AudioArrayBuffer that never overwrites the samples it handed out.
+
+    The window slides over a backing array twice its size, and is moved to a new array once the
+    end is reached instead of being shifted in place. A view returned by `view()` therefore stays
+    valid, and can be kept in the cache and in events without copying it.
+    """
+
+    def __init__(self, *, buffer_size: int, sample_rate: int) -> None:
+        super().__init__(buffer_size=buffer_size, dtype=np.int16, sample_rate=sample_rate)
+        self._buffer = np.zeros(2 * buffer_size, dtype=np.int16)
+        self._head = 0
+        self._offset = 0  # absolute position of self._buffer[0]
+
+    @property
+    def window_start(self) -> int:
+        """Absolute position, in samples since the creation of the window, of its first sample."""
+        return self._offset + self._head
+
+    @property
+    def window_end(self) -> int:
+        """Absolute position of the sample following the last one in the window."""
+        return self._offset + self._start_idx
+
+    def push_frame(self, frame: rtc.AudioFrame) -> int:
+        if frame.samples_per_channel > self._buffer_size:
+            raise ValueError("frame samples are greater than the buffer size")
+
+        samples = self._frame_samples(frame)
+        n = len(samples)
+        self._head = max(self._head, self._start_idx + n - self._buffer_size)
+        if self._start_idx + n > len(self._buffer):
+            buffer = np.zeros_like(self._buffer)
+            kept = self._start_idx - self._head
+            buffer[:kept] = self._buffer[self._head : self._start_idx]
+            self._buffer = buffer
+            self._offset += self._head
+            self._start_idx, self._head = kept, 0
+
+        self._buffer[self._start_idx : self._start_idx + n] = samples
+        self._start_idx += n
+        return n
+
+    def shift(self, size: int) -> None:
+        self._head = min(self._head + max(size, 0), self._start_idx)
+
+    def read(self) -> npt.NDArray[np.int16]:
+        return self._buffer[self._head : self._start_idx].copy()
+
+    def view(self) -> npt.NDArray[np.int16]:
+        """Read-only view of the window, unaffected by later pushes, shifts and resets."""
+        view = self._buffer[self._head : self._start_idx]
+        view.flags.writeable = False
+        return view
+
+    def reset(self) -> None:
+        self._head = self._start_idx
+
+    def __len__(self) -> int:
+        return self._start_idx - self._head
+
+
+@dataclass(slots=True)
+class _InferenceWindow:
+    samples: npt.NDArray[np.int16]
+    """Read-only view of the audio to run the inference on."""
+    start: int
+    """Absolute position of the first sample, see `_SlidingAudioWindow.window_start`."""
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.samples)
+
+
 # region: Sentinel classes
 class _AgentSpeechStartedSentinel:
     pass
@@ -270,6 +346,7 @@ class AdaptiveInterruptionDetector(
         audio_prefix_duration: float = AUDIO_PREFIX_DURATION,
         detection_interval: float = DETECTION_INTERVAL,
         inference_timeout: float = REMOTE_INFERENCE_TIMEOUT,
+        incremental_upload: bool = False,
         base_url: str | None = None,
         api_key: str | None = None,
         api_secret: str | None = None,
@@ -285,6 +362,7 @@ class AdaptiveInterruptionDetector(
             audio_prefix_duration (float, optional): The audio prefix duration, in seconds, for the interruption detection, defaults to 0.5s.
             detection_interval (float, optional): The interval between detections, in seconds, for the interruption detection, defaults to 0.1s.
             inference_timeout (float, optional): The timeout for the interruption detection, defaults to 1 second.
+            incremental_upload (bool, optional): Only upload the audio added since the previous request, with a reference to the window to run the inference on, instead of the whole window every detection interval. Requires server support, defaults to False.
             base_url (str, optional): The base URL for the interruption detection, defaults to the shared LIVEKIT_INFERENCE_URL environment variable.
             api_key (str, optional): The API key for the interruption detection, defaults to the LIVEKIT_INFERENCE_API_KEY environment variable.
             api_secret (str, optional): The API secret for the interruption detection, defaults to the LIVEKIT_INFERENCE_API_SECRET environment variable.
@@ -324,6 +402,7 @@ class AdaptiveInterruptionDetector(
             audio_prefix_duration=audio_prefix_duration,
             detection_interval=detection_interval,
             inference_timeout=inference_timeout,
+            incremental_upload=incremental_upload,
             base_url=lk_base_url,
             api_key=lk_api_key,
             api_secret=lk_api_secret,
@@ -343,6 +422,7 @@ class AdaptiveInterruptionDetector(
                 "min_frames": self._opts.min_frames,
                 "threshold": self._opts.threshold if is_given(self._opts.threshold) else None,
                 "inference_timeout": self._opts.inference_timeout,
+                "incremental_upload": self._opts.incremental_upload,
             },
         )
 
@@ -413,11 +493,13 @@ class InterruptionStreamBase(ABC):
         self._opts = model._opts
         self._session = model._ensure_session()
 
-        self._input_ch = aio.Chan[InterruptionDataFrameType]()
+        # unbounded, the window is rebuilt from every frame (see RecognizeStream._input_ch)
+        self._input_ch = aio.Chan[InterruptionDataFrameType](
+            overflow="block", name="interruption_input"
+        )
         self._event_ch = aio.Chan[OverlappingSpeechEvent]()
-        self._audio_buffer = AudioArrayBuffer(
+        self._audio_buffer = _SlidingAudioWindow(
             buffer_size=int(self._opts.max_audio_duration * self._opts.sample_rate),
-            dtype=np.int16,
             sample_rate=self._opts.sample_rate,
         )
         self._cache = BoundedDict[int, InterruptionCacheEntry](maxsize=10)
@@ -556,7 +638,7 @@ class InterruptionStreamBase(ABC):
             trace_types.ATTR_INTERRUPTION_DETECTION_DELAY, entry.get_detection_delay()
         )
 
-    async def _forward_data(self, output_ch: aio.Chan[npt.NDArray[np.int16]]) -> None:
+    async def _forward_data(self, output_ch: aio.Chan[_InferenceWindow]) -> None:
         """Preprocess the audio data and forward it to the output channel for inference."""
 
         async def _reset_state() -> None:
@@ -635,7 +717,12 @@ class InterruptionStreamBase(ABC):
                     samples_written = self._audio_buffer.push_frame(input_frame)
                     self._accumulated_samples += samples_written
                     if self._accumulated_samples >= self._batch_size and self._overlap_started:
-                        output_ch.send_nowait(self._audio_buffer.read())
+                        output_ch.send_nowait(
+                            _InferenceWindow(
+                                samples=self._audio_buffer.view(),
+                                start=self._audio_buffer.window_start,
+                            )
+                        )
                         self._accumulated_samples = 0
 
         output_ch.close()
@@ -692,6 +779,14 @@ class InterruptionWSSessionCreateSettings(BaseModel):
     threshold: float | None = None
     min_frames: int
     encoding: Literal["s16le"]
+    upload_mode: Literal["window", "incremental"] | None = None
+    """How the audio is uploaded, the whole window per request when not set.
+
+    In the incremental mode, each binary message starts with a `<QQQ` header (created_at,
+    window_start, chunk_start) followed by the samples from chunk_start. The server appends them
+    to the samples it already has (or starts over when chunk_start isn't where they end), and
+    runs the inference on the samples from window_start.
+    """
 
 
 class InterruptionWSSessionCreateMessage(BaseModel):
@@ -784,12 +879,14 @@ class InterruptionWebSocketStream(InterruptionStreamBase):
         closing_ws = False
 
         async def send_task(
-            ws: aiohttp.ClientWebSocketResponse, input_ch: aio.Chan[npt.NDArray[np.int16]]
+            ws: aiohttp.ClientWebSocketResponse, input_ch: aio.Chan[_InferenceWindow]
         ) -> None:
             nonlocal closing_ws
             timeout_ns = int(self._opts.inference_timeout * 1e9)
+            # absolute position of the end of the audio the server has, new connections start over
+            uploaded_until = 0
 
-            async for audio_data in input_ch:
+            async for window in input_ch:
                 now = perf_counter_ns()
                 for _key, entry in self._cache.items():
                     if entry.total_duration is not None:
@@ -805,11 +902,18 @@ class InterruptionWebSocketStream(InterruptionStreamBase):
 
                 await self._num_requests.increment()
                 created_at = perf_counter_ns()
-                header = struct.pack("<Q", created_at)  # 8 bytes
-                await ws.send_bytes(header + audio_data.tobytes())
+                if self._opts.incremental_upload:
+                    chunk_start = max(uploaded_until, window.start)
+                    header = struct.pack("<QQQ", created_at, window.start, chunk_start)  # 24 bytes
+                    audio = window.samples[chunk_start - window.start :]
+                    uploaded_until = window.end
+                else:
+                    header = struct.pack("<Q", created_at)  # 8 bytes
+                    audio = window.samples
+                await ws.send_bytes(b"".join((header, audio.data)))
                 self._cache[created_at] = InterruptionCacheEntry(
                     created_at=created_at,
-                    speech_input=audio_data,
+                    speech_input=window.samples,
                 )
 
             closing_ws = True
@@ -942,7 +1046,14 @@ class InterruptionWebSocketStream(InterruptionStreamBase):
         ws: aiohttp.ClientWebSocketResponse | None = None
 
         while True:
-            data_ch = aio.Chan[npt.NDArray[np.int16]]()
+            # a window holds all the audio of the previous ones, when the requests can't keep
+            # up only the newest one is worth sending
+            data_ch = aio.Chan[_InferenceWindow](
+                1,
+                overflow="coalesce",
+                coalesce=lambda _, newest: newest,
+                name="interruption_windows",
+            )
             try:
                 closing_ws = False
                 ws = await self._connect_ws()
@@ -992,6 +1103,7 @@ class InterruptionWebSocketStream(InterruptionStreamBase):
             threshold=self._opts.threshold if is_given(self._opts.threshold) else None,
             min_frames=self._opts.min_frames,
             encoding="s16le",
+            upload_mode="incremental" if self._opts.incremental_upload else None,
         )
 
         base_url = self._opts.base_url
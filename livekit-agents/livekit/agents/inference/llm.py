@@ -24,6 +24,7 @@ from .. import llm
 from .._exceptions import APIConnectionError, APIStatusError, APITimeoutError
 from ..llm import ToolChoice, utils as llm_utils
 from ..llm.chat_context import ChatContext
+from ..llm.llm import _TextChunk
 from ..llm.tool_context import Tool
 from ..log import logger
 from ..types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, APIConnectOptions, NotGivenOr
@@ -466,7 +467,7 @@ class LLMStream(llm.LLMStream):
 
     def _parse_choice(
         self, id: str, choice: Choice, thinking: asyncio.Event
-    ) -> llm.ChatChunk | None:
+    ) -> llm.ChatChunk | _TextChunk | None:
         delta = choice.delta
 
         # https://github.com/livekit/agents/issues/688
@@ -539,8 +540,9 @@ class LLMStream(llm.LLMStream):
         # Extract extra from delta (e.g., Google thought signatures on text parts)
         delta_extra = getattr(delta, "extra_content", None)
 
-        if not delta.content and not delta_extra:
-            return None
+        if not delta_extra:
+            # plain text, by far the most common delta
+            return _TextChunk(id, delta.content) if delta.content else None
 
         return llm.ChatChunk(
             id=id,
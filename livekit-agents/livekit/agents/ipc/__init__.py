@@ -5,7 +5,9 @@ from . import (
     job_proc_executor,
     job_thread_executor,
     proc_pool,
+    profiler,
     proto,
+    resource_sampler,
 )
 
 __all__ = [
@@ -15,7 +17,9 @@ __all__ = [
     "job_proc_executor",
     "job_thread_executor",
     "proc_pool",
+    "profiler",
     "proto",
+    "resource_sampler",
 ]
 
 # Cleanup docs of unexported modules
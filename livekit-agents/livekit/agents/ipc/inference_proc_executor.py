@@ -12,6 +12,7 @@ from ..log import logger
 from ..utils import aio, log_exceptions, shortuuid
 from . import channel, proto
 from .inference_proc_lazy_main import ProcStartArgs, proc_main
+from .resource_sampler import ResourceSampler
 from .supervised_proc import SupervisedProc, SupervisedProcKind
 
 
@@ -30,6 +31,8 @@ class InferenceProcExecutor(SupervisedProc):
         mp_ctx: BaseContext,
         loop: asyncio.AbstractEventLoop,
         http_proxy: str | None,
+        resource_sampler: ResourceSampler | None = None,
+        event_loop: aio.loop.EventLoopType = "asyncio",
     ) -> None:
         super().__init__(
             initialize_timeout=initialize_timeout,
@@ -42,9 +45,11 @@ class InferenceProcExecutor(SupervisedProc):
             mp_ctx=mp_ctx,
             loop=loop,
             http_proxy=http_proxy,
+            resource_sampler=resource_sampler,
         )
 
         self._runners = runners
+        self._event_loop = event_loop
         self._active_requests: dict[str, asyncio.Future[proto.InferenceResponse]] = {}
 
     @property
@@ -56,6 +61,7 @@ class InferenceProcExecutor(SupervisedProc):
             log_cch=log_cch,
             mp_cch=cch,
             runners=self._runners,
+            event_loop=self._event_loop,
         )
 
         return self._mp_ctx.Process(  # type: ignore
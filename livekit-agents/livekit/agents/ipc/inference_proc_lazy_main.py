@@ -34,6 +34,7 @@ class ProcStartArgs:
     log_cch: socket.socket
     mp_cch: socket.socket
     runners: _RunnersDict
+    event_loop: aio.loop.EventLoopType = "asyncio"
 
 
 def proc_main(args: ProcStartArgs) -> None:
@@ -41,7 +42,13 @@ def proc_main(args: ProcStartArgs) -> None:
 
     inf_proc = _InferenceProc(args.runners)
 
-    client = _ProcClient(args.mp_cch, args.log_cch, inf_proc.initialize, inf_proc.entrypoint)
+    client = _ProcClient(
+        args.mp_cch,
+        args.log_cch,
+        inf_proc.initialize,
+        inf_proc.entrypoint,
+        event_loop=args.event_loop,
+    )
     try:
         client.initialize()
     except Exception:
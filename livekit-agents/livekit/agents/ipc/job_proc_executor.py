@@ -16,6 +16,7 @@ from . import channel, proto
 from .inference_executor import InferenceExecutor
 from .job_executor import JobStatus
 from .job_proc_lazy_main import ProcStartArgs, proc_main
+from .resource_sampler import ResourceSampler
 from .supervised_proc import SupervisedProc, SupervisedProcKind
 
 
@@ -39,6 +40,8 @@ class ProcJobExecutor(SupervisedProc):
         http_proxy: str | None,
         mp_ctx: BaseContext,
         loop: asyncio.AbstractEventLoop,
+        resource_sampler: ResourceSampler | None = None,
+        event_loop: aio.loop.EventLoopType = "asyncio",
     ) -> None:
         super().__init__(
             initialize_timeout=initialize_timeout,
@@ -51,6 +54,7 @@ class ProcJobExecutor(SupervisedProc):
             mp_ctx=mp_ctx,
             loop=loop,
             http_proxy=http_proxy,
+            resource_sampler=resource_sampler,
         )
 
         self._user_args: Any | None = None
@@ -63,6 +67,7 @@ class ProcJobExecutor(SupervisedProc):
         self._session_end_timeout = session_end_timeout
         self._inference_executor = inference_executor
         self._inference_tasks: set[asyncio.Task[None]] = set()
+        self._event_loop = event_loop
         self._id = shortuuid("PCEXEC_")
 
     @property
@@ -111,6 +116,7 @@ class ProcJobExecutor(SupervisedProc):
             mp_cch=cch,
             user_arguments=self._user_args,
             logger_levels=levels,
+            event_loop=self._event_loop,
         )
 
         return self._mp_ctx.Process(  # type: ignore
@@ -63,6 +63,7 @@ class ProcStartArgs:
     log_cch: socket.socket
     logger_levels: dict[str, int]
     simulation_end_fnc: Callable[[Any], Any] | None = None
+    event_loop: aio.loop.EventLoopType = "asyncio"
 
 
 def proc_main(args: ProcStartArgs) -> None:
@@ -89,7 +90,13 @@ def proc_main(args: ProcStartArgs) -> None:
         simulation_end_fnc=args.simulation_end_fnc,
     )
 
-    client = _ProcClient(args.mp_cch, args.log_cch, job_proc.initialize, job_proc.entrypoint)
+    client = _ProcClient(
+        args.mp_cch,
+        args.log_cch,
+        job_proc.initialize,
+        job_proc.entrypoint,
+        event_loop=args.event_loop,
+    )
     try:
         client.initialize()
     except Exception:
@@ -4,11 +4,15 @@ import asyncio
 import contextlib
 import socket
 import sys
+import time
 from collections.abc import Callable, Coroutine
+from multiprocessing import current_process
 from types import FrameType
 
 from ..log import logger
+from ..telemetry import metrics
 from ..utils import aio, log_exceptions, time_ms
+from . import profiler
 from .channel import Message, arecv_message, asend_message, recv_message, send_message
 from .proto import (
     IPC_MESSAGES,
@@ -16,8 +20,13 @@ from .proto import (
     InitializeResponse,
     PingRequest,
     PongResponse,
+    ProfileRequest,
+    ProfileResponse,
 )
 
+# how often the event loop lag is probed (seconds)
+_LOOP_LAG_INTERVAL = 0.25
+
 
 class _ProcClient:
     def __init__(
@@ -26,11 +35,15 @@ class _ProcClient:
         log_cch: socket.socket | None,
         initialize_fnc: Callable[[InitializeRequest, _ProcClient], None],
         main_task_fnc: Callable[[aio.ChanReceiver[Message]], Coroutine[None, None, None]],
+        event_loop: aio.loop.EventLoopType = "asyncio",
     ) -> None:
         self._mp_cch = mp_cch
+        self._event_loop = event_loop
         self._initialize_fnc = initialize_fnc
         self._main_task_fnc = main_task_fnc
         self._initialized = False
+        self._max_loop_lag = 0.0
+        self._profiling = False
 
     def initialize(self) -> None:
         try:
@@ -58,7 +71,7 @@ class _ProcClient:
         if not self._initialized:
             raise RuntimeError("proc_client not initialized")
 
-        loop = asyncio.new_event_loop()
+        loop = aio.loop.new_event_loop(self._event_loop)
         asyncio.set_event_loop(loop)
         loop.set_debug(self._init_req.asyncio_debug)
         loop.slow_callback_duration = 0.1  # 100ms
@@ -88,6 +101,7 @@ class _ProcClient:
             ping_timeout = aio.sleep(self._init_req.ping_timeout + 10)
 
             ipc_ch = aio.Chan[Message]()
+            profile_tasks: set[asyncio.Task[None]] = set()
 
             @log_exceptions(logger=logger)
             async def _read_ipc_task() -> None:
@@ -101,11 +115,22 @@ class _ProcClient:
                         ping_timeout.reset()
 
                     if isinstance(msg, PingRequest):
+                        metrics._update_chan_metrics()
+                        loop_lag_ms, self._max_loop_lag = self._max_loop_lag * 1000, 0.0
                         await asend_message(
                             self._acch,
-                            PongResponse(last_timestamp=msg.timestamp, timestamp=time_ms()),
+                            PongResponse(
+                                last_timestamp=msg.timestamp,
+                                timestamp=time_ms(),
+                                loop_lag_ms=loop_lag_ms,
+                            ),
                         )
 
+                    if isinstance(msg, ProfileRequest):
+                        task = asyncio.create_task(self._profile_task(msg), name="profile")
+                        profile_tasks.add(task)
+                        task.add_done_callback(profile_tasks.discard)
+
                     ipc_ch.send_nowait(msg)
 
             @log_exceptions(logger=logger)
@@ -116,7 +141,17 @@ class _ProcClient:
                     file=sys.stderr,
                 )
 
+            @log_exceptions(logger=logger)
+            async def _loop_lag_task() -> None:
+                # the lag is reported to the worker with each pong (see ResourceSampler)
+                while True:
+                    start = time.perf_counter()
+                    await asyncio.sleep(_LOOP_LAG_INTERVAL)
+                    lag = time.perf_counter() - start - _LOOP_LAG_INTERVAL
+                    self._max_loop_lag = max(self._max_loop_lag, lag)
+
             read_task = asyncio.create_task(_read_ipc_task(), name="ipc_read")
+            loop_lag_task = asyncio.create_task(_loop_lag_task(), name="loop_lag_monitor")
             health_check_task: asyncio.Task[None] | None = None
             if self._init_req.ping_interval > 0:
                 health_check_task = asyncio.create_task(_self_health_check(), name="health_check")
@@ -137,13 +172,42 @@ class _ProcClient:
             main_task.add_done_callback(_done_cb)
 
             await exit_flag.wait()
-            await aio.cancel_and_wait(read_task, main_task)
+            await aio.cancel_and_wait(read_task, main_task, loop_lag_task, *profile_tasks)
             if health_check_task is not None:
                 await aio.cancel_and_wait(health_check_task)
 
         finally:
             await self._acch.aclose()
 
+    @log_exceptions(logger=logger)
+    async def _profile_task(self, req: ProfileRequest) -> None:
+        if self._profiling:
+            await self.send(
+                ProfileResponse(request_id=req.request_id, error="a profile is already running")
+            )
+            return
+
+        self._profiling = True
+        try:
+            logger.info(
+                "profiling process",
+                extra={"duration": req.duration, "interval": req.interval, "format": req.format},
+            )
+            data = await profiler.profile(
+                req.duration,
+                interval=req.interval or profiler.DEFAULT_INTERVAL,
+                format=req.format,  # type: ignore[arg-type]
+                name=f"{current_process().name} (pid {current_process().pid})",
+            )
+            resp = ProfileResponse(request_id=req.request_id, data=data)
+        except Exception as e:
+            logger.exception("failed to profile the process")
+            resp = ProfileResponse(request_id=req.request_id, error=str(e))
+        finally:
+            self._profiling = False
+
+        await self.send(resp)
+
 
 def _dump_stack_traces_impl() -> None:
     """Implementation of stack trace dumping (callable directly or from signal handler)."""
@@ -13,6 +13,7 @@ from ..utils import aio
 from ..utils.hw.cpu import get_cpu_monitor
 from . import inference_executor, job_proc_executor, job_thread_executor
 from .job_executor import JobExecutor
+from .resource_sampler import ResourceSampler
 
 EventTypes = Literal[
     "process_created",
@@ -44,6 +45,8 @@ class ProcPool(utils.EventEmitter[EventTypes]):
         memory_limit_mb: float,
         http_proxy: str | None,
         loop: asyncio.AbstractEventLoop,
+        resource_sampler: ResourceSampler | None = None,
+        event_loop: aio.loop.EventLoopType = "asyncio",
     ) -> None:
         super().__init__()
         self._job_executor_type = job_executor_type
@@ -61,6 +64,8 @@ class ProcPool(utils.EventEmitter[EventTypes]):
         self._memory_warn_mb = memory_warn_mb
         self._default_num_idle_processes = num_idle_processes
         self._http_proxy = http_proxy
+        self._resource_sampler = resource_sampler
+        self._event_loop = event_loop
         self._target_idle_processes = num_idle_processes
 
         self._init_sem = asyncio.Semaphore(MAX_CONCURRENT_INITIALIZATIONS)
@@ -234,6 +239,8 @@ class ProcPool(utils.EventEmitter[EventTypes]):
                 memory_warn_mb=self._memory_warn_mb,
                 memory_limit_mb=self._memory_limit_mb,
                 http_proxy=self._http_proxy,
+                resource_sampler=self._resource_sampler,
+                event_loop=self._event_loop,
             )
         else:
             raise ValueError(f"unsupported job executor: {self._job_executor_type}")
@@ -0,0 +1,231 @@
+"""Sampling profiler used to profile a running job or inference process on demand.
+
+A background thread captures the stack of every thread of the process at a fixed interval.
+Samples taken on the event loop thread are attributed to the asyncio task that was running at
+that time (e.g. ``AgentActivity.tts_say``), whose name becomes the root frame of the stack.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from types import CodeType, FrameType
+from typing import Any, Literal
+
+ProfileFormat = Literal["folded", "speedscope"]
+
+PROFILE_FORMATS: tuple[ProfileFormat, ...] = ("folded", "speedscope")
+
+DEFAULT_INTERVAL = 0.01
+# deeper stacks are truncated at their outermost frames
+_MAX_STACK_DEPTH = 256
+_LOOP_IDLE_FRAME = "(event loop)"
+# GIL switch interval while profiling. The sampler thread needs the GIL to capture the stacks,
+# with the default 5ms it mostly gets it when the event loop blocks on I/O, so short CPU bursts
+# of the loop would be missing from the profile.
+_SWITCH_INTERVAL = 0.0005
+
+
+class _SamplingProfiler:
+    """Samples the stacks of the process from a background thread.
+
+    Must be created on the thread running ``loop``.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, *, interval: float = DEFAULT_INTERVAL
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._interval = interval
+
+        # frames are (name, file, line), stacks are stored as indices into self._frames
+        self._frames: list[tuple[str, str, int]] = []
+        self._frame_ids: dict[CodeType | str, int] = {}
+        # (thread name, stack from the root) -> [number of samples, seconds]
+        self._stacks: dict[tuple[str, tuple[int, ...]], list[Any]] = {}
+        self._thread_names: dict[int, str] = {}
+        self._num_samples = 0
+
+        self._stop_ev = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._prev_switch_interval: float | None = None
+
+    @property
+    def num_samples(self) -> int:
+        return self._num_samples
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("profiler already started")
+
+        self._prev_switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._prev_switch_interval, _SWITCH_INTERVAL))
+        self._thread = threading.Thread(target=self._run, name="lk_sampling_profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_ev.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._prev_switch_interval is not None:
+            sys.setswitchinterval(self._prev_switch_interval)
+            self._prev_switch_interval = None
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop_ev.wait(self._interval):
+            now = time.perf_counter()
+            self.sample(weight=now - last)
+            last = now
+
+    def sample(self, *, weight: float) -> None:
+        """Record the current stack of every other thread, ``weight`` is the elapsed time the
+        sample stands for."""
+        # read the running task before the frames, the loop may switch tasks in between
+        task = asyncio.current_task(self._loop) if self._loop.is_running() else None
+        current_frames = sys._current_frames()
+        own_id = threading.get_ident()
+
+        for thread_id, frame in current_frames.items():
+            if thread_id == own_id:
+                continue
+
+            if thread_id == self._loop_thread_id:
+                thread_name = "event loop"
+                root = f"task:{task.get_name()}" if task is not None else _LOOP_IDLE_FRAME
+            else:
+                thread_name = self._thread_name(thread_id)
+                root = f"thread:{thread_name}"
+
+            stack = self._walk(frame)
+            stack.append(self._label_id(root))
+            stack.reverse()
+
+            key = (thread_name, tuple(stack))
+            if (entry := self._stacks.get(key)) is None:
+                self._stacks[key] = [1, weight]
+            else:
+                entry[0] += 1
+                entry[1] += weight
+
+        self._num_samples += 1
+
+    def _walk(self, frame: FrameType | None) -> list[int]:
+        stack: list[int] = []
+        while frame is not None and len(stack) < _MAX_STACK_DEPTH:
+            code = frame.f_code
+            if (frame_id := self._frame_ids.get(code)) is None:
+                name = getattr(code, "co_qualname", code.co_name)
+                frame_id = self._frame_ids[code] = len(self._frames)
+                self._frames.append((name, code.co_filename, code.co_firstlineno))
+
+            stack.append(frame_id)
+            frame = frame.f_back
+        return stack
+
+    def _label_id(self, label: str) -> int:
+        if (frame_id := self._frame_ids.get(label)) is None:
+            frame_id = self._frame_ids[label] = len(self._frames)
+            self._frames.append((label, "", 0))
+        return frame_id
+
+    def _thread_name(self, thread_id: int) -> str:
+        if (name := self._thread_names.get(thread_id)) is None:
+            self._thread_names = {t.ident: t.name for t in threading.enumerate() if t.ident}
+            name = self._thread_names.setdefault(thread_id, f"thread-{thread_id}")
+        return name
+
+    def _frame_label(self, frame_id: int) -> str:
+        name, file, line = self._frames[frame_id]
+        label = f"{name} ({os.path.basename(file)}:{line})" if file else name
+        # ";" separates the frames of a folded stack
+        return label.replace(";", ":")
+
+    def to_folded(self) -> str:
+        """Stacks in the folded format (one ``frame;frame;frame count`` line per stack), as used
+        by flamegraph.pl, inferno and speedscope"""
+        lines = [
+            ";".join(self._frame_label(frame_id) for frame_id in stack) + f" {count}"
+            for (_, stack), (count, _) in self._stacks.items()
+        ]
+        lines.sort()
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def to_speedscope(self, *, name: str) -> dict[str, Any]:
+        """Profile in the speedscope file format, with one sampled profile per thread"""
+        by_thread: dict[str, tuple[list[list[int]], list[float]]] = {}
+        for (thread_name, stack), (_, seconds) in self._stacks.items():
+            samples, weights = by_thread.setdefault(thread_name, ([], []))
+            samples.append(list(stack))
+            weights.append(seconds)
+
+        # the event loop first, it's what speedscope opens by default
+        thread_names = sorted(by_thread, key=lambda n: (n != "event loop", n))
+        profiles = []
+        for thread_name in thread_names:
+            samples, weights = by_thread[thread_name]
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            )
+
+        frames = []
+        for frame_name, file, line in self._frames:
+            frame: dict[str, Any] = {"name": frame_name}
+            if file:
+                frame["file"] = file
+                frame["line"] = line
+            frames.append(frame)
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "livekit-agents",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def export(self, format: ProfileFormat, *, name: str) -> bytes:
+        if format == "folded":
+            return self.to_folded().encode("utf-8")
+        if format == "speedscope":
+            return json.dumps(self.to_speedscope(name=name), separators=(",", ":")).encode("utf-8")
+        raise ValueError(f"unknown profile format: {format}")
+
+
+async def profile(
+    duration: float,
+    *,
+    interval: float = DEFAULT_INTERVAL,
+    format: ProfileFormat = "speedscope",
+    name: str = "",
+) -> bytes:
+    """Sample the current process for ``duration`` seconds and return the exported profile"""
+    if format not in PROFILE_FORMATS:
+        raise ValueError(f"unknown profile format: {format}")
+
+    profiler = _SamplingProfiler(asyncio.get_running_loop(), interval=interval)
+    profiler.start()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        # the sampler thread wakes up at least every interval, so this doesn't block for long
+        profiler.stop()
+
+    return profiler.export(format, name=name or f"pid {os.getpid()}")
@@ -73,14 +73,17 @@ class PongResponse:
     MSG_ID: ClassVar[int] = 3
     last_timestamp: int = 0
     timestamp: int = 0
+    loop_lag_ms: float = 0  # worst event loop lag observed since the previous pong
 
     def write(self, b: io.BytesIO) -> None:
         channel.write_long(b, self.last_timestamp)
         channel.write_long(b, self.timestamp)
+        channel.write_float(b, self.loop_lag_ms)
 
     def read(self, b: io.BytesIO) -> None:
         self.last_timestamp = channel.read_long(b)
         self.timestamp = channel.read_long(b)
+        self.loop_lag_ms = channel.read_float(b)
 
 
 @dataclass
@@ -227,6 +230,49 @@ class ShuttingDown:
         pass
 
 
+@dataclass
+class ProfileRequest:
+    """sent by the main process to sample the stacks of the subprocess for `duration` seconds"""
+
+    MSG_ID: ClassVar[int] = 12
+    request_id: str = ""
+    duration: float = 0
+    interval: float = 0
+    format: str = ""  # see profiler.ProfileFormat
+
+    def write(self, b: io.BytesIO) -> None:
+        channel.write_string(b, self.request_id)
+        channel.write_float(b, self.duration)
+        channel.write_float(b, self.interval)
+        channel.write_string(b, self.format)
+
+    def read(self, b: io.BytesIO) -> None:
+        self.request_id = channel.read_string(b)
+        self.duration = channel.read_float(b)
+        self.interval = channel.read_float(b)
+        self.format = channel.read_string(b)
+
+
+@dataclass
+class ProfileResponse:
+    """response to a ProfileRequest, contains the exported profile"""
+
+    MSG_ID: ClassVar[int] = 13
+    request_id: str = ""
+    data: bytes = b""
+    error: str = ""
+
+    def write(self, b: io.BytesIO) -> None:
+        channel.write_string(b, self.request_id)
+        channel.write_bytes(b, self.data)
+        channel.write_string(b, self.error)
+
+    def read(self, b: io.BytesIO) -> None:
+        self.request_id = channel.read_string(b)
+        self.data = channel.read_bytes(b)
+        self.error = channel.read_string(b)
+
+
 IPC_MESSAGES = {
     InitializeRequest.MSG_ID: InitializeRequest,
     InitializeResponse.MSG_ID: InitializeResponse,
@@ -240,4 +286,6 @@ IPC_MESSAGES = {
     DumpStackTraceRequest.MSG_ID: DumpStackTraceRequest,
     ShutdownRequestAck.MSG_ID: ShutdownRequestAck,
     ShuttingDown.MSG_ID: ShuttingDown,
+    ProfileRequest.MSG_ID: ProfileRequest,
+    ProfileResponse.MSG_ID: ProfileResponse,
 }
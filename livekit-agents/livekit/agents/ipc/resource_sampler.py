@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import psutil
+
+from ..log import logger
+from ..telemetry import metrics
+from ..utils import aio, log_exceptions
+
+if TYPE_CHECKING:
+    from .supervised_proc import SupervisedProc
+
+# how often the sampler reads the resource usage of every supervised process (seconds)
+_SAMPLE_INTERVAL = 5.0
+
+
+@dataclass
+class ProcResourceUsage:
+    """Resource usage of a single supervised process, as seen by the last sample."""
+
+    pid: int
+    process_kind: str
+    job_id: str | None
+    """id of the job running inside the process, None for idle and inference processes"""
+    cpu_seconds: float
+    """cumulative user + system CPU time consumed by the process"""
+    cpu_percent: float
+    """CPU usage since the previous sample, as a fraction of one core"""
+    rss_mb: float
+    uss_mb: float | None
+    """memory unique to the process, None when the platform doesn't expose it"""
+    pss_mb: float | None
+    """RSS where shared pages are divided between the processes mapping them (Linux only)"""
+    loop_lag_ms: float
+    """worst event loop lag reported by the process since its previous pong"""
+    timestamp: float
+
+    @property
+    def memory_mb(self) -> float:
+        """Memory attributed to this process.
+
+        Prefers PSS then USS: RSS counts the pages shared with the forkserver (preloaded
+        plugins, models) in every child, which overstates the cost of each job.
+        """
+        if self.pss_mb is not None:
+            return self.pss_mb
+        if self.uss_mb is not None:
+            return self.uss_mb
+        return self.rss_mb
+
+
+@dataclass
+class _RawSample:
+    cpu_seconds: float
+    rss_mb: float
+    uss_mb: float | None
+    pss_mb: float | None
+
+
+class ResourceSampler:
+    """Samples CPU and memory of every supervised process of the worker in a single pass.
+
+    Replaces per-process polling: one task reads all registered children on a timer (off the
+    event loop), hands each process its sample so it can enforce its memory limits, and
+    publishes the per-process usage to prometheus.
+    """
+
+    def __init__(
+        self, *, loop: asyncio.AbstractEventLoop, interval: float = _SAMPLE_INTERVAL
+    ) -> None:
+        self._loop = loop
+        self._interval = interval
+        self._procs: dict[int, SupervisedProc] = {}
+        self._ps_procs: dict[int, psutil.Process] = {}
+        self._usage: dict[int, ProcResourceUsage] = {}
+        self._main_atask: asyncio.Task[None] | None = None
+
+    @property
+    def usage(self) -> list[ProcResourceUsage]:
+        """latest sample of every registered process"""
+        return list(self._usage.values())
+
+    def get_usage(self, pid: int) -> ProcResourceUsage | None:
+        return self._usage.get(pid)
+
+    def start(self) -> None:
+        if self._main_atask is not None:
+            return
+
+        self._main_atask = self._loop.create_task(self._main_task(), name="resource_sampler")
+
+    async def aclose(self) -> None:
+        if self._main_atask is not None:
+            await aio.cancel_and_wait(self._main_atask)
+            self._main_atask = None
+
+    def add(self, proc: SupervisedProc) -> None:
+        if proc.pid is None:
+            raise RuntimeError("process not started")
+
+        self._procs[proc.pid] = proc
+
+    def remove(self, proc: SupervisedProc) -> None:
+        if proc.pid is None:
+            return
+
+        self._procs.pop(proc.pid, None)
+        self._ps_procs.pop(proc.pid, None)
+        if (usage := self._usage.pop(proc.pid, None)) is not None:
+            metrics._remove_proc_resources(usage)
+
+    def _read_samples(self, pids: list[int]) -> dict[int, _RawSample]:
+        """Read every process in one pass, runs inside an executor."""
+        samples: dict[int, _RawSample] = {}
+        for pid in pids:
+            try:
+                # psutil.Process objects are cached so the pid is checked against its
+                # creation time (protects against pid reuse)
+                ps_proc = self._ps_procs.get(pid)
+                if ps_proc is None:
+                    ps_proc = self._ps_procs[pid] = psutil.Process(pid)
+
+                uss: float | None = None
+                pss: float | None = None
+                with ps_proc.oneshot():
+                    cpu_times = ps_proc.cpu_times()
+                    try:
+                        full_mem = ps_proc.memory_full_info()
+                        rss = full_mem.rss
+                        uss = getattr(full_mem, "uss", None)
+                        pss = getattr(full_mem, "pss", None)  # linux only
+                    except psutil.AccessDenied:
+                        rss = ps_proc.memory_info().rss
+
+                to_mb = 1.0 / (1024 * 1024)
+                samples[pid] = _RawSample(
+                    cpu_seconds=cpu_times.user + cpu_times.system,
+                    rss_mb=rss * to_mb,
+                    uss_mb=uss * to_mb if uss is not None else None,
+                    pss_mb=pss * to_mb if pss is not None else None,
+                )
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                # the process exited between two samples, remove() will clean it up
+                self._ps_procs.pop(pid, None)
+            except psutil.AccessDenied as e:
+                logger.warning("failed to sample process resources: %s", e, extra={"pid": pid})
+
+        return samples
+
+    async def sample(self) -> list[ProcResourceUsage]:
+        """Sample all registered processes now and dispatch the results."""
+        procs = dict(self._procs)
+        if not procs:
+            return []
+
+        raw_samples = await self._loop.run_in_executor(None, self._read_samples, list(procs))
+        now = time.monotonic()
+
+        samples: list[ProcResourceUsage] = []
+        for pid, raw in raw_samples.items():
+            proc = procs[pid]
+            if self._procs.get(pid) is not proc:
+                continue  # removed while sampling
+
+            cpu_percent = 0.0
+            if (prev := self._usage.get(pid)) is not None and now > prev.timestamp:
+                cpu_delta = max(raw.cpu_seconds - prev.cpu_seconds, 0.0)
+                cpu_percent = cpu_delta / (now - prev.timestamp)
+
+            running_job = getattr(proc, "_running_job", None)
+            usage = ProcResourceUsage(
+                pid=pid,
+                process_kind=str(proc.process_kind),
+                job_id=running_job.job.id if running_job is not None else None,
+                cpu_seconds=raw.cpu_seconds,
+                cpu_percent=cpu_percent,
+                rss_mb=raw.rss_mb,
+                uss_mb=raw.uss_mb,
+                pss_mb=raw.pss_mb,
+                loop_lag_ms=proc.loop_lag_ms,
+                timestamp=now,
+            )
+
+            if prev is not None and prev.job_id != usage.job_id:
+                # the job label changed (job launched on a warm process), drop the old series
+                metrics._remove_proc_resources(prev)
+
+            self._usage[pid] = usage
+            metrics._update_proc_resources(usage)
+            samples.append(usage)
+
+        for usage in samples:
+            await procs[usage.pid]._on_resource_usage(usage)
+
+        return samples
+
+    @log_exceptions(logger=logger)
+    async def _main_task(self) -> None:
+        interval = aio.interval(self._interval)
+        while True:
+            await interval.tick()
+            try:
+                await self.sample()
+            except Exception:
+                logger.exception("error while sampling process resources")
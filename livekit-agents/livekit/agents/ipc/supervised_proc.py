@@ -16,22 +16,22 @@ from dataclasses import dataclass
 from enum import Enum
 from multiprocessing.context import BaseContext
 from types import FrameType
-from typing import Any
-
-import psutil
+from typing import TYPE_CHECKING, Any
 
 from ..log import logger
 from ..telemetry import metrics
-from ..utils import aio, log_exceptions, time_ms
+from ..utils import aio, log_exceptions, shortuuid, time_ms
 from ..utils.aio import duplex_unix
 from . import channel, proto
 from .log_queue import LogQueueListener
+from .profiler import DEFAULT_INTERVAL as _DEFAULT_PROFILE_INTERVAL, ProfileFormat
+
+if TYPE_CHECKING:
+    from .resource_sampler import ProcResourceUsage, ResourceSampler
 
 _mask_ctrl_c_refcount = 0
 _mask_ctrl_c_original: Callable[[int, FrameType | None], Any] | int | None = signal.SIG_DFL
 
-# how often the memory monitor samples the process RSS (seconds)
-_MEMORY_MONITOR_INTERVAL = 5.0
 # minimum delay between two "high memory usage" warnings for the same process, so a
 # process that sits above the threshold doesn't emit a warning on every sample
 _MEMORY_WARN_COOLDOWN = 120.0
@@ -105,9 +105,11 @@ class SupervisedProc(ABC):
         http_proxy: str | None,
         mp_ctx: BaseContext,
         loop: asyncio.AbstractEventLoop,
+        resource_sampler: ResourceSampler | None = None,
     ) -> None:
         self._loop = loop
         self._mp_ctx = mp_ctx
+        self._resource_sampler = resource_sampler
         self._opts = _ProcOpts(
             initialize_timeout=initialize_timeout,
             close_timeout=close_timeout,
@@ -123,10 +125,12 @@ class SupervisedProc(ABC):
         self._pid: int | None = None
         self._spawn_time: float | None = None
 
-        # memory monitoring state (see _memory_monitor_task)
+        # memory monitoring state (see _on_resource_usage)
         self._memory_baseline_mb: float | None = None
         self._last_memory_warn_time: float = 0.0
         self._last_memory_warn_mb: float = 0.0
+        # worst event loop lag reported by the process in its last pong
+        self._loop_lag_ms: float = 0.0
 
         self._start_atask: asyncio.Task[None] | None = None
         self._supervise_atask: asyncio.Task[None] | None = None
@@ -136,6 +140,7 @@ class SupervisedProc(ABC):
         self._lock = asyncio.Lock()
         self._shutdown_ack_fut = asyncio.Future[None]()
         self._shutting_down_fut = asyncio.Future[None]()
+        self._profile_requests: dict[str, asyncio.Future[proto.ProfileResponse]] = {}
 
     @abstractmethod
     def _create_process(self, cch: socket.socket, log_cch: socket.socket) -> mp.Process: ...
@@ -159,6 +164,11 @@ class SupervisedProc(ABC):
     def pid(self) -> int | None:
         return self._pid
 
+    @property
+    def loop_lag_ms(self) -> float:
+        """worst event loop lag of the process since the previous ping, in milliseconds"""
+        return self._loop_lag_ms
+
     @property
     def started(self) -> bool:
         return self._supervise_atask is not None
@@ -371,6 +381,41 @@ class SupervisedProc(ABC):
             if self._supervise_atask:
                 await asyncio.shield(self._supervise_atask)
 
+    async def profile(
+        self,
+        duration: float,
+        *,
+        interval: float = _DEFAULT_PROFILE_INTERVAL,
+        format: ProfileFormat = "speedscope",
+    ) -> bytes:
+        """Run a sampling profiler inside the process for ``duration`` seconds.
+
+        Returns the profile exported in ``format``, the samples of the event loop are grouped
+        by the asyncio task that was running.
+        """
+        if not self.started:
+            raise RuntimeError("process not started")
+
+        request_id = shortuuid("profile_req_")
+        fut = asyncio.Future[proto.ProfileResponse]()
+        self._profile_requests[request_id] = fut
+        try:
+            await channel.asend_message(
+                self._pch,
+                proto.ProfileRequest(
+                    request_id=request_id, duration=duration, interval=interval, format=format
+                ),
+            )
+            # a healthy process answers within a ping timeout of the end of the profile
+            resp = await asyncio.wait_for(fut, duration + self._opts.ping_timeout)
+        finally:
+            self._profile_requests.pop(request_id, None)
+
+        if resp.error:
+            raise RuntimeError(f"profiling failed: {resp.error}")
+
+        return resp.data
+
     async def _send_dump_signal(self) -> None:
         if not self.enabled_stack_trace_dump:
             return
@@ -448,21 +493,25 @@ class SupervisedProc(ABC):
                 self._shutdown_ack_fut.set_result(None)
             if not self._shutting_down_fut.done():
                 self._shutting_down_fut.set_result(None)
+            for fut in self._profile_requests.values():
+                if not fut.done():
+                    fut.set_exception(RuntimeError("process exited while profiling"))
 
         read_ipc_task.add_done_callback(_on_read_ipc_done)
 
-        memory_monitor_task: asyncio.Task[None] | None = None
-        if self._opts.memory_limit_mb > 0 or self._opts.memory_warn_mb > 0:
-            memory_monitor_task = asyncio.create_task(self._memory_monitor_task())
+        if self._resource_sampler is not None:
+            self._resource_sampler.add(self)
+
+        try:
+            await self._join_fut
+        finally:
+            if self._resource_sampler is not None:
+                self._resource_sampler.remove(self)
 
-        await self._join_fut
         self._exitcode = self._proc.exitcode
         self._proc.close()
         await aio.cancel_and_wait(ping_task, read_ipc_task, main_task)
 
-        if memory_monitor_task is not None:
-            await aio.cancel_and_wait(memory_monitor_task)
-
         with contextlib.suppress(duplex_unix.DuplexClosed):
             await self._pch.aclose()
 
@@ -483,6 +532,7 @@ class SupervisedProc(ABC):
                 break
 
             if isinstance(msg, proto.PongResponse):
+                self._loop_lag_ms = msg.loop_lag_ms
                 delay = time_ms() - msg.timestamp
                 if delay > self._opts.high_ping_threshold * 1000:
                     logger.warning(
@@ -501,6 +551,11 @@ class SupervisedProc(ABC):
                 if not self._shutting_down_fut.done():
                     self._shutting_down_fut.set_result(None)
 
+            if isinstance(msg, proto.ProfileResponse):
+                fut = self._profile_requests.get(msg.request_id)
+                if fut is not None and not fut.done():
+                    fut.set_result(msg)
+
             if isinstance(msg, proto.Exiting):
                 logger.info(
                     "process exiting",
@@ -564,72 +619,42 @@ class SupervisedProc(ABC):
         extra.update(self.logging_extra())
         return extra
 
-    @log_exceptions(logger=logger)
-    async def _memory_monitor_task(self) -> None:
-        """Monitor memory usage and kill the process if it exceeds the limit."""
-        while not self._closing and not self._kill_sent:
-            try:
-                if not self._pid:
-                    await asyncio.sleep(_MEMORY_MONITOR_INTERVAL)
-                    continue
-
-                # get process memory info
-                process = psutil.Process(self._pid)
-                memory_info = process.memory_info()
-                memory_mb = memory_info.rss / (1024 * 1024)  # Convert to MB
-
-                # the first sample (taken shortly after initialization) is treated as the
-                # post-prewarm baseline, so later samples can report growth since startup
-                if self._memory_baseline_mb is None:
-                    self._memory_baseline_mb = memory_mb
-
-                if self._opts.memory_limit_mb > 0 and memory_mb > self._opts.memory_limit_mb:
-                    logger.error(
-                        f"{self.process_kind} process exceeded memory limit, killing it",
-                        extra=self._memory_logging_extra(memory_mb),
-                    )
-                    await self._send_dump_signal()
-                    await self._send_kill_signal()
-                elif self._opts.memory_warn_mb > 0 and memory_mb > self._opts.memory_warn_mb:
-                    # rate-limit the warning: a process that lingers above the threshold
-                    # would otherwise emit a warning on every sample (every few seconds).
-                    # still re-emit early if usage jumped noticeably since the last warning.
-                    if self._should_emit_memory_warning(memory_mb, now=time.monotonic()):
-                        # when no hard limit is configured the warning is purely advisory:
-                        # nothing is terminated, so say so to avoid alarming operators.
-                        advisory = self._opts.memory_limit_mb <= 0
-                        logger.warning(
-                            f"{self.process_kind} process memory usage is above the"
-                            " warning threshold"
-                            + (
-                                " (advisory only, the process will not be terminated)"
-                                if advisory
-                                else ""
-                            ),
-                            extra=self._memory_logging_extra(memory_mb),
-                        )
-
-            except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                if self._closing or self._kill_sent:
-                    return
+    async def _on_resource_usage(self, usage: ProcResourceUsage) -> None:
+        """Called by the ResourceSampler with each new sample of this process.
 
-                logger.warning(
-                    "failed to get memory info for process: %s",
-                    e,
-                    extra=self.logging_extra(),
-                )
-                # don't bother rechecking if we cannot get process info
-                return
-            except Exception:
-                if self._closing or self._kill_sent:
-                    return
+        Kills the process if it exceeds the memory limit, or logs a warning above the
+        warning threshold."""
+        if self._closing or self._kill_sent:
+            return
 
-                logger.exception(
-                    "Error in memory monitoring task",
-                    extra=self.logging_extra(),
-                )
+        memory_mb = usage.memory_mb
+
+        # the first sample (taken shortly after initialization) is treated as the
+        # post-prewarm baseline, so later samples can report growth since startup
+        if self._memory_baseline_mb is None:
+            self._memory_baseline_mb = memory_mb
 
-            await asyncio.sleep(_MEMORY_MONITOR_INTERVAL)
+        if self._opts.memory_limit_mb > 0 and memory_mb > self._opts.memory_limit_mb:
+            logger.error(
+                f"{self.process_kind} process exceeded memory limit, killing it",
+                extra=self._memory_logging_extra(memory_mb),
+            )
+            await self._send_dump_signal()
+            await self._send_kill_signal()
+        elif self._opts.memory_warn_mb > 0 and memory_mb > self._opts.memory_warn_mb:
+            # rate-limit the warning: a process that lingers above the threshold
+            # would otherwise emit a warning on every sample (every few seconds).
+            # still re-emit early if usage jumped noticeably since the last warning.
+            if self._should_emit_memory_warning(memory_mb, now=time.monotonic()):
+                # when no hard limit is configured the warning is purely advisory:
+                # nothing is terminated, so say so to avoid alarming operators.
+                advisory = self._opts.memory_limit_mb <= 0
+                logger.warning(
+                    f"{self.process_kind} process memory usage is above the"
+                    " warning threshold"
+                    + (" (advisory only, the process will not be terminated)" if advisory else ""),
+                    extra=self._memory_logging_extra(memory_mb),
+                )
 
     def logging_extra(self) -> dict[str, Any]:
         extra: dict[str, Any] = {
@@ -30,6 +30,7 @@ from .realtime import (
     InputSpeechStoppedEvent,
     InputTranscriptionCompleted,
     MessageGeneration,
+    RealtimeAudioInput,
     RealtimeCapabilities,
     RealtimeError,
     RealtimeModel,
@@ -101,6 +102,7 @@ __all__ = [
     "RealtimeModelError",
     "RealtimeCapabilities",
     "RealtimeSession",
+    "RealtimeAudioInput",
     "InputTranscriptionCompleted",
     "InputSpeechStartedEvent",
     "InputSpeechStoppedEvent",
@@ -3,15 +3,18 @@ from __future__ import annotations
 import asyncio
 import dataclasses
 import time
-from collections.abc import AsyncIterable
+from collections.abc import AsyncGenerator, AsyncIterable, Callable
 from dataclasses import dataclass
 from typing import Any, ClassVar, Literal
 
 from .._exceptions import APIConnectionError, APIError
 from ..log import logger
+from ..telemetry import metrics
 from ..types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, APIConnectOptions, NotGivenOr
+from ..utils import hedging
+from ..utils.hedging import HedgeTracker
 from .chat_context import ChatContext
-from .llm import LLM, ChatChunk, LLMStream
+from .llm import LLM, ChatChunk, LLMStream, _TextChunk
 from .tool_context import Tool, ToolChoice
 
 DEFAULT_FALLBACK_API_CONNECT_OPTIONS = APIConnectOptions(
@@ -47,6 +50,7 @@ class FallbackAdapter(
         max_retry_per_llm: int = 0,
         retry_interval: float = 0.5,
         retry_on_chunk_sent: bool = False,
+        hedge_delay: float | Literal["auto"] | None = None,
     ) -> None:
         """FallbackAdapter is an LLM that can fallback to a different LLM if the current LLM fails.
 
@@ -58,6 +62,11 @@ class FallbackAdapter(
             retry_interval (float, optional): Interval between retries. Defaults to 0.5.
             retry_on_chunk_sent (bool, optional): Whether to retry when a LLM failed after chunks
                 are sent. Defaults to False.
+            hedge_delay (float | Literal["auto"] | None, optional): When set, if the current LLM
+                hasn't streamed its first chunk after this many seconds, the next LLM is started
+                in parallel and the first one to stream wins, the other is cancelled. "auto" uses
+                the rolling p95 time to first token of the current LLM. Defaults to None (no
+                hedging).
 
         Raises:
             ValueError: If no LLM instances are provided.
@@ -72,6 +81,11 @@ class FallbackAdapter(
         self._max_retry_per_llm = max_retry_per_llm
         self._retry_interval = retry_interval
         self._retry_on_chunk_sent = retry_on_chunk_sent
+        self._hedge_trackers = (
+            [HedgeTracker(hedge_delay) for _ in self._llm_instances]
+            if hedge_delay is not None
+            else None
+        )
 
         self._status = [
             _LLMStatus(available=True, recovering_task=None) for _ in self._llm_instances
@@ -137,6 +151,9 @@ class FallbackLLMStream(LLMStream):
         self._extra_kwargs = extra_kwargs
 
         self._current_stream: LLMStream | None = None
+        # streams that produced their first chunk, by id of their LLM. With hedging two of them
+        # can race, _current_stream is only set to the winner
+        self._started_streams: dict[int, LLMStream] = {}
 
     @property
     def chat_ctx(self) -> ChatContext:
@@ -152,7 +169,7 @@ class FallbackLLMStream(LLMStream):
 
     async def _try_generate(
         self, *, llm: LLM, check_recovery: bool = False
-    ) -> AsyncIterable[ChatChunk]:
+    ) -> AsyncGenerator[ChatChunk | _TextChunk, None]:
         """
         Try to generate with the given LLM.
 
@@ -177,10 +194,10 @@ class FallbackLLMStream(LLMStream):
                 ),
             ) as stream:
                 should_set_current = not check_recovery
-                async for chunk in stream:
+                async for chunk in stream._iter_chunks():
                     if should_set_current:
                         should_set_current = False
-                        self._current_stream = stream
+                        self._started_streams[id(llm)] = stream
                     yield chunk
 
         except asyncio.TimeoutError:
@@ -242,6 +259,55 @@ class FallbackLLMStream(LLMStream):
 
             llm_status.recovering_task = asyncio.create_task(_recover_llm_task(llm))
 
+    def _set_unavailable(self, llm: LLM) -> None:
+        llm_status = self._fallback_adapter._status[
+            self._fallback_adapter._llm_instances.index(llm)
+        ]
+        if llm_status.available:
+            llm_status.available = False
+            self._fallback_adapter.emit(
+                "llm_availability_changed",
+                AvailabilityChangedEvent(llm=llm, available=False),
+            )
+
+    async def _race(
+        self, i: int, *, all_failed: bool
+    ) -> hedging.HedgeResult[ChatChunk | _TextChunk]:
+        """Generate with the i-th LLM, hedged with the next one when hedging is enabled."""
+        llm_instances = self._fallback_adapter._llm_instances
+        trackers = self._fallback_adapter._hedge_trackers
+        llm = llm_instances[i]
+
+        hedge: Callable[[], AsyncGenerator[ChatChunk | _TextChunk, None]] | None = None
+        delay: float | None = None
+        if trackers is not None and i + 1 < len(llm_instances):
+            next_status = self._fallback_adapter._status[i + 1]
+            if next_status.available or all_failed:
+                hedge_llm = llm_instances[i + 1]
+                hedge = lambda: self._try_generate(llm=hedge_llm)  # noqa: E731
+                delay = trackers[i].hedge_delay()
+
+        result = await hedging.race(lambda: self._try_generate(llm=llm), hedge, delay=delay)
+
+        if trackers is not None:
+            if result.winner == 0:
+                trackers[i].add_sample(result.ttfr)
+            elif result.winner == 1 and result.hedge_started_at is not None:
+                trackers[i + 1].add_sample(result.ttfr - result.hedge_started_at)
+
+            metrics._update_fallback_hedge(
+                kind="llm",
+                result=result,
+                latency_saved=trackers[i].latency_saved(
+                    result, timeout=self._fallback_adapter._attempt_timeout
+                ),
+            )
+
+        if result.winner is not None:
+            self._current_stream = self._started_streams.get(id(llm_instances[i + result.winner]))
+
+        return result
+
     async def _run(self) -> None:
         start_time = time.time()
 
@@ -249,50 +315,70 @@ class FallbackLLMStream(LLMStream):
         if all_failed:
             logger.error("all LLMs are unavailable, retrying..")
 
-        for i, llm in enumerate(self._fallback_adapter._llm_instances):
+        llm_instances = self._fallback_adapter._llm_instances
+        i = 0
+        while i < len(llm_instances):
+            llm = llm_instances[i]
             llm_status = self._fallback_adapter._status[i]
-            if llm_status.available or all_failed:
-                text_sent: str = ""
-                tool_calls_sent: list[str] = []
-                try:
-                    async for result in self._try_generate(llm=llm, check_recovery=False):
-                        if result.delta:
-                            if result.delta.content:
-                                text_sent += result.delta.content
-                            for tool_call in result.delta.tool_calls:
-                                tool_calls_sent.append(tool_call.name)
-
-                        self._event_ch.send_nowait(result)
-
-                    return
-                except Exception:  # exceptions already logged inside _try_generate
-                    if llm_status.available:
-                        llm_status.available = False
-                        self._fallback_adapter.emit(
-                            "llm_availability_changed",
-                            AvailabilityChangedEvent(llm=llm, available=False),
-                        )
-
-                    if text_sent or tool_calls_sent:
-                        extra = {"text_sent": text_sent, "tool_calls_sent": tool_calls_sent}
-                        if not self._fallback_adapter._retry_on_chunk_sent:
-                            logger.error(
-                                f"{llm.label} failed after sending chunk, skip retrying. "
-                                "Set `retry_on_chunk_sent` to `True` to enable retrying after chunks are sent.",
-                                extra=extra,
-                            )
-                            raise
-
-                        logger.warning(
-                            f"{llm.label} failed after sending chunk, retrying..",
+            if not (llm_status.available or all_failed):
+                self._try_recovery(llm)
+                i += 1
+                continue
+
+            result = await self._race(i, all_failed=all_failed)
+            for index, _ in result.errors:  # exceptions already logged inside _try_generate
+                self._set_unavailable(llm_instances[i + index])
+                self._try_recovery(llm_instances[i + index])
+
+            if result.winner is None:
+                i += 2 if result.hedged else 1
+                continue
+
+            # the hedge may have won, continue the fallback from the LLM that is streaming
+            i += result.winner
+            llm = llm_instances[i]
+
+            text_sent: str = ""
+            tool_calls_sent: list[str] = []
+            try:
+                async for chunk in result.stream:
+                    if isinstance(chunk, _TextChunk):
+                        text_sent += chunk.content
+                    elif chunk.delta:
+                        if chunk.delta.content:
+                            text_sent += chunk.delta.content
+                        for tool_call in chunk.delta.tool_calls:
+                            tool_calls_sent.append(tool_call.name)
+
+                    self._event_ch.send_nowait(chunk)
+
+                return
+            except Exception:  # exceptions already logged inside _try_generate
+                self._set_unavailable(llm)
+
+                if text_sent or tool_calls_sent:
+                    extra = {"text_sent": text_sent, "tool_calls_sent": tool_calls_sent}
+                    if not self._fallback_adapter._retry_on_chunk_sent:
+                        logger.error(
+                            f"{llm.label} failed after sending chunk, skip retrying. "
+                            "Set `retry_on_chunk_sent` to `True` to enable retrying after chunks are sent.",
                             extra=extra,
                         )
+                        raise
+
+                    logger.warning(
+                        f"{llm.label} failed after sending chunk, retrying..",
+                        extra=extra,
+                    )
 
             self._try_recovery(llm)
+            i += 1
 
         raise APIConnectionError(
             f"all LLMs failed ({[llm.label for llm in self._fallback_adapter._llm_instances]}) after {time.time() - start_time} seconds"  # noqa: E501
         )
 
-    async def _metrics_monitor_task(self, event_aiter: AsyncIterable[ChatChunk]) -> None:
+    async def _metrics_monitor_task(
+        self, event_aiter: AsyncIterable[ChatChunk | _TextChunk]
+    ) -> None:
         return
@@ -82,6 +82,40 @@ class ChatChunk(BaseModel):
     usage: CompletionUsage | None = None
 
 
+class _TextChunk:
+    """Internal fast path for the most common chunk: assistant text without tool calls,
+    usage or extra data.
+
+    Building the pydantic ``ChatChunk``/``ChoiceDelta`` pair validates every token, providers
+    push this instead with ``LLMStream._push_text``. It is converted to a ``ChatChunk`` only
+    when it reaches user code (iterating the ``LLMStream``).
+    """
+
+    __slots__ = ("id", "content")
+
+    def __init__(self, id: str, content: str) -> None:
+        self.id = id
+        self.content = content
+
+    def to_chat_chunk(self) -> ChatChunk:
+        return ChatChunk(id=self.id, delta=ChoiceDelta(role="assistant", content=self.content))
+
+
+class _ChunkIterator:
+    """iterates an LLMStream without converting its ``_TextChunk``s"""
+
+    __slots__ = ("_stream",)
+
+    def __init__(self, stream: LLMStream) -> None:
+        self._stream = stream
+
+    def __aiter__(self) -> _ChunkIterator:
+        return self
+
+    async def __anext__(self) -> ChatChunk | _TextChunk:
+        return await self._stream._anext_chunk()
+
+
 class LLMError(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
     type: Literal["llm_error"] = "llm_error"
@@ -177,7 +211,7 @@ class LLMStream(ABC):
         self._tools = tools
         self._conn_options = conn_options
 
-        self._event_ch = aio.Chan[ChatChunk]()
+        self._event_ch = aio.Chan[ChatChunk | _TextChunk]()
         self._tee_aiter = aio.itertools.tee(self._event_ch, 2)
         self._event_aiter, monitor_aiter = self._tee_aiter
         self._current_attempt_has_error = False
@@ -279,27 +313,34 @@ class LLMStream(ABC):
         )
 
     @utils.log_exceptions(logger=logger)
-    async def _metrics_monitor_task(self, event_aiter: AsyncIterable[ChatChunk]) -> None:
+    async def _metrics_monitor_task(
+        self, event_aiter: AsyncIterable[ChatChunk | _TextChunk]
+    ) -> None:
         start_time = time.perf_counter()
         ttft = -1.0
         request_id = ""
         usage: CompletionUsage | None = None
 
-        response_content = ""
+        content_parts: list[str] = []
         tool_calls: list[FunctionToolCall] = []
         completion_start_time: str | None = None
 
         async for ev in event_aiter:
-            request_id = ev.id
-            if request_id and request_id not in self._provider_request_ids:
-                self._provider_request_ids.append(request_id)
+            if ev.id != request_id:
+                request_id = ev.id
+                if request_id and request_id not in self._provider_request_ids:
+                    self._provider_request_ids.append(request_id)
             if ttft == -1.0:
                 ttft = time.perf_counter() - start_time
                 completion_start_time = datetime.now(timezone.utc).isoformat()
 
+            if isinstance(ev, _TextChunk):
+                content_parts.append(ev.content)
+                continue
+
             if ev.delta:
                 if ev.delta.content:
-                    response_content += ev.delta.content
+                    content_parts.append(ev.delta.content)
                 if ev.delta.tool_calls:
                     tool_calls.extend(ev.delta.tool_calls)
 
@@ -307,6 +348,7 @@ class LLMStream(ABC):
                 usage = ev.usage
 
         duration = time.perf_counter() - start_time
+        response_content = "".join(content_parts)
 
         # if generation is aborted before any tokens are received, it doesn't make sense to report -1 ttft
         if self._current_attempt_has_error or ttft < 0:
@@ -385,15 +427,31 @@ class LLMStream(ABC):
 
         await self._tee_aiter.aclose()
 
-    async def __anext__(self) -> ChatChunk:
+    def _push_text(self, id: str, content: str) -> None:
+        """Send a text-only delta without building the pydantic ``ChatChunk``.
+
+        Use ``_event_ch.send_nowait(ChatChunk(...))`` for tool calls, usage and extra data.
+        """
+        self._event_ch.send_nowait(_TextChunk(id, content))
+
+    def _iter_chunks(self) -> _ChunkIterator:
+        """Iterate the stream for internal consumers that handle ``_TextChunk`` themselves."""
+        return _ChunkIterator(self)
+
+    async def _anext_chunk(self) -> ChatChunk | _TextChunk:
         try:
-            val = await self._event_aiter.__anext__()
+            return await self._event_aiter.__anext__()
         except StopAsyncIteration:
             if not self._task.cancelled() and (exc := self._task.exception()):
                 raise exc  # noqa: B904
 
             raise StopAsyncIteration from None
 
+    async def __anext__(self) -> ChatChunk:
+        val = await self._anext_chunk()
+        if isinstance(val, _TextChunk):
+            return val.to_chat_chunk()
+
         return val
 
     def __aiter__(self) -> AsyncIterator[ChatChunk]:
@@ -418,8 +476,11 @@ class LLMStream(ABC):
 
         async def _iterable() -> AsyncIterable[str]:
             async with self:
-                async for chunk in self:
-                    if chunk.delta and chunk.delta.content:
+                async for chunk in self._iter_chunks():
+                    if isinstance(chunk, _TextChunk):
+                        if chunk.content:
+                            yield chunk.content
+                    elif chunk.delta and chunk.delta.content:
                         yield chunk.delta.content
 
         return _iterable()
@@ -446,7 +507,11 @@ class LLMStream(ABC):
         extra: dict[str, Any] = {}
 
         async with self:
-            async for chunk in self:
+            async for chunk in self._iter_chunks():
+                if isinstance(chunk, _TextChunk):
+                    text_parts.append(chunk.content)
+                    continue
+
                 if chunk.delta:
                     if chunk.delta.content:
                         text_parts.append(chunk.delta.content)
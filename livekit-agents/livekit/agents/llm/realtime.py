@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import binascii
 import time
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterable, Awaitable
+from collections.abc import AsyncIterable, Awaitable, Callable
 from dataclasses import dataclass
 from types import TracebackType
 from typing import Generic, Literal, TypeVar
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
 from livekit import rtc
@@ -142,6 +144,7 @@ EventTypes = Literal[
 ]
 
 TEvent = TypeVar("TEvent")
+T = TypeVar("T")
 
 
 @dataclass
@@ -166,6 +169,139 @@ class RemoteItemAddedEvent:
     item: ChatItem
 
 
+class RealtimeAudioInput:
+    """Conditions the user audio pushed to a realtime session into the packets sent to the model.
+
+    The input is downmixed, resampled to the format the model expects and rechunked into
+    fixed-size packets of 16-bit PCM. Frames are copied once into a reusable buffer and each
+    packet is encoded straight from it.
+
+    When the input sample rate changes, the samples still held by the previous resampler are
+    flushed first so no audio is dropped between the two sources.
+    """
+
+    def __init__(self, *, sample_rate: int, num_channels: int = 1, samples_per_packet: int) -> None:
+        """
+        Args:
+            sample_rate: Sample rate expected by the model.
+            num_channels: Number of channels expected by the model.
+            samples_per_packet: Samples per channel in each packet sent to the model.
+        """
+        if samples_per_packet <= 0:
+            raise ValueError("samples_per_packet must be greater than 0")
+
+        self._sample_rate = sample_rate
+        self._num_channels = num_channels
+        self._samples_per_packet = samples_per_packet
+        self._packet_size = samples_per_packet * num_channels * 2
+        self._buf = bytearray()
+        self._resampler: rtc.AudioResampler | None = None
+        self._resampler_rate = 0
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @property
+    def num_channels(self) -> int:
+        return self._num_channels
+
+    @property
+    def packet_duration(self) -> float:
+        """Duration of a full packet in seconds"""
+        return self._samples_per_packet / self._sample_rate
+
+    def push(self, frame: rtc.AudioFrame) -> list[bytes]:
+        """Push a frame and return the PCM packets that are complete"""
+        self._write(frame)
+        return self._drain(bytes)
+
+    def push_base64(self, frame: rtc.AudioFrame) -> list[str]:
+        """Push a frame and return the complete packets encoded in base64"""
+        self._write(frame)
+        return self._drain(_b64encode)
+
+    def flush(self) -> list[bytes]:
+        """Flush the resampler and return the remaining audio, the last packet may be shorter"""
+        self._flush_resampler()
+        return self._drain(bytes, partial=True)
+
+    def flush_base64(self) -> list[str]:
+        self._flush_resampler()
+        return self._drain(_b64encode, partial=True)
+
+    def clear(self) -> None:
+        """Discard the buffered audio"""
+        self._buf.clear()
+        self._resampler = None
+        self._resampler_rate = 0
+
+    def _write(self, frame: rtc.AudioFrame) -> None:
+        if frame.num_channels != self._num_channels:
+            frame = self._downmix(frame)
+
+        if frame.sample_rate == self._sample_rate:
+            self._flush_resampler()
+            self._buf += frame.data.cast("B")
+            return
+
+        if self._resampler is None or self._resampler_rate != frame.sample_rate:
+            self._flush_resampler()
+            self._resampler = rtc.AudioResampler(
+                input_rate=frame.sample_rate,
+                output_rate=self._sample_rate,
+                num_channels=self._num_channels,
+            )
+            self._resampler_rate = frame.sample_rate
+
+        for f in self._resampler.push(frame):
+            self._buf += f.data.cast("B")
+
+    def _flush_resampler(self) -> None:
+        if self._resampler is None:
+            return
+
+        for f in self._resampler.flush():
+            self._buf += f.data.cast("B")
+        self._resampler = None
+        self._resampler_rate = 0
+
+    def _downmix(self, frame: rtc.AudioFrame) -> rtc.AudioFrame:
+        if self._num_channels != 1:
+            raise ValueError(
+                f"cannot convert {frame.num_channels} channels to {self._num_channels} channels"
+            )
+
+        samples = np.frombuffer(frame.data, dtype=np.int16).reshape(-1, frame.num_channels)
+        return rtc.AudioFrame(
+            data=samples.mean(axis=1).astype(np.int16).tobytes(),
+            sample_rate=frame.sample_rate,
+            num_channels=1,
+            samples_per_channel=frame.samples_per_channel,
+        )
+
+    def _drain(self, encode: Callable[[memoryview], T], *, partial: bool = False) -> list[T]:
+        size = self._packet_size
+        if len(self._buf) < size and not partial:
+            return []
+
+        end = len(self._buf) - len(self._buf) % size
+        packets: list[T] = []
+        with memoryview(self._buf) as view:
+            for offset in range(0, end, size):
+                packets.append(encode(view[offset : offset + size]))
+            if partial and end < len(self._buf):
+                packets.append(encode(view[end:]))
+                end = len(self._buf)
+
+        del self._buf[:end]
+        return packets
+
+
+def _b64encode(data: memoryview) -> str:
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
 class RealtimeSession(ABC, rtc.EventEmitter[EventTypes | TEvent], Generic[TEvent]):
     def __init__(self, realtime_model: RealtimeModel) -> None:
         super().__init__()
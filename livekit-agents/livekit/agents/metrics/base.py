@@ -125,6 +125,12 @@ class EOTInferenceMetrics(_BaseMetrics):
     """Server side model inference time."""
     num_requests: int = 1
     """Number of inference requests made during one inference."""
+    queue_wait: float = 0.0
+    """Time the request waited in the local EOT scheduler before running."""
+    num_superseded: int = 0
+    """Older requests of the same stream dropped by the local EOT scheduler in favor of this one."""
+    batch_size: int = 1
+    """Number of requests run by the same local model call."""
     metadata: Metadata | None = None
 
 
@@ -4,7 +4,7 @@ import asyncio
 import contextlib
 import dataclasses
 import time
-from collections.abc import AsyncIterable
+from collections.abc import AsyncGenerator, AsyncIterable, Callable
 from dataclasses import dataclass
 from typing import Any, Literal
 
@@ -13,9 +13,11 @@ from livekit import rtc
 from .. import utils
 from .._exceptions import APIConnectionError, APIError
 from ..log import logger
+from ..telemetry import metrics
 from ..types import DEFAULT_API_CONNECT_OPTIONS, NOT_GIVEN, APIConnectOptions, NotGivenOr
-from ..utils import aio
+from ..utils import aio, hedging
 from ..utils.audio import AudioBuffer
+from ..utils.hedging import HedgeTracker
 from ..vad import VAD
 from .stt import STT, RecognizeStream, SpeechEvent, SpeechEventType, STTCapabilities
 
@@ -53,6 +55,7 @@ class FallbackAdapter(
         attempt_timeout: float = 10.0,
         max_retry_per_stt: int = 1,
         retry_interval: float = 5,
+        hedge_delay: float | Literal["auto"] | None = None,
     ) -> None:
         if len(stt) < 1:
             raise ValueError("At least one STT instance must be provided.")
@@ -91,6 +94,10 @@ class FallbackAdapter(
         self._attempt_timeout = attempt_timeout
         self._max_retry_per_stt = max_retry_per_stt
         self._retry_interval = retry_interval
+        # only recognize() is hedged, a streaming recognizer has no "first result" deadline
+        self._hedge_trackers = (
+            [HedgeTracker(hedge_delay) for _ in stt] if hedge_delay is not None else None
+        )
 
         self._status: list[_STTStatus] = [
             _STTStatus(
@@ -223,31 +230,88 @@ class FallbackAdapter(
         if all_failed:
             logger.error("all STTs are unavailable, retrying..")
 
-        for i, stt in enumerate(self._stt_instances):
+        i = 0
+        while i < len(self._stt_instances):
+            stt = self._stt_instances[i]
             stt_status = self._status[i]
             if stt_status.available or all_failed:
-                try:
-                    return await self._try_recognize(
-                        stt=stt,
-                        buffer=buffer,
-                        language=language,
-                        conn_options=conn_options,
-                        recovering=False,
-                    )
-                except Exception:  # exceptions already logged inside _try_recognize
-                    if stt_status.available:
-                        stt_status.available = False
+                result = await self._race_recognize(
+                    i,
+                    all_failed=all_failed,
+                    buffer=buffer,
+                    language=language,
+                    conn_options=conn_options,
+                )
+                for index, _ in result.errors:  # exceptions already logged inside _try_recognize
+                    failed_stt = self._stt_instances[i + index]
+                    failed_status = self._status[i + index]
+                    if failed_status.available:
+                        failed_status.available = False
                         self.emit(
                             "stt_availability_changed",
-                            AvailabilityChangedEvent(stt=stt, available=False),
+                            AvailabilityChangedEvent(stt=failed_stt, available=False),
                         )
 
+                    self._try_recovery(
+                        stt=failed_stt, buffer=buffer, language=language, conn_options=conn_options
+                    )
+
+                async for ev in result.stream:
+                    return ev
+
+                i += 2 if result.hedged else 1
+                continue
+
             self._try_recovery(stt=stt, buffer=buffer, language=language, conn_options=conn_options)
+            i += 1
 
         raise APIConnectionError(
             f"all STTs failed ({[stt.label for stt in self._stt_instances]}) after {time.time() - start_time} seconds"  # noqa: E501
         )
 
+    async def _race_recognize(
+        self,
+        i: int,
+        *,
+        all_failed: bool,
+        buffer: utils.AudioBuffer,
+        language: NotGivenOr[str],
+        conn_options: APIConnectOptions,
+    ) -> hedging.HedgeResult[SpeechEvent]:
+        """Recognize with the i-th STT, hedged with the next one when hedging is enabled."""
+
+        def _attempt(stt: STT) -> Callable[[], AsyncGenerator[SpeechEvent, None]]:
+            async def _recognize() -> AsyncGenerator[SpeechEvent, None]:
+                yield await self._try_recognize(
+                    stt=stt, buffer=buffer, language=language, conn_options=conn_options
+                )
+
+            return _recognize
+
+        trackers = self._hedge_trackers
+        hedge: Callable[[], AsyncGenerator[SpeechEvent, None]] | None = None
+        delay: float | None = None
+        if trackers is not None and i + 1 < len(self._stt_instances):
+            if self._status[i + 1].available or all_failed:
+                hedge = _attempt(self._stt_instances[i + 1])
+                delay = trackers[i].hedge_delay()
+
+        result = await hedging.race(_attempt(self._stt_instances[i]), hedge, delay=delay)
+
+        if trackers is not None:
+            if result.winner == 0:
+                trackers[i].add_sample(result.ttfr)
+            elif result.winner == 1 and result.hedge_started_at is not None:
+                trackers[i + 1].add_sample(result.ttfr - result.hedge_started_at)
+
+            metrics._update_fallback_hedge(
+                kind="stt",
+                result=result,
+                latency_saved=trackers[i].latency_saved(result, timeout=self._attempt_timeout),
+            )
+
+        return result
+
     async def recognize(
         self,
         buffer: AudioBuffer,
@@ -317,7 +317,11 @@ class RecognizeStream(ABC):
         """
         self._stt = stt
         self._conn_options = conn_options
-        self._input_ch = aio.Chan[rtc.AudioFrame | RecognizeStream._FlushSentinel]()
+        # unbounded: push_frame() can't wait and every frame has to reach the STT, files are
+        # pushed faster than real time. The depth and age are exported by the telemetry.
+        self._input_ch = aio.Chan[rtc.AudioFrame | RecognizeStream._FlushSentinel](
+            overflow="block", name="stt_input"
+        )
         self._event_ch = aio.Chan[SpeechEvent]()
 
         self._tee = aio.itertools.tee(self._event_ch, 2)
@@ -1,10 +1,17 @@
+from __future__ import annotations
+
 import os
+from typing import TYPE_CHECKING, Any
 
 import prometheus_client
 import psutil
 
 from .. import utils
 
+if TYPE_CHECKING:
+    from ..ipc.resource_sampler import ProcResourceUsage
+    from ..utils.hedging import HedgeResult
+
 PROC_INITIALIZE_TIME = prometheus_client.Histogram(
     "lk_agents_proc_initialize_duration_seconds",
     "Time taken to initialize a process",
@@ -35,6 +42,85 @@ CPU_LOAD_GAUGE = prometheus_client.Gauge(
     ["nodename"],
 )
 
+# Per-process resource usage, sampled by the worker's ResourceSampler (main process only).
+# job_id is empty for idle and inference processes.
+_PROC_LABELS = ["nodename", "process_kind", "pid", "job_id"]
+
+PROC_CPU_SECONDS_GAUGE = prometheus_client.Gauge(
+    "lk_agents_proc_cpu_seconds",
+    "Cumulative CPU time consumed by a child process",
+    _PROC_LABELS,
+    multiprocess_mode="livemax",
+)
+
+PROC_MEMORY_USS_GAUGE = prometheus_client.Gauge(
+    "lk_agents_proc_memory_uss_bytes",
+    "Memory unique to a child process",
+    _PROC_LABELS,
+    multiprocess_mode="livemax",
+)
+
+PROC_MEMORY_PSS_GAUGE = prometheus_client.Gauge(
+    "lk_agents_proc_memory_pss_bytes",
+    "Proportional set size of a child process (shared pages split between processes)",
+    _PROC_LABELS,
+    multiprocess_mode="livemax",
+)
+
+PROC_LOOP_LAG_GAUGE = prometheus_client.Gauge(
+    "lk_agents_proc_event_loop_lag_seconds",
+    "Worst event loop lag reported by a child process since its previous ping",
+    _PROC_LABELS,
+    multiprocess_mode="livemax",
+)
+
+_PROC_GAUGES = (
+    PROC_CPU_SECONDS_GAUGE,
+    PROC_MEMORY_USS_GAUGE,
+    PROC_MEMORY_PSS_GAUGE,
+    PROC_LOOP_LAG_GAUGE,
+)
+
+# Requests of the LLM/TTS/STT FallbackAdapters with hedging enabled, by outcome of the race:
+# not_hedged, primary_won, hedge_won or failed
+FALLBACK_HEDGE_COUNTER = prometheus_client.Counter(
+    "lk_agents_fallback_hedge_requests_total",
+    "Requests made by a FallbackAdapter with hedging enabled",
+    ["nodename", "kind", "outcome"],
+)
+
+FALLBACK_HEDGE_LATENCY_SAVED = prometheus_client.Histogram(
+    "lk_agents_fallback_hedge_latency_saved_seconds",
+    "Estimated time to first result saved when the hedged request won",
+    ["nodename", "kind"],
+    buckets=[0.1, 0.25, 0.5, 1, 2, 5, 10],
+)
+
+# Named aio.Chan queues (STT/VAD input, TTS audio, ...), updated periodically by every process.
+# The gauges hold the maximum since the previous update.
+CHAN_HIGH_WATER_GAUGE = prometheus_client.Gauge(
+    "lk_agents_chan_high_water",
+    "Most values queued at once in a channel since the previous update",
+    ["nodename", "channel"],
+    multiprocess_mode="livemax",
+)
+
+CHAN_QUEUE_AGE_GAUGE = prometheus_client.Gauge(
+    "lk_agents_chan_queue_age_seconds",
+    "Longest time a value spent queued in a channel since the previous update",
+    ["nodename", "channel"],
+    multiprocess_mode="livemax",
+)
+
+# reason: dropped (drop_oldest/drop_newest policies) or coalesced
+CHAN_OVERFLOW_COUNTER = prometheus_client.Counter(
+    "lk_agents_chan_overflow_total",
+    "Values a full channel dropped or coalesced",
+    ["nodename", "channel", "reason"],
+)
+
+_chan_reported: dict[str, tuple[int, int]] = {}
+
 
 # Note: set_function() is not supported in multiprocess mode.# We need to update this metric explicitly.
 def _update_child_proc_count() -> None:
@@ -51,6 +137,25 @@ def _update_worker_load(worker_load: float) -> None:
     CPU_LOAD_GAUGE.labels(nodename=utils.nodename()).set(worker_load)
 
 
+def _update_chan_metrics() -> None:
+    """Report the stats of the named aio.Chan. Must be called periodically in each process."""
+    nodename = utils.nodename()
+    for name, stats in utils.aio.channel._take_named_stats().items():
+        CHAN_HIGH_WATER_GAUGE.labels(nodename=nodename, channel=name).set(stats.high_water)
+        CHAN_QUEUE_AGE_GAUGE.labels(nodename=nodename, channel=name).set(stats.max_age)
+
+        dropped, coalesced = _chan_reported.get(name, (0, 0))
+        if stats.dropped > dropped:
+            CHAN_OVERFLOW_COUNTER.labels(nodename=nodename, channel=name, reason="dropped").inc(
+                stats.dropped - dropped
+            )
+        if stats.coalesced > coalesced:
+            CHAN_OVERFLOW_COUNTER.labels(nodename=nodename, channel=name, reason="coalesced").inc(
+                stats.coalesced - coalesced
+            )
+        _chan_reported[name] = (stats.dropped, stats.coalesced)
+
+
 def job_started() -> None:
     RUNNING_JOB_GAUGE.labels(nodename=utils.nodename()).inc()
 
@@ -61,3 +166,48 @@ def job_ended() -> None:
 
 def proc_initialized(*, time_elapsed: float) -> None:
     PROC_INITIALIZE_TIME.labels(nodename=utils.nodename()).observe(time_elapsed)
+
+
+def _proc_labels(usage: ProcResourceUsage) -> dict[str, str]:
+    return {
+        "nodename": utils.nodename(),
+        "process_kind": usage.process_kind,
+        "pid": str(usage.pid),
+        "job_id": usage.job_id or "",
+    }
+
+
+def _update_proc_resources(usage: ProcResourceUsage) -> None:
+    labels = _proc_labels(usage)
+    PROC_CPU_SECONDS_GAUGE.labels(**labels).set(usage.cpu_seconds)
+    PROC_LOOP_LAG_GAUGE.labels(**labels).set(usage.loop_lag_ms / 1000)
+    if usage.uss_mb is not None:
+        PROC_MEMORY_USS_GAUGE.labels(**labels).set(usage.uss_mb * 1024 * 1024)
+    if usage.pss_mb is not None:
+        PROC_MEMORY_PSS_GAUGE.labels(**labels).set(usage.pss_mb * 1024 * 1024)
+
+
+def _remove_proc_resources(usage: ProcResourceUsage) -> None:
+    labels = _proc_labels(usage)
+    for gauge in _PROC_GAUGES:
+        try:
+            gauge.remove(*labels.values())
+        except KeyError:
+            pass
+
+
+def _update_fallback_hedge(
+    *, kind: str, result: HedgeResult[Any], latency_saved: float = 0.0
+) -> None:
+    if result.winner is None:
+        outcome = "failed"
+    elif not result.hedged:
+        outcome = "not_hedged"
+    else:
+        outcome = "hedge_won" if result.winner == 1 else "primary_won"
+
+    FALLBACK_HEDGE_COUNTER.labels(nodename=utils.nodename(), kind=kind, outcome=outcome).inc()
+    if outcome == "hedge_won":
+        FALLBACK_HEDGE_LATENCY_SAVED.labels(nodename=utils.nodename(), kind=kind).observe(
+            latency_saved
+        )
@@ -5,11 +5,13 @@ import json
 import logging
 import threading
 import time
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import aiofiles
+import aiofiles.os
 import aiohttp
 import requests
 from google.protobuf.json_format import MessageToDict
@@ -421,6 +423,10 @@ def _to_proto_chat_item(item: ChatItem) -> dict:
     return MessageToDict(_build_proto_chat_item(item), preserving_proto_field_name=True)
 
 
+# size of the reads used to stream the audio recording to LiveKit Cloud
+_RECORDING_UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
 async def _parse_retry_delay(resp: aiohttp.ClientResponse) -> float | None:
     """Parse a protobuf Status error response for RetryInfo and return the retry delay in seconds,
     or None if the error is not retryable."""
@@ -441,6 +447,14 @@ async def _parse_retry_delay(resp: aiohttp.ClientResponse) -> float | None:
     return None
 
 
+async def _read_file_chunks(
+    path: str | Path, chunk_size: int = _RECORDING_UPLOAD_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    async with aiofiles.open(path, "rb") as f:
+        while chunk := await f.read(chunk_size):
+            yield chunk
+
+
 async def _upload_session_report(
     *,
     agent_name: str,
@@ -586,13 +600,16 @@ async def _upload_session_report(
     if recording_options["transcript"]:
         chat_history_json = json.dumps(report.chat_history.to_dict(exclude_timestamp=False))
 
-    audio_bytes = b""
+    # the recording is streamed from disk on each attempt instead of being read into memory,
+    # so long calls don't hold the whole OGG file in RAM while uploading (and retrying)
+    audio_path: str | Path | None = None
+    audio_size = 0
     if has_audio and report.audio_recording_path:
         try:
-            async with aiofiles.open(report.audio_recording_path, "rb") as f:
-                audio_bytes = await f.read()
-        except Exception:
-            audio_bytes = b""
+            audio_size = (await aiofiles.os.stat(report.audio_recording_path)).st_size
+            audio_path = report.audio_recording_path
+        except OSError:
+            audio_path = None
 
     url = f"{observability_url}/observability/recordings/v0"
 
@@ -612,11 +629,11 @@ async def _upload_session_report(
             part.headers["Content-Type"] = "application/json"
             part.headers["Content-Length"] = str(len(chat_history_json))
 
-        if audio_bytes:
-            part = mp.append(audio_bytes)
+        if audio_path and audio_size:
+            part = mp.append(_read_file_chunks(audio_path))
             part.set_content_disposition("form-data", name="audio", filename="recording.ogg")
             part.headers["Content-Type"] = "audio/ogg"
-            part.headers["Content-Length"] = str(len(audio_bytes))
+            part.headers["Content-Length"] = str(audio_size)
 
         return mp
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import dataclasses
 import time
-from collections.abc import AsyncGenerator, AsyncIterable
+from collections.abc import AsyncGenerator, AsyncIterable, Callable
 from dataclasses import dataclass
 from typing import Any, ClassVar, Literal
 
@@ -12,8 +12,10 @@ from livekit import rtc
 from .. import utils
 from .._exceptions import APIConnectionError
 from ..log import logger
+from ..telemetry import metrics
 from ..types import DEFAULT_API_CONNECT_OPTIONS, USERDATA_TIMED_TRANSCRIPT, APIConnectOptions
-from ..utils import aio
+from ..utils import aio, hedging
+from ..utils.hedging import HedgeTracker
 from .stream_adapter import StreamAdapter
 from .tts import (
     TTS,
@@ -56,6 +58,7 @@ class FallbackAdapter(
         *,
         max_retry_per_tts: int = 2,
         sample_rate: int | None = None,
+        hedge_delay: float | Literal["auto"] | None = None,
     ) -> None:
         """
         Initialize a FallbackAdapter that manages multiple TTS instances.
@@ -64,6 +67,7 @@ class FallbackAdapter(
             tts (list[TTS]): A list of TTS instances to use for fallback.
             max_retry_per_tts (int, optional): Maximum number of retries per TTS instance. Defaults to 2.
             sample_rate (int | None, optional): Desired sample rate for the synthesized audio. If None, uses the maximum sample rate among the TTS instances.
+            hedge_delay (float | Literal["auto"] | None, optional): When set, if the current TTS hasn't produced audio after this many seconds in `synthesize()`, the next TTS is started in parallel and the first one to produce audio wins, the other is cancelled. "auto" uses the rolling p95 time to first byte of the current TTS. Streaming synthesis is not hedged. Defaults to None (no hedging).
 
         Raises:
             ValueError: If less than one TTS instance is provided.
@@ -92,6 +96,9 @@ class FallbackAdapter(
 
         self._tts_instances = tts
         self._max_retry_per_tts = max_retry_per_tts
+        self._hedge_trackers = (
+            [HedgeTracker(hedge_delay) for _ in tts] if hedge_delay is not None else None
+        )
 
         self._status: list[_TTSStatus] = []
         for t in tts:
@@ -216,53 +223,109 @@ class FallbackChunkedStream(ChunkedStream):
             mime_type="audio/pcm",
         )
 
-        for i, tts in enumerate(self._tts._tts_instances):
+        tts_instances = self._tts._tts_instances
+        i = 0
+        while i < len(tts_instances):
+            tts = tts_instances[i]
             tts_status = self._tts._status[i]
-            if tts_status.available or all_failed:
-                try:
-                    resampler = (
-                        rtc.AudioResampler(
-                            input_rate=tts.sample_rate,
-                            output_rate=self._tts.sample_rate,
-                        )
-                        if tts_status.needs_resampling
-                        else None
-                    )
-                    async for synthesized_audio in self._try_synthesize(tts=tts, recovering=False):
-                        if texts := synthesized_audio.frame.userdata.get(USERDATA_TIMED_TRANSCRIPT):
-                            output_emitter.push_timed_transcript(texts)
+            if not (tts_status.available or all_failed):
+                self._try_recovery(tts)
+                i += 1
+                continue
+
+            result = await self._race(i, all_failed=all_failed)
+            for index, _ in result.errors:  # exceptions already logged inside _try_synthesize
+                self._set_unavailable(tts_instances[i + index])
+                self._try_recovery(tts_instances[i + index])
 
-                        if resampler is not None:
-                            for rf in resampler.push(synthesized_audio.frame):
-                                output_emitter.push(rf.data.tobytes())
-                        else:
-                            output_emitter.push(synthesized_audio.frame.data.tobytes())
+            if result.winner is None:
+                i += 2 if result.hedged else 1
+                continue
+
+            # the hedge may have won, continue the fallback from the TTS that is synthesizing
+            i += result.winner
+            tts = tts_instances[i]
+            tts_status = self._tts._status[i]
+            try:
+                resampler = (
+                    rtc.AudioResampler(
+                        input_rate=tts.sample_rate,
+                        output_rate=self._tts.sample_rate,
+                    )
+                    if tts_status.needs_resampling
+                    else None
+                )
+                async for synthesized_audio in result.stream:
+                    if texts := synthesized_audio.frame.userdata.get(USERDATA_TIMED_TRANSCRIPT):
+                        output_emitter.push_timed_transcript(texts)
 
                     if resampler is not None:
-                        for rf in resampler.flush():
+                        for rf in resampler.push(synthesized_audio.frame):
                             output_emitter.push(rf.data.tobytes())
+                    else:
+                        output_emitter.push(synthesized_audio.frame.data.tobytes())
 
-                    return
-                except Exception:  # exceptions already logged inside _try_synthesize
-                    if tts_status.available:
-                        tts_status.available = False
-                        self._tts.emit(
-                            "tts_availability_changed",
-                            AvailabilityChangedEvent(tts=tts, available=False),
-                        )
+                if resampler is not None:
+                    for rf in resampler.flush():
+                        output_emitter.push(rf.data.tobytes())
 
-                    if output_emitter.pushed_duration() > 0.0:
-                        logger.warning(
-                            f"{tts.label} already synthesized of audio, ignoring fallback"
-                        )
-                        return
+                return
+            except Exception:  # exceptions already logged inside _try_synthesize
+                self._set_unavailable(tts)
+
+                if output_emitter.pushed_duration() > 0.0:
+                    logger.warning(f"{tts.label} already synthesized of audio, ignoring fallback")
+                    return
 
             self._try_recovery(tts)
+            i += 1
 
         raise APIConnectionError(
             f"all TTSs failed ({[tts.label for tts in self._tts._tts_instances]}) after {time.time() - start_time} seconds"  # noqa: E501
         )
 
+    def _set_unavailable(self, tts: TTS) -> None:
+        tts_status = self._fallback_adapter._status[
+            self._fallback_adapter._tts_instances.index(tts)
+        ]
+        if tts_status.available:
+            tts_status.available = False
+            self._fallback_adapter.emit(
+                "tts_availability_changed",
+                AvailabilityChangedEvent(tts=tts, available=False),
+            )
+
+    async def _race(self, i: int, *, all_failed: bool) -> hedging.HedgeResult[SynthesizedAudio]:
+        """Synthesize with the i-th TTS, hedged with the next one when hedging is enabled."""
+        tts_instances = self._fallback_adapter._tts_instances
+        trackers = self._fallback_adapter._hedge_trackers
+        tts = tts_instances[i]
+
+        hedge: Callable[[], AsyncGenerator[SynthesizedAudio, None]] | None = None
+        delay: float | None = None
+        if trackers is not None and i + 1 < len(tts_instances):
+            next_status = self._fallback_adapter._status[i + 1]
+            if next_status.available or all_failed:
+                hedge_tts = tts_instances[i + 1]
+                hedge = lambda: self._try_synthesize(tts=hedge_tts)  # noqa: E731
+                delay = trackers[i].hedge_delay()
+
+        result = await hedging.race(lambda: self._try_synthesize(tts=tts), hedge, delay=delay)
+
+        if trackers is not None:
+            if result.winner == 0:
+                trackers[i].add_sample(result.ttfr)
+            elif result.winner == 1 and result.hedge_started_at is not None:
+                trackers[i + 1].add_sample(result.ttfr - result.hedge_started_at)
+
+            metrics._update_fallback_hedge(
+                kind="tts",
+                result=result,
+                latency_saved=trackers[i].latency_saved(result, timeout=self._conn_options.timeout),
+            )
+
+        return result
+
 
 class FallbackSynthesizeStream(SynthesizeStream):
     _tts_request_span_name: ClassVar[str] = "tts_fallback_adapter"
@@ -791,7 +791,7 @@ class AudioEmitter:
             | AudioEmitter._StartSegment
             | AudioEmitter._EndSegment
             | TimedString
-        ]()
+        ](overflow="block", name="tts_audio")  # unbounded, the synthesized audio is never dropped
         self._main_atask = asyncio.create_task(self._main_task(), name="AudioEmitter._main_task")
 
         if not self._streaming:
@@ -1,5 +1,5 @@
-from . import debug, duplex_unix, itertools
-from .channel import Chan, ChanClosed, ChanReceiver, ChanSender
+from . import debug, duplex_unix, itertools, loop
+from .channel import Chan, ChanClosed, ChanOverflow, ChanReceiver, ChanSender, ChanStats
 from .counter import AsyncAtomicCounter
 from .interval import Interval, interval
 from .sleep import Sleep, SleepFinished, sleep
@@ -13,6 +13,8 @@ __all__ = [
     "Chan",
     "ChanSender",
     "ChanReceiver",
+    "ChanOverflow",
+    "ChanStats",
     "Interval",
     "interval",
     "Sleep",
@@ -24,6 +26,7 @@ __all__ = [
     "cancel_and_wait",
     "duplex_unix",
     "itertools",
+    "loop",
     "gracefully_cancel",
 ]
 
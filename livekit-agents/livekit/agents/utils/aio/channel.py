@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import time
 from collections import deque
-from collections.abc import AsyncIterator
-from typing import Generic, Protocol, TypeVar
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Generic, Literal, Protocol, TypeVar
 
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
@@ -26,6 +28,62 @@ class ChanEmpty(Exception):
     pass
 
 
+ChanOverflow = Literal["block", "drop_oldest", "drop_newest", "coalesce"]
+"""What a bounded channel does with a value sent while it is full.
+
+- ``"block"``: `send()` waits for room, `send_nowait()` raises `ChanFull`
+- ``"drop_oldest"``: drop the oldest queued value to make room
+- ``"drop_newest"``: drop the value being sent
+- ``"coalesce"``: merge the value being sent into the newest queued one
+"""
+
+
+@dataclass(frozen=True)
+class ChanStats:
+    qsize: int
+    """Values queued right now (0 for the stats of all the channels with a name)"""
+    high_water: int
+    """Most values queued at once"""
+    dropped: int
+    """Values dropped by the ``"drop_oldest"`` and ``"drop_newest"`` policies"""
+    coalesced: int
+    """Values merged into a queued one by the ``"coalesce"`` policy"""
+    max_age: float
+    """Longest time, in seconds, a value spent queued before being received"""
+
+
+class _ChanTotals:
+    """Stats shared by all the channels with the same name, reported by the telemetry."""
+
+    __slots__ = ("dropped", "coalesced", "high_water", "max_age")
+
+    def __init__(self) -> None:
+        self.dropped = 0
+        self.coalesced = 0
+        # since the last _take_named_stats()
+        self.high_water = 0
+        self.max_age = 0.0
+
+
+_named_totals: dict[str, _ChanTotals] = {}
+
+
+def _take_named_stats() -> dict[str, ChanStats]:
+    """Stats of the named channels: drops since the start of the process, high-water mark and
+    queue age since the previous call."""
+    stats = {}
+    for name, totals in _named_totals.items():
+        stats[name] = ChanStats(
+            qsize=0,
+            high_water=totals.high_water,
+            dropped=totals.dropped,
+            coalesced=totals.coalesced,
+            max_age=totals.max_age,
+        )
+        totals.high_water, totals.max_age = 0, 0.0
+    return stats
+
+
 class ChanSender(Protocol[T_contra]):
     async def send(self, value: T_contra) -> None: ...
 
@@ -51,15 +109,50 @@ class Chan(Generic[T]):
         self,
         maxsize: int = 0,
         loop: asyncio.AbstractEventLoop | None = None,
+        *,
+        overflow: ChanOverflow = "block",
+        droppable: Callable[[T], bool] | None = None,
+        coalesce: Callable[[T, T], T | None] | None = None,
+        name: str | None = None,
     ) -> None:
+        """
+        Args:
+            maxsize: Number of values the channel holds before it is full, unbounded if <= 0.
+            overflow: What to do with a value sent while the channel is full, see `ChanOverflow`.
+            droppable: With the drop policies, whether a value may be dropped. Values that can't
+                be (e.g. end of segment markers) are queued even if the channel is full.
+            coalesce: With ``overflow="coalesce"``, merges the newest queued value with the one
+                being sent, returns None when they can't be merged (the value is then queued).
+            name: Name the stats of the channel are reported under by the telemetry, channels
+                with the same name are aggregated.
+        """
+        if overflow not in ("block", "drop_oldest", "drop_newest", "coalesce"):
+            raise ValueError(f"invalid overflow policy: {overflow!r}")
+        if overflow != "block" and maxsize <= 0:
+            raise ValueError(f"overflow={overflow!r} requires a bounded channel (maxsize > 0)")
+        if (overflow == "coalesce") != (coalesce is not None):
+            raise ValueError("coalesce must be given with, and only with, overflow='coalesce'")
+
         self._loop = loop or asyncio.get_event_loop()
         self._maxsize = max(maxsize, 0)
+        self._overflow = overflow
+        self._droppable = droppable
+        self._coalesce = coalesce
         #        self._finished_ev = asyncio.Event()
         self._close_ev = asyncio.Event()
         self._closed = False
         self._gets: deque[asyncio.Future[T | None]] = deque()
         self._puts: deque[asyncio.Future[T | None]] = deque()
         self._queue: deque[T] = deque()
+        self._sent_at: deque[float] = deque()
+
+        self._high_water = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._max_age = 0.0
+        self._totals: _ChanTotals | None = None
+        if name is not None:
+            self._totals = _named_totals.setdefault(name, _ChanTotals())
 
     def _wakeup_next(self, waiters: deque[asyncio.Future[T | None]]) -> None:
         while waiters:
@@ -69,7 +162,7 @@ class Chan(Generic[T]):
                 break
 
     async def send(self, value: T) -> None:
-        while self.full() and not self._close_ev.is_set():
+        while self._overflow == "block" and self.full() and not self._close_ev.is_set():
             p = self._loop.create_future()
             self._puts.append(p)
             try:
@@ -91,12 +184,57 @@ class Chan(Generic[T]):
         if self._close_ev.is_set():
             raise ChanClosed
 
-        if self.full():
-            raise ChanFull
+        if self.full() and not self._overflow_nowait(value):
+            return
 
         self._queue.append(value)
+        self._sent_at.append(time.perf_counter())
+        qsize = len(self._queue)
+        if qsize > self._high_water:
+            self._high_water = qsize
+        if self._totals is not None and qsize > self._totals.high_water:
+            self._totals.high_water = qsize
         self._wakeup_next(self._gets)
 
+    def _overflow_nowait(self, value: T) -> bool:
+        """Apply the overflow policy to a value sent while the channel is full, returns whether
+        the value must still be queued."""
+        if self._overflow == "block":
+            raise ChanFull
+
+        if self._overflow == "coalesce":
+            assert self._coalesce is not None
+            merged = self._coalesce(self._queue[-1], value)
+            if merged is None:
+                return True
+            # the merged value keeps the age of the queued one
+            self._queue[-1] = merged
+            self._coalesced += 1
+            if self._totals is not None:
+                self._totals.coalesced += 1
+            return False
+
+        droppable = self._droppable
+        if self._overflow == "drop_newest":
+            if droppable is not None and not droppable(value):
+                return True
+            self._record_drop()
+            return False
+
+        # drop_oldest
+        for idx, queued in enumerate(self._queue):
+            if droppable is None or droppable(queued):
+                del self._queue[idx]
+                del self._sent_at[idx]
+                self._record_drop()
+                break
+        return True
+
+    def _record_drop(self) -> None:
+        self._dropped += 1
+        if self._totals is not None:
+            self._totals.dropped += 1
+
     async def recv(self) -> T:
         while self.empty() and not self._close_ev.is_set():
             g = self._loop.create_future()
@@ -125,6 +263,11 @@ class Chan(Generic[T]):
             else:
                 raise ChanEmpty
         item = self._queue.popleft()
+        age = time.perf_counter() - self._sent_at.popleft()
+        if age > self._max_age:
+            self._max_age = age
+        if self._totals is not None and age > self._totals.max_age:
+            self._totals.max_age = age
         #        if self.empty() and self._close_ev.is_set():
         #            self._finished_ev.set()
         self._wakeup_next(self._puts)
@@ -159,6 +302,16 @@ class Chan(Generic[T]):
         """the number of elements queued (unread) in the channel buffer"""
         return len(self._queue)
 
+    def stats(self) -> ChanStats:
+        """queue depth, drops and queue age since the channel was created"""
+        return ChanStats(
+            qsize=len(self._queue),
+            high_water=self._high_water,
+            dropped=self._dropped,
+            coalesced=self._coalesced,
+            max_age=self._max_age,
+        )
+
     def full(self) -> bool:
         if self._maxsize <= 0:
             return False
@@ -1,9 +1,9 @@
 import asyncio
+import time
 from collections import deque
 from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Iterator
-from typing import Any, Generic, Protocol, TypeVar, overload, runtime_checkable
-
-from typing_extensions import AsyncContextManager
+from dataclasses import dataclass
+from typing import Any, Generic, Literal, Protocol, TypeVar, overload, runtime_checkable
 
 # based on https://github.com/maxfischer2781/asyncstdlib/blob/master/asyncstdlib/itertools.py
 
@@ -16,80 +16,184 @@ class _ACloseable(Protocol):
 
 T = TypeVar("T")
 
+TeeOverflow = Literal["block", "drop_oldest", "detach"]
+"""What a bounded Tee does when a peer's buffer is full and another peer needs the next item.
+
+- ``"block"``: wait until the slow peer consumed an item (backpressure on the faster peers)
+- ``"drop_oldest"``: drop the oldest item of the slow peer
+- ``"detach"``: stop feeding the slow peer, it raises `TeePeerDetached` once its buffer is drained
+"""
+
+
+class TeePeerDetached(Exception):
+    """Raised by a peer of a bounded Tee detached for falling too far behind."""
+
+
+@dataclass(frozen=True)
+class TeePeerStats:
+    lag: int
+    """Items buffered for the peer, i.e. how far behind the fastest peer it is"""
+    max_lag: int
+    """Highest lag seen so far"""
+    dropped: int
+    """Items dropped with the ``"drop_oldest"`` overflow policy"""
+    blocked: float
+    """Time, in seconds, the other peers waited for this one with the ``"block"`` overflow policy"""
+    detached: bool
+    """Whether the peer was detached with the ``"detach"`` overflow policy"""
+
+
+class _TeeBuffer(Generic[T]):
+    __slots__ = ("items", "max_lag", "dropped", "blocked", "detached")
+
+    def __init__(self) -> None:
+        self.items: deque[T] = deque()
+        self.max_lag = 0
+        self.dropped = 0
+        self.blocked = 0.0
+        self.detached = False
+
+    def stats(self) -> TeePeerStats:
+        return TeePeerStats(
+            lag=len(self.items),
+            max_lag=self.max_lag,
+            dropped=self.dropped,
+            blocked=self.blocked,
+            detached=self.detached,
+        )
+
+
+class _TeeState(Generic[T]):
+    """State shared by the peers of a Tee."""
+
+    __slots__ = ("peers", "lock", "exception", "maxsize", "overflow", "space")
+
+    def __init__(self, peers: list[_TeeBuffer[T]], maxsize: int, overflow: TeeOverflow) -> None:
+        self.peers = peers
+        self.lock = asyncio.Lock()
+        self.exception: BaseException | None = None
+        self.maxsize = maxsize
+        self.overflow = overflow
+        # set when a full peer consumed an item, with the "block" policy
+        self.space = asyncio.Event()
+
+    async def wait_for_space(self, buffer: _TeeBuffer[T]) -> None:
+        while full := [p for p in self.peers if p is not buffer and len(p.items) >= self.maxsize]:
+            self.space.clear()
+            started_at = time.perf_counter()
+            try:
+                await self.space.wait()
+            finally:
+                # blame the wait on the slowest peer
+                full[0].blocked += time.perf_counter() - started_at
+
+    def dispatch(self, item: T) -> None:
+        for peer in list(self.peers):
+            if self.maxsize and len(peer.items) >= self.maxsize:
+                if self.overflow == "drop_oldest":
+                    peer.items.popleft()
+                    peer.dropped += 1
+                elif self.overflow == "detach":
+                    peer.detached = True
+                    self.peers.remove(peer)
+                    continue
+
+            peer.items.append(item)
+            if len(peer.items) > peer.max_lag:
+                peer.max_lag = len(peer.items)
+
 
 async def tee_peer(
     iterator: AsyncIterator[T],
-    buffer: deque[T],
-    peers: list[deque[T]],
-    lock: AsyncContextManager[Any],
-    exception: list[BaseException | None],
+    buffer: _TeeBuffer[T],
+    state: _TeeState[T],
 ) -> AsyncGenerator[T, None]:
-    # exception is a shared mutable container across all peers. When the upstream
+    # state.exception is shared across all peers. When the upstream
     # iterator raises, only the first peer to call __anext__() would normally see
     # the error — subsequent calls return StopAsyncIteration per Python async
     # generator semantics, silently swallowing the error for other peers.
     #
-    # To fix this, the first peer to hit the exception stores it in exception[0].
+    # To fix this, the first peer to hit the exception stores it in state.exception.
     # Other peers check this before advancing the iterator and re-raise the same
     # exception, ensuring all peers observe the upstream failure.
     try:
         while True:
-            if not buffer:
-                async with lock:
-                    if buffer:
+            if not buffer.items:
+                if buffer.detached:
+                    raise TeePeerDetached(
+                        f"tee peer detached after falling {state.maxsize} items behind"
+                    )
+                async with state.lock:
+                    if buffer.items or buffer.detached:
                         continue
                     # a peer already hit an upstream error — re-raise for this peer
-                    if exception[0] is not None:
-                        raise exception[0]
+                    if state.exception is not None:
+                        raise state.exception
+                    if state.maxsize and state.overflow == "block":
+                        await state.wait_for_space(buffer)
                     try:
                         item = await iterator.__anext__()
                     except StopAsyncIteration:
                         break
                     except asyncio.CancelledError:
                         # CancelledError is task-specific — don't store it in the
-                        # shared exception list to avoid cascading to other peers
+                        # shared exception to avoid cascading to other peers
                         raise
                     except BaseException as e:
-                        exception[0] = e
+                        state.exception = e
                         raise
                     else:
-                        for peer_buffer in peers:
-                            peer_buffer.append(item)
-            yield buffer.popleft()
+                        state.dispatch(item)
+            item = buffer.items.popleft()
+            if state.maxsize and len(buffer.items) == state.maxsize - 1:
+                # wake up the peers waiting for this one before handing the item out, this
+                # peer may need the lock they hold for its next item
+                state.space.set()
+            yield item
     finally:
-        for idx, peer_buffer in enumerate(peers):  # pragma: no branch
-            if peer_buffer is buffer:
-                peers.pop(idx)
-                break
+        if buffer in state.peers:
+            state.peers.remove(buffer)
+            # the remaining peers must not wait for this one anymore
+            state.space.set()
 
-        if not peers and isinstance(iterator, _ACloseable):
+        if not state.peers and isinstance(iterator, _ACloseable):
             await iterator.aclose()
 
 
 class Tee(Generic[T]):
-    __slots__ = ("_iterator", "_buffers", "_children")
+    """Split an async iterable into ``n`` independent async iterators.
+
+    Items are buffered per peer until it consumed them. By default the buffers are unbounded, so
+    a stalled peer makes memory grow while the other ones keep going; ``maxsize`` bounds them
+    and ``overflow`` picks what happens to a peer that falls ``maxsize`` items behind.
+    `stats()` reports how far behind each peer is.
+    """
+
+    __slots__ = ("_iterator", "_buffers", "_children", "_state")
 
     def __init__(
         self,
         iterator: AsyncIterable[T],
         n: int = 2,
+        *,
+        maxsize: int = 0,
+        overflow: TeeOverflow = "block",
     ):
-        self._iterator = iterator.__aiter__()
-        self._buffers: list[deque[T]] = [deque() for _ in range(n)]
+        if overflow not in ("block", "drop_oldest", "detach"):
+            raise ValueError(f"invalid overflow policy: {overflow!r}")
 
-        lock = asyncio.Lock()
-        exception: list[BaseException | None] = [None]
+        self._iterator = iterator.__aiter__()
+        self._buffers: tuple[_TeeBuffer[T], ...] = tuple(_TeeBuffer() for _ in range(n))
+        self._state = _TeeState(list(self._buffers), max(maxsize, 0), overflow)
         self._children = tuple(
-            tee_peer(
-                iterator=self._iterator,
-                buffer=buffer,
-                peers=self._buffers,
-                lock=lock,
-                exception=exception,
-            )
+            tee_peer(iterator=self._iterator, buffer=buffer, state=self._state)
             for buffer in self._buffers
         )
 
+    def stats(self) -> list[TeePeerStats]:
+        """Lag counters of each peer, in the order of the peers."""
+        return [buffer.stats() for buffer in self._buffers]
+
     def __len__(self) -> int:
         return len(self._children)
 
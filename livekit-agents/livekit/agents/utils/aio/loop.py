@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable
+from typing import Literal, TypeAlias
+
+from ...log import logger
+
+EventLoopFactory: TypeAlias = Callable[[], asyncio.AbstractEventLoop]
+EventLoopType: TypeAlias = Literal["asyncio", "uvloop"] | EventLoopFactory
+
+# maximum time each step of the compatibility check may take
+_CHECK_TIMEOUT = 5.0
+
+
+def _uvloop_factory() -> asyncio.AbstractEventLoop:
+    try:
+        import uvloop
+    except ImportError:
+        raise ImportError(
+            "event_loop='uvloop' requires uvloop, install it with `pip install livekit-agents[uvloop]`"
+        ) from None
+
+    loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
+    return loop
+
+
+def _loop_factory(event_loop: EventLoopType) -> EventLoopFactory:
+    if event_loop == "asyncio":
+        return asyncio.new_event_loop
+    if event_loop == "uvloop":
+        return _uvloop_factory
+    if callable(event_loop):
+        return event_loop
+    raise ValueError(f"unknown event loop: {event_loop!r}")
+
+
+async def _check_loop_compat() -> None:
+    """Exercise the loop APIs the framework relies on to hand work between threads"""
+    loop = asyncio.get_running_loop()
+
+    # blocking work offloaded to the default executor (inference, file I/O, encoders)
+    ident = await asyncio.wait_for(loop.run_in_executor(None, threading.get_ident), _CHECK_TIMEOUT)
+    if ident == threading.get_ident():
+        raise RuntimeError("run_in_executor ran the function on the event loop thread")
+
+    # callbacks scheduled from a native/worker thread must wake up a loop blocked in select
+    woken = loop.create_future()
+
+    def _wake() -> None:
+        loop.call_soon_threadsafe(woken.set_result, threading.get_ident())
+
+    threading.Timer(0.01, _wake).start()
+    await asyncio.wait_for(woken, _CHECK_TIMEOUT)
+
+    # coroutines submitted from another thread (e.g. the console and the rtc callbacks)
+    async def _coro() -> asyncio.Task[object] | None:
+        return asyncio.current_task()
+
+    def _submit() -> asyncio.Task[object] | None:
+        return asyncio.run_coroutine_threadsafe(_coro(), loop).result(_CHECK_TIMEOUT)
+
+    task = await asyncio.wait_for(asyncio.to_thread(_submit), _CHECK_TIMEOUT)
+    if task is None:
+        raise RuntimeError("asyncio.current_task() returned None inside a task")
+
+
+def new_event_loop(event_loop: EventLoopType = "asyncio") -> asyncio.AbstractEventLoop:
+    """Create the event loop used by the worker, job and inference processes.
+
+    An alternative loop (``"uvloop"`` or a factory) first goes through a compatibility check of
+    ``run_in_executor``, ``call_soon_threadsafe`` and ``run_coroutine_threadsafe``, the default
+    asyncio loop is used instead if it fails.
+    """
+    if event_loop == "asyncio":
+        return asyncio.new_event_loop()
+
+    loop = _loop_factory(event_loop)()
+    try:
+        loop.run_until_complete(_check_loop_compat())
+    except Exception as e:
+        logger.warning(
+            "event loop failed the compatibility check, falling back to asyncio",
+            extra={"event_loop": type(loop).__module__ + "." + type(loop).__qualname__},
+            exc_info=e,
+        )
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+        return asyncio.new_event_loop()
+
+    return loop
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import ctypes
+import struct
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass
 
-import aiofiles
 import numpy as np
 from numpy.typing import DTypeLike
 
@@ -216,31 +217,170 @@ class AudioByteStream:
         self._current_bytes_per_frame = self._initial_bytes_per_frame
 
 
-async def audio_frames_from_file(
-    file_path: str, sample_rate: int = 48000, num_channels: int = 1
+# the first block is small so the first frames come quickly, then one executor round trip per
+# block instead of one per 4KiB
+_FILE_FIRST_BLOCK_SIZE = 64 * 1024
+_FILE_BLOCK_SIZE = 1024 * 1024
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+@dataclass(frozen=True)
+class _WavFormat:
+    sample_rate: int
+    num_channels: int
+    data_offset: int
+    data_size: int | None
+    """None when the header doesn't know it (streamed WAV), the samples run to the end of the file"""
+
+
+def _parse_wav_header(head: bytes) -> _WavFormat | None:
+    """Format of a 16-bit PCM WAV file from its first bytes, None for any other file or if the
+    data chunk doesn't start in `head`"""
+    if len(head) < 12 or head[:4] != b"RIFF" or head[8:12] != b"WAVE":
+        return None
+
+    fmt: tuple[int, int, int] | None = None
+    pos = 12
+    while pos + 8 <= len(head):
+        chunk_id, chunk_size = struct.unpack_from("<4sI", head, pos)
+        pos += 8
+        if chunk_id == b"fmt ":
+            if chunk_size < 16 or pos + chunk_size > len(head):
+                return None
+            audio_format, channels, rate = struct.unpack_from("<HHI", head, pos)
+            (bits_per_sample,) = struct.unpack_from("<H", head, pos + 14)
+            if audio_format == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 26:
+                # the format is in the first two bytes of the sub-format GUID
+                (audio_format,) = struct.unpack_from("<H", head, pos + 24)
+            if audio_format != _WAVE_FORMAT_PCM or bits_per_sample != 16 or channels == 0:
+                return None
+            fmt = (rate, channels, bits_per_sample)
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            return _WavFormat(
+                sample_rate=fmt[0],
+                num_channels=fmt[1],
+                data_offset=pos,
+                data_size=None if chunk_size in (0, 0xFFFFFFFF) else chunk_size,
+            )
+        pos += chunk_size + (chunk_size & 1)  # chunks are padded to an even size
+
+    return None
+
+
+class _PcmConverter:
+    """Converts 16-bit PCM to frames of the requested format, on the event loop: channels are
+    mixed with numpy and resampled with one rtc.AudioResampler push per block."""
+
+    def __init__(
+        self,
+        *,
+        input_rate: int,
+        input_channels: int,
+        sample_rate: int,
+        num_channels: int,
+        samples_per_channel: int | None,
+    ) -> None:
+        self._input_rate = input_rate
+        self._input_channels = input_channels
+        self._num_channels = num_channels
+        self._input_frame_size = 2 * input_channels
+        self._pending = b""
+        self._resampler: rtc.AudioResampler | None = None
+        if input_rate != sample_rate:
+            self._resampler = rtc.AudioResampler(input_rate, sample_rate, num_channels=num_channels)
+        self._bstream = AudioByteStream(
+            sample_rate, num_channels, samples_per_channel=samples_per_channel
+        )
+
+    def push(self, data: bytes) -> list[rtc.AudioFrame]:
+        if self._pending:
+            data = self._pending + data
+        usable = len(data) - len(data) % self._input_frame_size
+        self._pending = data[usable:]
+        if not usable:
+            return []
+
+        pcm: bytes | memoryview = memoryview(data)[:usable]
+        if self._input_channels != self._num_channels:
+            samples = np.frombuffer(pcm, dtype=np.int16).reshape(-1, self._input_channels)
+            mono = samples.sum(axis=1, dtype=np.int32) // self._input_channels
+            pcm = np.repeat(mono.astype(np.int16), self._num_channels).tobytes()
+
+        if self._resampler is None:
+            return self._bstream.push(pcm)
+
+        frame = rtc.AudioFrame(
+            data=pcm,
+            sample_rate=self._input_rate,
+            num_channels=self._num_channels,
+            samples_per_channel=len(pcm) // (2 * self._num_channels),
+        )
+        frames = []
+        for resampled in self._resampler.push(frame):
+            frames.extend(self._bstream.push(resampled.data))
+        return frames
+
+    def flush(self) -> list[rtc.AudioFrame]:
+        frames = []
+        if self._resampler is not None:
+            for resampled in self._resampler.flush():
+                frames.extend(self._bstream.push(resampled.data))
+        frames.extend(self._bstream.flush())
+        return frames
+
+
+async def _read_file_blocks(file_path: str) -> AsyncGenerator[bytes, None]:
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(None, open, file_path, "rb")
+    try:
+        size = _FILE_FIRST_BLOCK_SIZE
+        while block := await loop.run_in_executor(None, f.read, size):
+            yield block
+            size = _FILE_BLOCK_SIZE
+    finally:
+        f.close()
+
+
+async def _wav_frames(
+    wav: _WavFormat,
+    head: bytes,
+    blocks: AsyncGenerator[bytes, None],
+    converter: _PcmConverter,
+) -> AsyncGenerator[rtc.AudioFrame, None]:
+    remaining = wav.data_size
+    block = head[wav.data_offset :]
+    while True:
+        if remaining is not None:
+            block = block[:remaining]
+            remaining -= len(block)
+        for frame in converter.push(block):
+            yield frame
+        if remaining == 0 or not (block := await anext(blocks, b"")):
+            break
+
+    for frame in converter.flush():
+        yield frame
+
+
+async def _decoded_frames(
+    head: bytes,
+    blocks: AsyncGenerator[bytes, None],
+    sample_rate: int,
+    num_channels: int,
 ) -> AsyncGenerator[rtc.AudioFrame, None]:
-    """
-    Decode the audio file into rtc.AudioFrame instances and yield them as an async iterable.
-    Args:
-        file_path (str): The path to the audio file.
-        sample_rate (int, optional): Desired sample rate. Defaults to 48000.
-        num_channels (int, optional): Number of channels (1 for mono, 2 for stereo). Defaults to 1.
-    Returns:
-        AsyncIterable[rtc.AudioFrame]: An async iterable that yields decoded AudioFrame
-    """
     from .codecs import AudioStreamDecoder
 
     decoder = AudioStreamDecoder(sample_rate=sample_rate, num_channels=num_channels)
 
     async def file_reader() -> None:
         try:
-            async with aiofiles.open(file_path, mode="rb") as f:
-                while True:
-                    chunk = await f.read(4096)
-                    if not chunk:
-                        break
-
-                    decoder.push(chunk)
+            decoder.push(head)
+            async for block in blocks:
+                decoder.push(block)
         finally:
             decoder.end_input()
 
@@ -253,12 +393,72 @@ async def audio_frames_from_file(
         await cancel_and_wait(reader_task)
         await decoder.aclose()
 
-    # propagate file reader errors (e.g. FileNotFoundError for missing files)
+    # propagate file reader errors
     if reader_task.done() and not reader_task.cancelled():
         if exc := reader_task.exception():
             raise exc
 
 
+async def audio_frames_from_file(
+    file_path: str,
+    sample_rate: int = 48000,
+    num_channels: int = 1,
+    *,
+    samples_per_channel: int | None = None,
+) -> AsyncGenerator[rtc.AudioFrame, None]:
+    """
+    Decode the audio file into rtc.AudioFrame instances and yield them as an async iterable.
+
+    The file is read in large blocks on the default executor. 16-bit PCM WAV files aren't
+    decoded, their samples are converted on the event loop; other formats go through
+    `AudioStreamDecoder`.
+
+    Args:
+        file_path (str): The path to the audio file.
+        sample_rate (int, optional): Desired sample rate. Defaults to 48000.
+        num_channels (int, optional): Number of channels (1 for mono, 2 for stereo). Defaults to 1.
+        samples_per_channel (int, optional): Size of the yielded frames (the last one may be
+            shorter). Defaults to 100ms for WAV files and to the frames of the codec otherwise.
+    Returns:
+        AsyncIterable[rtc.AudioFrame]: An async iterable that yields decoded AudioFrame
+    """
+    blocks = _read_file_blocks(file_path)
+    try:
+        head = await anext(blocks, b"")
+        frames: AsyncGenerator[rtc.AudioFrame, None]
+        rechunk: AudioByteStream | None = None
+        if wav := _parse_wav_header(head):
+            converter = _PcmConverter(
+                input_rate=wav.sample_rate,
+                input_channels=wav.num_channels,
+                sample_rate=sample_rate,
+                num_channels=num_channels,
+                samples_per_channel=samples_per_channel,
+            )
+            frames = _wav_frames(wav, head, blocks, converter)
+        else:
+            frames = _decoded_frames(head, blocks, sample_rate, num_channels)
+            if samples_per_channel is not None:
+                rechunk = AudioByteStream(
+                    sample_rate, num_channels, samples_per_channel=samples_per_channel
+                )
+
+        try:
+            async for frame in frames:
+                if rechunk is None:
+                    yield frame
+                    continue
+                for chunk in rechunk.push(frame.data):
+                    yield chunk
+            if rechunk is not None:
+                for chunk in rechunk.flush():
+                    yield chunk
+        finally:
+            await frames.aclose()
+    finally:
+        await blocks.aclose()
+
+
 class AudioArrayBuffer:
     def __init__(self, *, buffer_size: int, dtype: DTypeLike = np.int16, sample_rate: int = 16000):
         """Create a fixed-size buffer for audio array data.
@@ -290,6 +490,15 @@ class AudioArrayBuffer:
         if frame.samples_per_channel > self._buffer_size:
             raise ValueError("frame samples are greater than the buffer size")
 
+        samples = self._frame_samples(frame)
+        if (shift_size := self._start_idx + len(samples) - self._buffer_size) > 0:
+            self.shift(shift_size)
+        self._buffer[self._start_idx : self._start_idx + len(samples)] = samples
+        self._start_idx += len(samples)
+        return len(samples)
+
+    def _frame_samples(self, frame: rtc.AudioFrame) -> np.ndarray:
+        """Resample the frame to the buffer's sample rate and downmix it to mono."""
         frames: list[rtc.AudioFrame] = []
         if self._resampler is None and frame.sample_rate != self._sample_rate:
             self._resampler = rtc.AudioResampler(
@@ -308,20 +517,13 @@ class AudioArrayBuffer:
 
         frame = merge_frames(frames)
 
-        if (shift_size := self._start_idx + frame.samples_per_channel - self._buffer_size) > 0:
-            self.shift(shift_size)
-        ptr = self._buffer[self._start_idx : self._start_idx + frame.samples_per_channel]
         if frame.num_channels > 1:
             arr_i16 = np.frombuffer(
                 frame.data, dtype=np.int16, count=frame.samples_per_channel * frame.num_channels
             ).reshape(-1, frame.num_channels)
-            ptr[:] = (np.sum(arr_i16, axis=1, dtype=np.int32) // frame.num_channels).astype(
-                np.int16
-            )
-        else:
-            ptr[:] = np.frombuffer(frame.data, dtype=np.int16, count=frame.samples_per_channel)
-        self._start_idx += frame.samples_per_channel
-        return frame.samples_per_channel
+            mixed = arr_i16.sum(axis=1, dtype=np.int32) // frame.num_channels
+            return np.asarray(mixed, dtype=np.int16)
+        return np.frombuffer(frame.data, dtype=np.int16, count=frame.samples_per_channel)
 
     def shift(self, size: int) -> None:
         """Shift the buffer to the left by the given size.
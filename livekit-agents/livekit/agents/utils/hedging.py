@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Generic, Literal, TypeVar
+
+from . import aio
+
+T = TypeVar("T")
+
+# number of recent time-to-first-result samples used by the "auto" hedge delay
+_AUTO_WINDOW_SIZE = 100
+# "auto" doesn't hedge until the provider has this many samples
+_AUTO_MIN_SAMPLES = 20
+_AUTO_PERCENTILE = 0.95
+
+
+class HedgeTracker:
+    """Tracks the time to first result of a provider and decides when to hedge it.
+
+    With a fixed delay, a request is hedged once it has been silent for that long. With
+    ``"auto"``, the delay is the rolling p95 of the provider's own time to first result, so only
+    the slowest ~5% of requests get hedged.
+    """
+
+    def __init__(
+        self,
+        delay: float | Literal["auto"],
+        *,
+        window_size: int = _AUTO_WINDOW_SIZE,
+        min_samples: int = _AUTO_MIN_SAMPLES,
+    ) -> None:
+        self._delay = delay
+        self._min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window_size)
+
+    def add_sample(self, ttfr: float) -> None:
+        self._samples.append(ttfr)
+
+    def hedge_delay(self) -> float | None:
+        """delay after which the request should be hedged, None to not hedge yet"""
+        if self._delay != "auto":
+            return self._delay
+
+        if len(self._samples) < self._min_samples:
+            return None
+
+        ordered = sorted(self._samples)
+        return ordered[min(int(len(ordered) * _AUTO_PERCENTILE), len(ordered) - 1)]
+
+    def latency_saved(self, result: HedgeResult[T], *, timeout: float) -> float:
+        """Estimate how much sooner the hedge produced its first result than the primary would
+        have, without hedging.
+
+        The primary is cancelled when the hedge wins, so its own latency is never observed. It is
+        estimated from the recorded samples slower than the hedge; without any, the baseline is
+        the sequential fallback: wait for the primary to time out, then start the next provider.
+        """
+        if result.winner != 1 or result.hedge_started_at is None:
+            return 0.0
+
+        slower = [s for s in self._samples if s > result.ttfr]
+        if slower:
+            baseline = sum(slower) / len(slower)
+        else:
+            baseline = timeout + (result.ttfr - result.hedge_started_at)
+
+        return max(baseline - result.ttfr, 0.0)
+
+
+@dataclass
+class HedgeResult(Generic[T]):
+    winner: int | None
+    """0 if the primary won, 1 if the hedge won, None if every attempt failed"""
+    stream: AsyncIterator[T]
+    """results of the winner, starting with its first one"""
+    ttfr: float = 0.0
+    """time from the start of the race to the first result of the winner"""
+    hedge_started_at: float | None = None
+    """time from the start of the race to the start of the hedge, None if it was never started"""
+    errors: list[tuple[int, Exception]] = field(default_factory=list)
+    """attempts that failed before producing a result"""
+
+    @property
+    def hedged(self) -> bool:
+        return self.hedge_started_at is not None
+
+
+async def _empty() -> AsyncGenerator[T, None]:
+    return
+    yield
+
+
+async def _chain(first: T, rest: AsyncGenerator[T, None]) -> AsyncGenerator[T, None]:
+    try:
+        yield first
+        async for item in rest:
+            yield item
+    finally:
+        await rest.aclose()
+
+
+async def race(
+    primary: Callable[[], AsyncGenerator[T, None]],
+    hedge: Callable[[], AsyncGenerator[T, None]] | None = None,
+    *,
+    delay: float | None = None,
+) -> HedgeResult[T]:
+    """Start ``primary`` and, if it hasn't produced a result after ``delay`` seconds (or failed
+    before that), start ``hedge`` in parallel. The first attempt to produce a result wins and
+    the other one is cancelled.
+
+    An attempt that completes without producing anything also wins, with an empty stream.
+    Exceptions raised before the first result are collected in ``HedgeResult.errors``.
+    """
+    start_time = time.perf_counter()
+    attempts: list[AsyncGenerator[T, None]] = []
+    pending: dict[asyncio.Future[T], int] = {}
+    result = HedgeResult[T](winner=None, stream=_empty())
+
+    def _start(factory: Callable[[], AsyncGenerator[T, None]]) -> None:
+        gen = factory()
+        pending[asyncio.ensure_future(gen.__anext__())] = len(attempts)
+        attempts.append(gen)
+
+    def _start_hedge() -> None:
+        assert hedge is not None
+        result.hedge_started_at = time.perf_counter() - start_time
+        _start(hedge)
+
+    _start(primary)
+    try:
+        while pending:
+            timeout: float | None = None
+            if hedge is not None and delay is not None and len(attempts) == 1:
+                timeout = max(delay - (time.perf_counter() - start_time), 0.0)
+
+            done, _ = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                _start_hedge()  # the primary is too slow
+                continue
+
+            for fut in sorted(done, key=lambda f: pending[f]):
+                index = pending.pop(fut)
+                try:
+                    first = fut.result()
+                except StopAsyncIteration:
+                    result.winner = index
+                except Exception as e:
+                    result.errors.append((index, e))
+                    if hedge is not None and len(attempts) == 1:
+                        _start_hedge()
+                    continue
+                else:
+                    result.winner = index
+                    result.stream = _chain(first, attempts[index])
+
+                result.ttfr = time.perf_counter() - start_time
+                return result
+
+        return result
+    finally:
+        # cancel the loser(s), the winner's generator is now owned by result.stream
+        await aio.cancel_and_wait(*pending)
+        for fut, index in pending.items():
+            if not fut.cancelled() and isinstance(exc := fut.exception(), Exception):
+                if not isinstance(exc, StopAsyncIteration):
+                    result.errors.append((index, exc))
+
+        for index, gen in enumerate(attempts):
+            if index != result.winner:
+                await gen.aclose()
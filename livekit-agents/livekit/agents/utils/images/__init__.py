@@ -12,9 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .image import EncodeOptions, ResizeOptions, encode
+from .image import (
+    EncodeOptions,
+    ResizeOptions,
+    encode,
+    encode_async,
+    hash_distance,
+    perceptual_hash,
+)
 
-__all__ = ["EncodeOptions", "ResizeOptions", "encode"]
+__all__ = [
+    "EncodeOptions",
+    "ResizeOptions",
+    "encode",
+    "encode_async",
+    "perceptual_hash",
+    "hash_distance",
+]
 
 # Cleanup docs of unexported modules
 _module = dir()
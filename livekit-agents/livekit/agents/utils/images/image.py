@@ -12,11 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from importlib import import_module
 from typing import TYPE_CHECKING, Literal, Optional
 
+import numpy as np
+
 from livekit import rtc
 
 if TYPE_CHECKING:
@@ -73,13 +78,39 @@ def import_pil() -> None:
         ) from None
 
 
+# shared by every encode_async() call of the process, JPEG/PNG encoding and resizing release the GIL
+_ENCODE_MAX_WORKERS = 2
+_encode_executor: ThreadPoolExecutor | None = None
+_encode_executor_lock = threading.Lock()
+
+# I420 frames are decoded camera/screen-share tracks, they can be scaled before color conversion
+_YUV420_TYPES = (rtc.VideoBufferType.I420, rtc.VideoBufferType.I420A)
+# 8-bit formats starting with a full resolution Y plane
+_LUMA_FIRST_TYPES = (
+    *_YUV420_TYPES,
+    rtc.VideoBufferType.I422,
+    rtc.VideoBufferType.I444,
+    rtc.VideoBufferType.NV12,
+)
+# index of the R, G and B channels of the 32-bit formats
+_RGB_CHANNELS = {
+    rtc.VideoBufferType.RGBA: (0, 1, 2),
+    rtc.VideoBufferType.BGRA: (2, 1, 0),
+    rtc.VideoBufferType.ARGB: (1, 2, 3),
+    rtc.VideoBufferType.ABGR: (3, 2, 1),
+}
+
+
 def encode(frame: rtc.VideoFrame, options: EncodeOptions) -> bytes:
     """Encode a rtc.VideoFrame to a portable image format (JPEG or PNG).
 
+    When the frame is downscaled, I420 frames are scaled in the YUV domain first so the color
+    conversion only runs at the output size.
+
     See EncodeOptions for more details.
     """
     import_pil()
-    img = _image_from_frame(frame)
+    img = _image_from_frame(frame, _scaled_size(frame.width, frame.height, options))
     resized = _resize_image(img, options)
     buffer = io.BytesIO()
     kwargs = {}
@@ -90,14 +121,114 @@ def encode(frame: rtc.VideoFrame, options: EncodeOptions) -> bytes:
     return buffer.read()
 
 
-def _image_from_frame(frame: rtc.VideoFrame) -> "Image.Image":
+async def encode_async(frame: rtc.VideoFrame, options: EncodeOptions) -> bytes:
+    """Like encode(), but runs in a worker thread shared by the process to keep the event loop
+    free."""
+    global _encode_executor
+
+    with _encode_executor_lock:
+        if _encode_executor is None:
+            _encode_executor = ThreadPoolExecutor(
+                max_workers=_ENCODE_MAX_WORKERS, thread_name_prefix="lk_image_encode"
+            )
+
+    return await asyncio.get_running_loop().run_in_executor(
+        _encode_executor, encode, frame, options
+    )
+
+
+def perceptual_hash(frame: rtc.VideoFrame) -> int:
+    """64-bit difference hash (dHash) of the frame luminance.
+
+    Two frames showing the same content have hashes within a few bits of each other (see
+    hash_distance), regardless of their resolution. Only 32x36 pixels are sampled, the frame
+    isn't converted.
+    """
+    rows = np.linspace(0, frame.height - 1, 8 * 4).astype(np.intp)
+    cols = np.linspace(0, frame.width - 1, 9 * 4).astype(np.intp)
+
+    data = np.frombuffer(frame.data, dtype=np.uint8)
+    if frame.type in _LUMA_FIRST_TYPES:
+        luma = data[: frame.width * frame.height].reshape(frame.height, frame.width)
+        samples = luma[np.ix_(rows, cols)].astype(np.uint16)
+    else:
+        if frame.type not in _RGB_CHANNELS:
+            frame = frame.convert(rtc.VideoBufferType.RGBA)
+            data = np.frombuffer(frame.data, dtype=np.uint8)
+
+        r, g, b = _RGB_CHANNELS[frame.type]
+        pixels = data.reshape(frame.height, frame.width, 4)[np.ix_(rows, cols)].astype(np.uint16)
+        # BT.601 luma, so RGB and YUV frames of the same content hash the same
+        weighted = (77 * pixels[..., r] + 150 * pixels[..., g] + 29 * pixels[..., b]) >> 8
+        samples = weighted.astype(np.uint16)
+
+    blocks = samples.reshape(8, 4, 9, 4).sum(axis=(1, 3))
+    bits = (blocks[:, 1:] > blocks[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hash_distance(a: int, b: int) -> int:
+    """Number of differing bits between two perceptual hashes."""
+    return (a ^ b).bit_count()
+
+
+def _scaled_size(width: int, height: int, options: EncodeOptions) -> tuple[int, int] | None:
+    """Size of the frame content once resized, None if the frame isn't downscaled."""
+    resize_opts = options.resize_options
+    if resize_opts is None:
+        return None
+
+    scale_x = resize_opts.width / width
+    scale_y = resize_opts.height / height
+    if resize_opts.strategy in ("center_aspect_fit", "scale_aspect_fit"):
+        scale_x = scale_y = min(scale_x, scale_y)
+    elif resize_opts.strategy in ("center_aspect_cover", "scale_aspect_cover"):
+        scale_x = scale_y = max(scale_x, scale_y)
+
+    if scale_x >= 1.0 or scale_y >= 1.0:
+        return None
+
+    return max(int(width * scale_x), 2), max(int(height * scale_y), 2)
+
+
+def _scale_yuv420(frame: rtc.VideoFrame, size: tuple[int, int]) -> rtc.VideoFrame:
+    """Scale the Y, U and V planes of an I420 frame separately (the alpha plane is dropped)."""
+    width, height = size
+    y_size = frame.width * frame.height
+    chroma_in = ((frame.width + 1) // 2, (frame.height + 1) // 2)
+    chroma_out = ((width + 1) // 2, (height + 1) // 2)
+    chroma_size = chroma_in[0] * chroma_in[1]
+
+    data = frame.data
+    planes = [
+        (data[:y_size], (frame.width, frame.height), size),
+        (data[y_size : y_size + chroma_size], chroma_in, chroma_out),
+        (data[y_size + chroma_size : y_size + 2 * chroma_size], chroma_in, chroma_out),
+    ]
+
+    out = bytearray()
+    for plane, plane_in, plane_out in planes:
+        plane_data = np.frombuffer(plane, dtype=np.uint8)
+        img = Image.frombuffer("L", plane_in, plane_data, "raw", "L", 0, 1)
+        out += img.resize(plane_out, Image.Resampling.BILINEAR, reducing_gap=2.0).tobytes()
+
+    return rtc.VideoFrame(width, height, rtc.VideoBufferType.I420, out)
+
+
+def _image_from_frame(
+    frame: rtc.VideoFrame, scaled_size: tuple[int, int] | None = None
+) -> "Image.Image":
+    if scaled_size is not None and frame.type in _YUV420_TYPES:
+        frame = _scale_yuv420(frame, scaled_size)
+
     converted = frame
     if frame.type != rtc.VideoBufferType.RGBA:
         converted = frame.convert(rtc.VideoBufferType.RGBA)
 
-    rgb_image = Image.frombytes("RGBA", (frame.width, frame.height), bytes(converted.data)).convert(
-        "RGB"
-    )
+    rgba_data = np.frombuffer(converted.data, dtype=np.uint8)
+    rgb_image = Image.frombuffer(
+        "RGBA", (frame.width, frame.height), rgba_data, "raw", "RGBA", 0, 1
+    ).convert("RGB")
     return rgb_image
 
 
@@ -102,7 +102,10 @@ class VADStream(ABC):
     def __init__(self, vad: VAD) -> None:
         self._vad = vad
         self._last_activity_time = time.perf_counter()
-        self._input_ch = aio.Chan[rtc.AudioFrame | VADStream._FlushSentinel]()
+        # unbounded, the speech boundaries depend on every frame (see RecognizeStream._input_ch)
+        self._input_ch = aio.Chan[rtc.AudioFrame | VADStream._FlushSentinel](
+            overflow="block", name="vad_input"
+        )
         self._event_ch = aio.Chan[VADEvent]()
 
         self._tee_aiter = aio.itertools.tee(self._event_ch, 2)
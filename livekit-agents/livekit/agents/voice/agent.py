@@ -12,6 +12,7 @@ from livekit import rtc
 from .. import inference, llm, stt, tokenize, tts, utils, vad
 from ..llm import ChatContext, RealtimeModel, ToolError, find_function_tools
 from ..llm.chat_context import Instructions, _ReadOnlyChatContext
+from ..llm.llm import _TextChunk
 from ..log import logger
 from ..types import NOT_GIVEN, FlushSentinel, NotGivenOr
 from ..utils import is_given, misc
@@ -473,6 +474,31 @@ class Agent:
             model_settings: ModelSettings,
         ) -> AsyncGenerator[llm.ChatChunk | str | FlushSentinel, None]:
             """Default implementation for `Agent.llm_node`"""
+            async with Agent.default._llm_chat(agent, chat_ctx, tools, model_settings) as stream:
+                async for chunk in stream:
+                    yield chunk
+
+        @staticmethod
+        async def _llm_node_internal(
+            agent: Agent,
+            chat_ctx: llm.ChatContext,
+            tools: list[llm.Tool],
+            model_settings: ModelSettings,
+        ) -> AsyncGenerator[llm.ChatChunk | _TextChunk, None]:
+            """`llm_node` used when the agent doesn't override it, the chunks only reach the
+            generation pipeline so text deltas are forwarded without converting them to
+            `ChatChunk`"""
+            async with Agent.default._llm_chat(agent, chat_ctx, tools, model_settings) as stream:
+                async for chunk in stream._iter_chunks():
+                    yield chunk
+
+        @staticmethod
+        def _llm_chat(
+            agent: Agent,
+            chat_ctx: llm.ChatContext,
+            tools: list[llm.Tool],
+            model_settings: ModelSettings,
+        ) -> llm.LLMStream:
             activity = agent._get_activity_or_raise()
             assert activity.llm is not None, "llm_node called but no LLM node is available"
             assert isinstance(activity.llm, llm.LLM), (
@@ -480,14 +506,10 @@ class Agent:
             )
 
             tool_choice = model_settings.tool_choice if model_settings else NOT_GIVEN
-            activity_llm = activity.llm
-
             conn_options = activity.session.conn_options.llm_conn_options
-            async with activity_llm.chat(
+            return activity.llm.chat(
                 chat_ctx=chat_ctx, tools=tools, tool_choice=tool_choice, conn_options=conn_options
-            ) as stream:
-                async for chunk in stream:
-                    yield chunk
+            )
 
         @staticmethod
         async def tts_node(
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import contextvars
+import functools
 import heapq
 import json
 import time
@@ -2699,9 +2700,14 @@ class AgentActivity(RecognitionHooks):
         # TODO(theomonnom): since pause is closing STT/LLM/TTS, we have issues for SpeechHandle still in queue  # noqa: E501
         # I should implement a retry mechanism?
 
+        llm_node = self._agent.llm_node
+        if getattr(llm_node, "__func__", None) is Agent.llm_node:
+            # not overridden, the chunks never reach user code and can stay internal
+            llm_node = functools.partial(Agent.default._llm_node_internal, self._agent)  # type: ignore[assignment]
+
         tasks: list[asyncio.Task[Any]] = []
         llm_task, llm_gen_data = perform_llm_inference(
-            node=self._agent.llm_node,
+            node=llm_node,
             chat_ctx=chat_ctx,
             tool_ctx=tool_ctx,
             model_settings=model_settings,
@@ -27,7 +27,7 @@ from typing_extensions import TypedDict
 from livekit import rtc
 from livekit.protocol.agent_pb import agent_session as agent_pb
 
-from .. import cli, inference, llm, stt, tts, utils, vad
+from .. import inference, llm, stt, tts, utils, vad
 from .._exceptions import APIError
 from ..job import get_job_context
 from ..llm import AgentHandoff, ChatContext, MetricsReport
@@ -179,10 +179,27 @@ class _VideoSampler(Protocol):
 
 # TODO(theomonnom): Should this be moved to another file?
 class VoiceActivityVideoSampler:
-    def __init__(self, *, speaking_fps: float = 1.0, silent_fps: float = 0.3):
+    def __init__(
+        self,
+        *,
+        speaking_fps: float = 1.0,
+        silent_fps: float = 0.3,
+        duplicate_threshold: int | None = 2,
+    ):
+        """Samples video frames at a lower rate while the user is silent.
+
+        Args:
+            speaking_fps: Sampling rate while the user is speaking.
+            silent_fps: Sampling rate otherwise.
+            duplicate_threshold: A frame whose perceptual hash differs from the last sampled
+                frame by at most this many bits (out of 64) is skipped, so an unchanged screen
+                or scene isn't sent again. ``None`` samples every frame at the target rate.
+        """
         self.speaking_fps = speaking_fps
         self.silent_fps = silent_fps
+        self.duplicate_threshold = duplicate_threshold
         self._last_sampled_time: float | None = None
+        self._last_sampled_hash: int | None = None
 
     def __call__(self, frame: rtc.VideoFrame, session: AgentSession) -> bool:
         now = time.time()
@@ -192,15 +209,26 @@ class VoiceActivityVideoSampler:
             return False
         min_frame_interval = 1.0 / target_fps
 
-        if self._last_sampled_time is None:
-            self._last_sampled_time = now
-            return True
+        if (
+            self._last_sampled_time is not None
+            and (now - self._last_sampled_time) < min_frame_interval
+        ):
+            return False
+
+        if self.duplicate_threshold is not None:
+            frame_hash = utils.images.perceptual_hash(frame)
+            if (
+                self._last_sampled_hash is not None
+                and utils.images.hash_distance(frame_hash, self._last_sampled_hash)
+                <= self.duplicate_threshold
+            ):
+                # the next frame is checked right away, a change is sent as soon as it happens
+                return False
 
-        if (now - self._last_sampled_time) >= min_frame_interval:
-            self._last_sampled_time = now
-            return True
+            self._last_sampled_hash = frame_hash
 
-        return False
+        self._last_sampled_time = now
+        return True
 
 
 DEFAULT_TTS_TEXT_TRANSFORMS: list[TextTransforms] = ["filter_markdown", "filter_emoji"]
@@ -728,7 +756,10 @@ class AgentSession(rtc.EventEmitter[EventTypes], Generic[Userdata_T]):
 
             tasks: list[asyncio.Task[None]] = []
 
-            c = cli.AgentsConsole.get_instance()
+            # cli imports the voice package, resolve it at runtime
+            from ..cli import AgentsConsole
+
+            c = AgentsConsole.get_instance()
             if c.enabled and not c.io_acquired:
                 if self.input.audio is not None or self.output.audio is not None:
                     logger.warning(
@@ -22,6 +22,7 @@ from ..llm import (
     utils as llm_utils,
 )
 from ..llm.chat_context import Instructions
+from ..llm.llm import _TextChunk
 from ..log import logger
 from ..telemetry import trace_types, tracer
 from ..types import USERDATA_TIMED_TRANSCRIPT, FlushSentinel, NotGivenOr
@@ -141,14 +142,21 @@ async def _llm_inference_task(
         return False
 
     # forward llm stream to output channels
+    text_parts: list[str] = []
     try:
         async for chunk in llm_node:
             if data.ttft is None:
                 data.ttft = time.perf_counter() - start_time
 
+            # the default llm_node forwards the LLMStream's internal text chunks as is
+            if isinstance(chunk, _TextChunk):
+                if chunk.content:
+                    text_parts.append(chunk.content)
+                    text_ch.send_nowait(chunk.content)
+
             # io.LLMNode can either return a string or a ChatChunk
-            if isinstance(chunk, str):
-                data.generated_text += chunk
+            elif isinstance(chunk, str):
+                text_parts.append(chunk)
                 text_ch.send_nowait(chunk)
 
             elif isinstance(chunk, ChatChunk):
@@ -182,7 +190,7 @@ async def _llm_inference_task(
                     data.generated_extra.update(chunk.delta.extra)
 
                 if chunk.delta.content:
-                    data.generated_text += chunk.delta.content
+                    text_parts.append(chunk.delta.content)
                     text_ch.send_nowait(chunk.delta.content)
 
             elif isinstance(chunk, FlushSentinel):
@@ -192,6 +200,7 @@ async def _llm_inference_task(
                     f"LLM node returned an unexpected type: {type(chunk)}",
                 )
     finally:
+        data.generated_text = "".join(text_parts)
         if isinstance(llm_node, _ACloseable):
             await llm_node.aclose()
 
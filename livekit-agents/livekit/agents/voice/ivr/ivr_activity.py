@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import math
+import re
+from collections import Counter, deque
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 from livekit.agents import llm
 
 from ...log import logger
@@ -89,12 +90,21 @@ class IVRActivity:
         self._session.off("user_input_transcribed", self._on_user_input_transcribed)
 
 
+# same tokenization as sklearn's TfidfVectorizer: lowercase words of 2+ characters
+_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
+
 class TfidfLoopDetector:
     """TF-IDF based loop detector.
 
     This detector uses TF-IDF to detect loops in the user's input by comparing
     the similarity of the last N - 1 chunks of transcribed text to the last chunk.
 
+    The term counts of every chunk and the document frequencies of the window are kept up to
+    date as chunks are added, so a check only scores the newest chunk against the others
+    (linear in the size of the window). Weights match sklearn's ``TfidfVectorizer`` defaults
+    (raw counts, smoothed idf, l2 norm).
+
     Args:
         window_size: The number of chunks to compare. Default ``20``.
         similarity_threshold: The similarity threshold for a chunk to be considered similar to the last chunk. Default ``0.85``.
@@ -119,44 +129,59 @@ class TfidfLoopDetector:
         self._window_size = window_size
         self._similarity_threshold = similarity_threshold
         self._consecutive_threshold = consecutive_threshold
-        self._transcribed_chunks: list[str] = []
+        self._chunk_terms: deque[Counter[str]] = deque()
+        self._doc_freq: Counter[str] = Counter()
         self._num_consecutive_similar_chunks = 0
 
     def reset(self) -> None:
-        self._transcribed_chunks = []
+        self._chunk_terms.clear()
+        self._doc_freq.clear()
         self._num_consecutive_similar_chunks = 0
 
     def add_chunk(self, chunk: str) -> None:
-        self._transcribed_chunks.append(chunk)
-        if len(self._transcribed_chunks) > self._window_size:
-            self._transcribed_chunks = self._transcribed_chunks[-self._window_size :]
-
-    def check_loop_detection(self) -> bool:
-        try:
-            from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore
-            from sklearn.metrics.pairwise import cosine_similarity  # type: ignore
-        except ImportError:
-            logger.warning(
-                "TfidfLoopDetector: sklearn is not installed; loop detection is disabled. Please install the 'scikit-learn' package to enable loop detection."
+        terms = Counter(_TOKEN_RE.findall(chunk.lower()))
+        self._chunk_terms.append(terms)
+        self._doc_freq.update(terms.keys())
+
+        if len(self._chunk_terms) > self._window_size:
+            evicted = self._chunk_terms.popleft()
+            self._doc_freq.subtract(evicted.keys())
+            for term in evicted:
+                if self._doc_freq[term] <= 0:
+                    del self._doc_freq[term]
+
+    def _similarity_to_last(self) -> float:
+        """Highest cosine similarity between the last chunk and the previous ones."""
+        num_docs = len(self._chunk_terms)
+        idf = {term: math.log((1 + num_docs) / (1 + df)) + 1 for term, df in self._doc_freq.items()}
+
+        def _norm(terms: Counter[str]) -> float:
+            return math.sqrt(sum((count * idf[term]) ** 2 for term, count in terms.items()))
+
+        last = self._chunk_terms[-1]
+        last_norm = _norm(last)
+        if last_norm == 0.0:
+            return 0.0
+
+        best = 0.0
+        for i in range(num_docs - 1):
+            terms = self._chunk_terms[i]
+            dot = sum(
+                count * terms[term] * idf[term] ** 2
+                for term, count in last.items()
+                if term in terms
             )
-            return False
+            if dot > 0.0:
+                best = max(best, dot / (last_norm * _norm(terms)))
 
-        vectorizer = TfidfVectorizer()
+        return best
 
+    def check_loop_detection(self) -> bool:
         # Need at least two chunks to compute similarity against the last chunk
-        if len(self._transcribed_chunks) < 2:
+        if len(self._chunk_terms) < 2:
             return False
 
-        # NOTE: currently this is O(n^2) in the number of chunks, let's figure out a more efficient
-        # way if this become a bottleneck later.
-        doc_matrix = vectorizer.fit_transform(self._transcribed_chunks)
-        doc_similarity = cosine_similarity(doc_matrix)
-        last_chunk_similarity = doc_similarity[-1][:-1]
-
-        if (
-            last_chunk_similarity.size > 0
-            and np.max(last_chunk_similarity) > self._similarity_threshold
-        ):
+        if self._similarity_to_last() > self._similarity_threshold:
             self._num_consecutive_similar_chunks += 1
         else:
             self._num_consecutive_similar_chunks = 0
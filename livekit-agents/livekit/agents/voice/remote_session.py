@@ -71,20 +71,76 @@ class SessionTransport(ABC):
     async def __anext__(self) -> agent_pb.AgentSessionMessage: ...
 
 
+_FRAMING_ATTRIBUTE = "lk.session.framing"
+_FRAMING_LENGTH_PREFIXED = "length-prefixed"
+
+_HEADER_SIZE = 4
+_MAX_MESSAGE_SIZE = 1 << 20
+
+# multiplexed stream: how long events are coalesced, and how much, before being written
+_BATCH_INTERVAL = 0.05
+_BATCH_MAX_SIZE = 16 * 1024
+# the stream is reopened periodically so participants that joined after it was opened
+# receive the events too
+_STREAM_MAX_DURATION = 10.0
+_STREAM_IDLE_TIMEOUT = 2.0
+
+# events written without waiting for the batch interval (the queued ones are written first)
+_PRIORITY_EVENTS = frozenset(
+    {
+        "agent_state_changed",
+        "user_state_changed",
+        "overlapping_speech",
+        "eot_prediction",
+        "amd_prediction",
+        "agent_false_interruption",
+        "error",
+    }
+)
+
+
+def _is_latency_sensitive(msg: agent_pb.AgentSessionMessage) -> bool:
+    if msg.WhichOneof("message") != "event":
+        return True  # requests, responses and audio control
+    return msg.event.WhichOneof("event") in _PRIORITY_EVENTS
+
+
 class RoomSessionTransport(SessionTransport):
-    def __init__(self, room: rtc.Room, remote_identity: str | None = None) -> None:
+    def __init__(
+        self, room: rtc.Room, remote_identity: str | None = None, *, multiplexed: bool = False
+    ) -> None:
+        """
+        Args:
+            multiplexed: Send the messages over a long-lived byte stream with length-prefixed
+                framing, coalescing the events that aren't latency sensitive, instead of opening
+                a byte stream per message. The receiving side must understand the framing (see
+                ``_FRAMING_ATTRIBUTE``), this transport reads both formats.
+        """
         self._room = room
         self._remote_identity = remote_identity
+        self._multiplexed = multiplexed
         self._recv_ch: utils.aio.Chan[agent_pb.AgentSessionMessage] = utils.aio.Chan()
         self._handler_registered = False
         self._tasks: set[asyncio.Task[None]] = set()
 
+        self._send_buf = bytearray()
+        self._send_ev = asyncio.Event()
+        self._flush_ev = asyncio.Event()
+        self._reopen_stream = False
+        self._write_atask: asyncio.Task[None] | None = None
+
+    @property
+    def multiplexed(self) -> bool:
+        return self._multiplexed
+
     @property
     def remote_identity(self) -> str | None:
         return self._remote_identity
 
     @remote_identity.setter
     def remote_identity(self, value: str | None) -> None:
+        if value != self._remote_identity:
+            self._reopen_stream = True
         self._remote_identity = value
 
     async def start(self) -> None:
@@ -102,6 +158,11 @@ class RoomSessionTransport(SessionTransport):
 
     async def _read_stream(self, reader: rtc.ByteStreamReader) -> None:
         try:
+            attributes = reader.info.attributes or {}
+            if attributes.get(_FRAMING_ATTRIBUTE) == _FRAMING_LENGTH_PREFIXED:
+                await self._read_framed_stream(reader)
+                return
+
             chunks: list[bytes] = []
             async for chunk in reader:
                 chunks.append(chunk)
@@ -114,26 +175,148 @@ class RoomSessionTransport(SessionTransport):
         except Exception as e:
             logger.warning("failed to read binary stream message", exc_info=e)
 
+    async def _read_framed_stream(self, reader: rtc.ByteStreamReader) -> None:
+        buf = bytearray()
+        async for chunk in reader:
+            buf += chunk
+            offset = 0
+            while len(buf) - offset >= _HEADER_SIZE:
+                length = struct.unpack_from(">I", buf, offset)[0]
+                if length > _MAX_MESSAGE_SIZE:
+                    raise ValueError(f"session message too large: {length} bytes")
+                end = offset + _HEADER_SIZE + length
+                if len(buf) < end:
+                    break
+
+                msg = agent_pb.AgentSessionMessage()
+                msg.ParseFromString(bytes(buf[offset + _HEADER_SIZE : end]))
+                self._recv_ch.send_nowait(msg)
+                offset = end
+            del buf[:offset]
+
     async def send_message(self, msg: agent_pb.AgentSessionMessage) -> None:
+        if self._multiplexed:
+            self.send_message_nowait(msg)
+            return
+
         if self._recv_ch.closed or not self._room.isconnected():
             return
         try:
             data = msg.SerializeToString()
-            dest = [self._remote_identity] if self._remote_identity else None
             writer = await self._room.local_participant.stream_bytes(
                 name=utils.shortuuid("AS_"),
                 topic=TOPIC_SESSION_MESSAGES,
-                destination_identities=dest,
+                destination_identities=self._destination(),
             )
             await writer.write(data)
             await writer.aclose()
         except Exception as e:
             logger.warning("failed to send binary stream message: %s", e)
 
+    def send_message_nowait(self, msg: agent_pb.AgentSessionMessage) -> None:
+        """Queue ``msg`` on the multiplexed stream."""
+        if not self._multiplexed:
+            raise RuntimeError("send_message_nowait requires a multiplexed transport")
+
+        if self._recv_ch.closed:
+            return
+
+        data = msg.SerializeToString()
+        self._send_buf += struct.pack(">I", len(data))
+        self._send_buf += data
+        self._send_ev.set()
+        if _is_latency_sensitive(msg) or len(self._send_buf) >= _BATCH_MAX_SIZE:
+            self._flush_ev.set()
+
+        if self._write_atask is None:
+            self._write_atask = asyncio.create_task(self._write_task(), name="session_write_task")
+
+    def _destination(self) -> list[str] | None:
+        return [self._remote_identity] if self._remote_identity else None
+
+    async def _write_task(self) -> None:
+        writer: rtc.ByteStreamWriter | None = None
+        opened_at = 0.0
+
+        async def _close_writer() -> None:
+            nonlocal writer
+            if writer is not None:
+                try:
+                    await writer.aclose()
+                except Exception as e:
+                    logger.warning("failed to close binary stream: %s", e)
+                writer = None
+
+        try:
+            while True:
+                if not self._send_buf:
+                    if self._recv_ch.closed:
+                        return
+                    try:
+                        await asyncio.wait_for(
+                            self._send_ev.wait(),
+                            _STREAM_IDLE_TIMEOUT if writer is not None else None,
+                        )
+                    except asyncio.TimeoutError:
+                        await _close_writer()
+                        continue
+
+                if not self._flush_ev.is_set() and not self._recv_ch.closed:
+                    try:
+                        await asyncio.wait_for(self._flush_ev.wait(), _BATCH_INTERVAL)
+                    except asyncio.TimeoutError:
+                        pass
+
+                data = bytes(self._send_buf)
+                self._send_buf.clear()
+                self._send_ev.clear()
+                self._flush_ev.clear()
+                if not data:
+                    continue
+
+                if not self._room.isconnected():
+                    await _close_writer()
+                    continue
+
+                now = time.monotonic()
+                if writer is not None and (
+                    self._reopen_stream or now - opened_at > _STREAM_MAX_DURATION
+                ):
+                    await _close_writer()
+
+                try:
+                    if writer is None:
+                        self._reopen_stream = False
+                        writer = await self._room.local_participant.stream_bytes(
+                            name=utils.shortuuid("AS_"),
+                            topic=TOPIC_SESSION_MESSAGES,
+                            attributes={_FRAMING_ATTRIBUTE: _FRAMING_LENGTH_PREFIXED},
+                            destination_identities=self._destination(),
+                        )
+                        opened_at = now
+                    await writer.write(data)
+                except Exception as e:
+                    logger.warning("failed to send binary stream message: %s", e)
+                    writer = None
+        finally:
+            await _close_writer()
+
+    async def _close_write_task(self) -> None:
+        if self._write_atask is None:
+            return
+
+        # the write task exits once it sent what is left in the buffer
+        self._send_ev.set()
+        self._flush_ev.set()
+        await asyncio.wait([self._write_atask], timeout=_STREAM_IDLE_TIMEOUT)
+        await utils.aio.cancel_and_wait(self._write_atask)
+        self._write_atask = None
+
     async def close(self) -> None:
         if self._recv_ch.closed:
             return
         self._recv_ch.close()
+        await self._close_write_task()
         await utils.aio.cancel_and_wait(*self._tasks)
         self._tasks.clear()
         if self._handler_registered:
@@ -150,10 +333,6 @@ class RoomSessionTransport(SessionTransport):
         return await self._recv_ch.__anext__()
 
 
-_TCP_HEADER_SIZE = 4
-_TCP_MAX_MESSAGE_SIZE = 1 << 20
-
-
 class TcpSessionTransport(SessionTransport):
     def __init__(self, host: str, port: int) -> None:
         self._host = host
@@ -209,12 +388,12 @@ class TcpSessionTransport(SessionTransport):
             raise StopAsyncIteration
 
         try:
-            header = await self._reader.readexactly(_TCP_HEADER_SIZE)
+            header = await self._reader.readexactly(_HEADER_SIZE)
         except (asyncio.IncompleteReadError, ConnectionError, OSError):
             raise StopAsyncIteration from None
 
         length = struct.unpack(">I", header)[0]
-        if length > _TCP_MAX_MESSAGE_SIZE:
+        if length > _MAX_MESSAGE_SIZE:
             logger.error("TCP message too large: %d bytes", length)
             raise StopAsyncIteration
 
@@ -362,6 +541,8 @@ class SessionHost:
         self._tasks = utils.aio.TaskSet()
         self._session: AgentSession | None = None
         self._events_registered = False
+        # converted chat items by id, reused across get_chat_history requests
+        self._chat_item_protos: dict[str, tuple[llm.ChatItem, agent_pb.ChatContext.ChatItem]] = {}
 
     def register_session(self, session: AgentSession) -> None:
         self._session = session
@@ -435,7 +616,31 @@ class SessionHost:
         ts.FromNanoseconds(int((created_at if created_at is not None else time.time()) * 1e9))
         event.created_at.CopyFrom(ts)
         msg = agent_pb.AgentSessionMessage(event=event)
-        self._tasks.create_task(self._transport.send_message(msg))
+        if isinstance(self._transport, RoomSessionTransport) and self._transport.multiplexed:
+            self._transport.send_message_nowait(msg)
+        else:
+            self._tasks.create_task(self._transport.send_message(msg))
+
+    def _chat_item_proto(self, item: llm.ChatItem) -> agent_pb.ChatContext.ChatItem:
+        cached = self._chat_item_protos.get(item.id)
+        if cached is not None and cached[0] is item:
+            return cached[1]
+
+        pb = _chat_item_to_proto(item)
+        self._chat_item_protos[item.id] = (item, pb)
+        return pb
+
+    def _chat_history_protos(
+        self, items: Sequence[llm.ChatItem]
+    ) -> list[agent_pb.ChatContext.ChatItem]:
+        """Convert the chat history, only the items added or replaced since the last call are
+        converted again."""
+        protos = [self._chat_item_proto(item) for item in items]
+        if len(self._chat_item_protos) > len(items):
+            # drop the items that were removed from the history
+            ids = {item.id for item in items}
+            self._chat_item_protos = {k: v for k, v in self._chat_item_protos.items() if k in ids}
+        return protos
 
     def _on_agent_state_changed(self, event: AgentStateChangedEvent) -> None:
         old_pb = _AGENT_STATE_MAP.get(event.old_state, agent_pb.AS_IDLE)
@@ -479,7 +684,7 @@ class SessionHost:
             ChatMessage | FunctionCall | FunctionCallOutput | AgentHandoff | AgentConfigUpdate,
         ):
             return
-        chat_item = _chat_item_to_proto(event.item)
+        chat_item = self._chat_item_proto(event.item)
         self._send_event(
             agent_pb.AgentSessionEvent(
                 conversation_item_added=agent_pb.AgentSessionEvent.ConversationItemAdded(
@@ -625,7 +830,7 @@ class SessionHost:
             await self._transport.send_message(resp)
 
         elif req.HasField("get_chat_history"):
-            items = [_chat_item_to_proto(item) for item in self._session.history.items]
+            items = self._chat_history_protos(self._session.history.items)
             resp = agent_pb.AgentSessionMessage(
                 response=agent_pb.SessionResponse(
                     request_id=req.request_id,
@@ -17,6 +17,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import datetime
+import importlib.util
 import inspect
 import math
 import multiprocessing as mp
@@ -61,6 +62,8 @@ UPDATE_STATUS_INTERVAL = 2.5
 UPDATE_LOAD_INTERVAL = 0.5
 HEARTBEAT_INTERVAL = 30
 WORKER_PROTOCOL_VERSION = 1
+# longest profile the /debug/profile endpoint accepts, in seconds
+MAX_PROFILE_DURATION = 120.0
 
 
 def _default_setup_fnc(proc: JobProcess) -> Any:
@@ -185,7 +188,10 @@ class ServerOptions:
     prewarm_fnc: Callable[[JobProcess], Any] = _default_setup_fnc
     """A function to perform any necessary initialization before the job starts."""
     load_fnc: Callable[[AgentServer], float] | Callable[[], float] = _DefaultLoadCalc.get_load
-    """Called to determine the current load of the worker. Should return a value between 0 and 1."""
+    """Called to determine the current load of the worker. Should return a value between 0 and 1.
+
+    The measured cost of each running job is available through
+    :attr:`AgentServer.job_resource_usage`."""
     job_executor_type: JobExecutorType = _default_job_executor_type
     """Which executor to use to run jobs. (currently thread or process are supported)"""
     load_threshold: float | ServerEnvOption[float] = _default_load_threshold
@@ -269,6 +275,13 @@ class ServerOptions:
     When set, the PROMETHEUS_MULTIPROC_DIR environment variable will be configured automatically.
     When None (default), multiprocess mode is disabled and only main process metrics are collected.
     Users can also set PROMETHEUS_MULTIPROC_DIR environment variable directly before starting the worker."""
+    event_loop: utils.aio.loop.EventLoopType = "asyncio"
+    """Event loop of the worker, job and inference processes: ``"asyncio"``, ``"uvloop"``
+    (requires the ``uvloop`` extra) or a picklable function returning a new loop.
+
+    A loop other than asyncio must pass a check of the thread hand-off APIs
+    (``run_in_executor``, ``call_soon_threadsafe``, ``run_coroutine_threadsafe``), processes
+    fall back to asyncio otherwise. Jobs run by the thread executor always use asyncio."""
 
     def __post_init__(self) -> None:
         self.log_level = _validate_and_normalize_log_level(self.log_level)
@@ -327,6 +340,7 @@ class AgentServer(utils.EventEmitter[EventTypes]):
         prometheus_port: int | None = None,
         prometheus_multiproc_dir: str | None = None,
         log_level: str | ServerEnvOption[str] = _default_log_level,
+        event_loop: utils.aio.loop.EventLoopType = "asyncio",
     ) -> None:
         super().__init__()
         self._ws_url = ws_url or os.environ.get("LIVEKIT_URL") or ""
@@ -354,6 +368,12 @@ class AgentServer(utils.EventEmitter[EventTypes]):
         self._mp_ctx_str = multiprocessing_context
         self._mp_ctx = mp.get_context(multiprocessing_context)
 
+        if event_loop == "uvloop" and importlib.util.find_spec("uvloop") is None:
+            raise ImportError(
+                "event_loop='uvloop' requires uvloop, install it with `pip install livekit-agents[uvloop]`"
+            )
+        self._event_loop = event_loop
+
         if not is_given(http_proxy):
             http_proxy = os.environ.get("HTTPS_PROXY") or os.environ.get("HTTP_PROXY")
 
@@ -436,6 +456,7 @@ class AgentServer(utils.EventEmitter[EventTypes]):
             setup_fnc=options.prewarm_fnc,
             load_fnc=options.load_fnc,
             log_level=options.log_level,
+            event_loop=options.event_loop,
         )
         server.rtc_session(
             options.entrypoint_fnc,
@@ -596,6 +617,7 @@ class AgentServer(utils.EventEmitter[EventTypes]):
             self._pending_assignments: dict[str, asyncio.Future[agent.JobAssignment]] = {}
             self._close_future: asyncio.Future[None] | None = None
             self._msg_chan = utils.aio.Chan[agent.WorkerMessage](128, loop=self._loop)
+            self._resource_sampler = ipc.resource_sampler.ResourceSampler(loop=self._loop)
 
             self._inference_executor: ipc.inference_proc_executor.InferenceProcExecutor | None = (
                 None
@@ -613,6 +635,8 @@ class AgentServer(utils.EventEmitter[EventTypes]):
                     mp_ctx=self._mp_ctx,
                     loop=self._loop,
                     http_proxy=self._http_proxy or None,
+                    resource_sampler=self._resource_sampler,
+                    event_loop=self._event_loop,
                 )
 
             self._proc_pool = ipc.proc_pool.ProcPool(
@@ -631,6 +655,8 @@ class AgentServer(utils.EventEmitter[EventTypes]):
                 memory_warn_mb=self._job_memory_warn_mb,
                 memory_limit_mb=self._job_memory_limit_mb,
                 http_proxy=self._http_proxy or None,
+                resource_sampler=self._resource_sampler,
+                event_loop=self._event_loop,
             )
 
             self._previous_status = agent.WorkerStatus.WS_AVAILABLE
@@ -668,8 +694,67 @@ class AgentServer(utils.EventEmitter[EventTypes]):
                     body = MessageToJson(worker_info, preserving_proto_field_name=True)
                     return web.Response(body=body, content_type="application/json")
 
+                async def profile(request: web.Request) -> web.Response:
+                    # /debug/profile?job_id=<id>|process=inference&duration=5&format=speedscope
+                    query = request.query
+                    try:
+                        duration = float(query.get("duration", "5"))
+                        interval = float(query.get("interval", ipc.profiler.DEFAULT_INTERVAL))
+                    except ValueError:
+                        return web.Response(status=400, text="invalid duration or interval")
+
+                    fmt = query.get("format", "speedscope")
+                    if fmt not in ipc.profiler.PROFILE_FORMATS:
+                        return web.Response(status=400, text=f"unknown format: {fmt}")
+
+                    if not 0 < duration <= MAX_PROFILE_DURATION or interval <= 0:
+                        return web.Response(
+                            status=400,
+                            text=f"duration must be in (0, {MAX_PROFILE_DURATION}] seconds",
+                        )
+
+                    proc: (
+                        ipc.job_proc_executor.ProcJobExecutor
+                        | ipc.inference_proc_executor.InferenceProcExecutor
+                    )
+                    if job_id := query.get("job_id"):
+                        executor = self._proc_pool.get_by_job_id(job_id)
+                        if executor is None:
+                            return web.Response(status=404, text=f"job {job_id} not found")
+                        if not isinstance(executor, ipc.job_proc_executor.ProcJobExecutor):
+                            return web.Response(
+                                status=400, text="the job isn't running in its own process"
+                            )
+                        proc = executor
+                    elif query.get("process") == "inference":
+                        if self._inference_executor is None:
+                            return web.Response(status=404, text="no inference process")
+                        proc = self._inference_executor
+                    else:
+                        return web.Response(
+                            status=400, text="job_id or process=inference is required"
+                        )
+
+                    try:
+                        data = await proc.profile(duration, interval=interval, format=fmt)
+                    except Exception as e:
+                        logger.warning("failed to profile process", exc_info=e)
+                        return web.Response(status=500, text=str(e))
+
+                    if fmt == "folded":
+                        return web.Response(body=data, content_type="text/plain")
+
+                    return web.Response(
+                        body=data,
+                        content_type="application/json",
+                        headers={
+                            "Content-Disposition": f'attachment; filename="{proc.pid}.speedscope.json"'
+                        },
+                    )
+
                 self._http_server.app.add_routes([web.get("/", health_check)])
                 self._http_server.app.add_routes([web.get("/worker", worker)])
+                self._http_server.app.add_routes([web.get("/debug/profile", profile)])
 
             self._conn_task: asyncio.Task[None] | None = None
             self._load_task: asyncio.Task[None] | None = None
@@ -752,6 +837,8 @@ class AgentServer(utils.EventEmitter[EventTypes]):
                 logger.info("preloading plugins", extra={"packages": plugin_packages})
                 self._mp_ctx.set_forkserver_preload(plugin_packages)
 
+            self._resource_sampler.start()
+
             if self._inference_executor is not None:
                 logger.info("starting inference executor")
                 await self._inference_executor.start()
@@ -801,6 +888,7 @@ class AgentServer(utils.EventEmitter[EventTypes]):
                     self._worker_load = await self._invoke_load_fnc()
 
                     telemetry.metrics._update_worker_load(self._worker_load)
+                    telemetry.metrics._update_chan_metrics()
                     if self._prometheus_multiproc_dir:
                         await asyncio.get_event_loop().run_in_executor(
                             None, telemetry.metrics._update_child_proc_count
@@ -905,6 +993,19 @@ class AgentServer(utils.EventEmitter[EventTypes]):
     def active_jobs(self) -> list[RunningJobInfo]:
         return [proc.running_job for proc in self._proc_pool.processes if proc.running_job]
 
+    @property
+    def job_resource_usage(self) -> dict[str, ipc.resource_sampler.ProcResourceUsage]:
+        """Latest CPU/memory/event loop lag sample of each running job, keyed by job id.
+
+        Useful inside a custom ``load_fnc`` to base admission decisions on the measured cost
+        of the jobs already running on this worker.
+        """
+        return {
+            usage.job_id: usage
+            for usage in self._resource_sampler.usage
+            if usage.job_id is not None
+        }
+
     @property
     def draining(self) -> bool:
         return self._draining
@@ -1028,6 +1129,8 @@ class AgentServer(utils.EventEmitter[EventTypes]):
             if self._inference_executor is not None:
                 await self._inference_executor.aclose()
 
+            await self._resource_sampler.aclose()
+
             if self._http_session is not None:
                 await self._http_session.close()
 
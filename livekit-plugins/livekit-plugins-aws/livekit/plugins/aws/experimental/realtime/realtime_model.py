@@ -10,7 +10,7 @@ import os
 import time
 import uuid
 import weakref
-from collections.abc import AsyncIterator, Callable, Iterator
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
 from typing import Any, Literal, cast
 
@@ -512,9 +512,10 @@ class RealtimeSession(  # noqa: F811
             prompt_name=str(uuid.uuid4()),
             audio_content_name=str(uuid.uuid4()),
         )
-        self._input_resampler: rtc.AudioResampler | None = None
-        self._bstream = utils.audio.AudioByteStream(
-            DEFAULT_INPUT_SAMPLE_RATE, DEFAULT_CHANNELS, samples_per_channel=DEFAULT_CHUNK_SIZE
+        self._audio_input = llm.RealtimeAudioInput(
+            sample_rate=DEFAULT_INPUT_SAMPLE_RATE,
+            num_channels=DEFAULT_CHANNELS,
+            samples_per_packet=DEFAULT_CHUNK_SIZE,
         )
 
         self._response_task = None
@@ -1902,28 +1903,6 @@ class RealtimeSession(  # noqa: F811
             "updating inference configuration options is not yet supported by Nova Sonic's Realtime API"  # noqa: E501
         )
 
-    @utils.log_exceptions(logger=logger)
-    def _resample_audio(self, frame: rtc.AudioFrame) -> Iterator[rtc.AudioFrame]:
-        """Ensure mic audio matches Sonic's required sample rate & channels."""
-        if self._input_resampler:
-            if frame.sample_rate != self._input_resampler._input_rate:
-                self._input_resampler = None
-
-        if self._input_resampler is None and (
-            frame.sample_rate != DEFAULT_INPUT_SAMPLE_RATE or frame.num_channels != DEFAULT_CHANNELS
-        ):
-            self._input_resampler = rtc.AudioResampler(
-                input_rate=frame.sample_rate,
-                output_rate=DEFAULT_INPUT_SAMPLE_RATE,
-                num_channels=DEFAULT_CHANNELS,
-            )
-
-        if self._input_resampler:
-            # flush the resampler when the input source is changed
-            yield from self._input_resampler.push(frame)
-        else:
-            yield frame
-
     @utils.log_exceptions(logger=logger)
     async def _process_audio_input(self) -> None:
         """Background task that feeds audio and tool results into the Bedrock stream."""
@@ -2014,13 +1993,9 @@ class RealtimeSession(  # noqa: F811
         """Enqueue an incoming mic rtc.AudioFrame for transcription."""
         if not self._audio_input_chan.closed:
             # logger.debug(f"Raw audio received: samples={len(frame.data)} rate={frame.sample_rate} channels={frame.num_channels}")  # noqa: E501
-            for f in self._resample_audio(frame):
-                # logger.debug(f"Resampled audio: samples={len(frame.data)} rate={frame.sample_rate} channels={frame.num_channels}")  # noqa: E501
-
-                for nf in self._bstream.write(f.data.tobytes()):
-                    audio_bytes = bytes(nf.data)
-                    self._log_significant_audio(audio_bytes)
-                    self._audio_input_chan.send_nowait(audio_bytes)
+            for audio_bytes in self._audio_input.push(frame):
+                self._log_significant_audio(audio_bytes)
+                self._audio_input_chan.send_nowait(audio_bytes)
         else:
             logger.warning("audio input channel closed, skipping audio")
 
@@ -6,7 +6,6 @@ import json
 import os
 import time
 import weakref
-from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Literal
 
@@ -24,7 +23,7 @@ from livekit.agents.types import (
     APIConnectOptions,
     NotGivenOr,
 )
-from livekit.agents.utils import audio as audio_utils, images, is_given
+from livekit.agents.utils import images, is_given
 from livekit.plugins.google.realtime.api_proto import ClientEvents, LiveAPIModels, Voice
 
 from ..log import logger
@@ -449,13 +448,12 @@ class RealtimeSession(llm.RealtimeSession):
         self._tools = llm.ToolContext.empty()
         self._chat_ctx = llm.ChatContext.empty()
         self._msg_ch = utils.aio.Chan[ClientEvents]()
-        self._input_resampler: rtc.AudioResampler | None = None
 
         # 50ms chunks
-        self._bstream = audio_utils.AudioByteStream(
-            INPUT_AUDIO_SAMPLE_RATE,
-            INPUT_AUDIO_CHANNELS,
-            samples_per_channel=INPUT_AUDIO_SAMPLE_RATE // 20,
+        self._audio_input = llm.RealtimeAudioInput(
+            sample_rate=INPUT_AUDIO_SAMPLE_RATE,
+            num_channels=INPUT_AUDIO_CHANNELS,
+            samples_per_packet=INPUT_AUDIO_SAMPLE_RATE // 20,
         )
 
         api_version = self._opts.api_version
@@ -485,6 +483,7 @@ class RealtimeSession(llm.RealtimeSession):
         )
 
         self._main_atask = asyncio.create_task(self._main_task(), name="gemini-realtime-session")
+        self._video_encode_atask: asyncio.Task[None] | None = None
 
         self._current_generation: _ResponseGeneration | None = None
         self._active_session: AsyncSession | None = None
@@ -699,20 +698,29 @@ class RealtimeSession(llm.RealtimeSession):
         return self._session_resumption_handle
 
     def push_audio(self, frame: rtc.AudioFrame) -> None:
-        for f in self._resample_audio(frame):
-            for nf in self._bstream.write(f.data.tobytes()):
-                realtime_input = types.LiveClientRealtimeInput(
-                    audio=types.Blob(
-                        data=nf.data.tobytes(),
-                        mime_type=f"audio/pcm;rate={INPUT_AUDIO_SAMPLE_RATE}",
-                    )
-                )
-                self._send_client_event(realtime_input)
+        for packet in self._audio_input.push(frame):
+            realtime_input = types.LiveClientRealtimeInput(
+                audio=types.Blob(data=packet, mime_type=f"audio/pcm;rate={INPUT_AUDIO_SAMPLE_RATE}")
+            )
+            self._send_client_event(realtime_input)
 
     def push_video(self, frame: rtc.VideoFrame) -> None:
-        encoded_data = images.encode(
+        # encode off the event loop, frames are still sent in the order they were pushed
+        self._video_encode_atask = asyncio.create_task(
+            self._encode_and_send_video(frame, prev_atask=self._video_encode_atask),
+            name="gemini-realtime-encode-video",
+        )
+
+    @utils.log_exceptions(logger=logger)
+    async def _encode_and_send_video(
+        self, frame: rtc.VideoFrame, *, prev_atask: asyncio.Task[None] | None
+    ) -> None:
+        encoded_data = await images.encode_async(
             frame, self._opts.image_encode_options or DEFAULT_IMAGE_ENCODE_OPTIONS
         )
+        if prev_atask is not None:
+            await asyncio.shield(prev_atask)
+
         realtime_input = types.LiveClientRealtimeInput(
             video=types.Blob(data=encoded_data, mime_type="image/jpeg")
         )
@@ -835,6 +843,9 @@ class RealtimeSession(llm.RealtimeSession):
         if self._main_atask:
             await utils.aio.cancel_and_wait(self._main_atask)
 
+        if self._video_encode_atask:
+            await utils.aio.cancel_and_wait(self._video_encode_atask)
+
         await self._close_active_session()
 
         if self._pending_generation_fut and not self._pending_generation_fut.done():
@@ -1506,28 +1517,6 @@ class RealtimeSession(llm.RealtimeSession):
     def clear_audio(self) -> None:
         logger.warning("clear_audio is not supported by Gemini Realtime API.")
 
-    def _resample_audio(self, frame: rtc.AudioFrame) -> Iterator[rtc.AudioFrame]:
-        if self._input_resampler:
-            if frame.sample_rate != self._input_resampler._input_rate:
-                # input audio changed to a different sample rate
-                self._input_resampler = None
-
-        if self._input_resampler is None and (
-            frame.sample_rate != INPUT_AUDIO_SAMPLE_RATE
-            or frame.num_channels != INPUT_AUDIO_CHANNELS
-        ):
-            self._input_resampler = rtc.AudioResampler(
-                input_rate=frame.sample_rate,
-                output_rate=INPUT_AUDIO_SAMPLE_RATE,
-                num_channels=INPUT_AUDIO_CHANNELS,
-            )
-
-        if self._input_resampler:
-            # TODO(long): flush the resampler when the input source is changed
-            yield from self._input_resampler.push(frame)
-        else:
-            yield frame
-
     def _emit_error(self, error: Exception, recoverable: bool) -> None:
         self.emit(
             "error",
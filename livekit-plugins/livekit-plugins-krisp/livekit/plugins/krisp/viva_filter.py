@@ -20,7 +20,9 @@ for real-time noise suppression in LiveKit voice agents.
 
 from __future__ import annotations
 
+import math
 import os
+from collections.abc import Callable
 from typing import Any, Literal
 
 import numpy as np
@@ -55,6 +57,79 @@ except ModuleNotFoundError:
     )
 
 
+class _BlockFramer:
+    """Re-frames audio of any size into the fixed-size blocks Krisp processes.
+
+    Every call returns as many samples as it was given. When the input isn't aligned with the
+    blocks, the samples of a partial block can only be output once the block is complete: the
+    output is then delayed by ``delay`` samples, emitting silence while the delay builds up.
+    It stays at 0 for block-aligned input and never exceeds ``block_size - 1``.
+    """
+
+    def __init__(self, block_size: int) -> None:
+        self.block_size = block_size
+        self.delay = 0
+        self._pending = np.zeros(block_size, dtype=np.int16)  # partial block
+        self._pending_len = 0
+        self._out = np.zeros(2 * block_size, dtype=np.int16)  # processed, not output yet
+        self._out_len = 0
+
+    def reset(self) -> None:
+        self.delay = 0
+        self._pending_len = 0
+        self._out_len = 0
+
+    def process(
+        self,
+        samples: np.ndarray,
+        out: np.ndarray,
+        process_block: Callable[[np.ndarray], np.ndarray],
+    ) -> None:
+        """Process ``samples`` and write the same number of output samples to ``out``.
+
+        ``out`` may be ``samples`` itself, the input is consumed before it's written.
+        """
+        n = len(samples)
+        pos = 0
+        while pos < n:
+            take = min(self.block_size - self._pending_len, n - pos)
+            if take == self.block_size:
+                block = samples[pos : pos + take]
+            else:
+                self._pending[self._pending_len : self._pending_len + take] = samples[
+                    pos : pos + take
+                ]
+                self._pending_len += take
+                if self._pending_len < self.block_size:
+                    break
+
+                block = self._pending
+                self._pending_len = 0
+
+            pos += take
+            self._push_out(process_block(block))
+
+        # go straight to the worst case delay of this frame size: with a constant frame size, the
+        # only silence is then a single stretch at the start of the stream
+        worst_delay = self.block_size - math.gcd(n, self.block_size)
+        silence = min(n, max(n - self._out_len, worst_delay - self.delay, 0))
+        self.delay += silence
+
+        out[:silence] = 0
+        take = n - silence
+        out[silence:] = self._out[:take]
+        self._out_len -= take
+        self._out[: self._out_len] = self._out[take : take + self._out_len]
+
+    def _push_out(self, processed: np.ndarray) -> None:
+        end = self._out_len + len(processed)
+        if end > len(self._out):  # larger frames than ever before
+            self._out = np.concatenate([self._out[: self._out_len], np.zeros(end, np.int16)])
+
+        self._out[self._out_len : end] = processed
+        self._out_len = end
+
+
 class KrispVivaFilterFrameProcessor(rtc.FrameProcessor[rtc.AudioFrame]):
     """FrameProcessor implementation for Krisp noise reduction.
 
@@ -101,7 +176,8 @@ class KrispVivaFilterFrameProcessor(rtc.FrameProcessor[rtc.AudioFrame]):
             model_path: Path to the Krisp model file (.kef extension).
                 If None, uses KRISP_VIVA_FILTER_MODEL_PATH environment variable.
             noise_suppression_level: Noise suppression level (0-100, default: 100).
-            frame_duration_ms: Frame duration in milliseconds (10, 15, 20, 30, or 32, default: 10).
+            frame_duration_ms: Duration of the blocks processed by Krisp in milliseconds (10, 15,
+                20, 30, or 32, default: 10). Frames of any size are accepted, see ``latency``.
             sample_rate: sample rate in Hz. If None, default to 16000 Hz.
 
         Raises:
@@ -122,6 +198,7 @@ class KrispVivaFilterFrameProcessor(rtc.FrameProcessor[rtc.AudioFrame]):
         self._noise_suppression_level = noise_suppression_level
         self._sample_rate: int | None = None
         self._frame_duration_ms = frame_duration_ms
+        self._framer: _BlockFramer | None = None
 
         # Acquire SDK reference (initializes on first call)
         try:
@@ -192,6 +269,7 @@ class KrispVivaFilterFrameProcessor(rtc.FrameProcessor[rtc.AudioFrame]):
         try:
             self._session = krisp_audio.NcInt16.create(nc_cfg)
             self._sample_rate = sample_rate
+            self._framer = _BlockFramer(sample_rate * self._frame_duration_ms // 1000)
 
             logger.info("✅ Krisp session created successfully")
         except Exception as e:
@@ -204,62 +282,66 @@ class KrispVivaFilterFrameProcessor(rtc.FrameProcessor[rtc.AudioFrame]):
         This is the method required by the FrameProcessor interface.
 
         Args:
-            frame: Input audio frame. Must contain exactly the number of samples
-                   matching the configured frame_duration_ms at the frame's sample_rate.
-                   For example: 10ms @ 16kHz = 160 samples, 20ms @ 32kHz = 640 samples.
+            frame: Input audio frame of any size. Frames that aren't a multiple of
+                frame_duration_ms are buffered into whole Krisp blocks, which delays the output
+                by up to one block (see ``latency``).
 
         Returns:
-            Filtered audio frame with noise reduction applied.
-            If filtering is disabled, returns the original frame.
-
-        Raises:
-            ValueError: If frame size doesn't match the expected frame duration.
+            Filtered audio frame with the same number of samples, written in place when the
+            frame's buffer is writable. If filtering is disabled, returns the original frame.
         """
         if not self._filtering_enabled:
+            if self._framer is not None:
+                self._framer.reset()
             return frame
 
-        if self._session is None or self._sample_rate != frame.sample_rate:
+        if self._session is None or self._framer is None or self._sample_rate != frame.sample_rate:
             raise ValueError(f"Session not created or sample rate mismatch: {frame.sample_rate}Hz")
 
-        # Verify frame size matches expected duration
-        expected_samples = int((frame.sample_rate * self._frame_duration_ms) / 1000)
-        if frame.samples_per_channel != expected_samples:
-            raise ValueError(
-                f"Frame size mismatch: expected {expected_samples} samples "
-                f"({self._frame_duration_ms}ms @ {frame.sample_rate}Hz), "
-                f"got {frame.samples_per_channel} samples"
-            )
-
-        # Convert frame to numpy array
         audio_samples = np.frombuffer(frame.data, dtype=np.int16)
+        if audio_samples.flags.writeable:
+            out_frame = frame
+            out_samples = audio_samples
+        else:
+            out_frame = rtc.AudioFrame.create(
+                frame.sample_rate, frame.num_channels, frame.samples_per_channel
+            )
+            out_samples = np.frombuffer(out_frame.data, dtype=np.int16)
 
-        try:
-            # Process through Krisp
-            filtered_samples = self._session.process(audio_samples, self._noise_suppression_level)
-
-            # Validate output
-            if filtered_samples is None or len(filtered_samples) == 0:
-                logger.warning("Krisp returned empty output, using original audio")
-                filtered_samples = audio_samples
-            elif len(filtered_samples) != len(audio_samples):
-                logger.warning(
-                    f"Krisp output size mismatch: expected {len(audio_samples)}, "
-                    f"got {len(filtered_samples)}, using original audio"
-                )
-                filtered_samples = audio_samples
-
-            # Return filtered frame
-            return rtc.AudioFrame(
-                data=filtered_samples.tobytes(),
-                sample_rate=frame.sample_rate,
-                num_channels=frame.num_channels,
-                samples_per_channel=len(filtered_samples),
+        delay = self._framer.delay
+        self._framer.process(audio_samples, out_samples, self._process_block)
+        if self._framer.delay != delay:
+            logger.info(
+                "Krisp input frames aren't aligned with its blocks, output delayed by "
+                f"{self.latency * 1000:.1f}ms"
             )
 
+        return out_frame
+
+    def _process_block(self, block: np.ndarray) -> np.ndarray:
+        assert self._session is not None
+        try:
+            filtered = self._session.process(block, self._noise_suppression_level)
         except Exception as e:
             logger.error(f"Error processing frame: {e}")
-            # Return original frame on error
-            return frame
+            return block
+
+        if filtered is None or len(filtered) != len(block):
+            logger.warning(
+                f"Krisp output size mismatch: expected {len(block)}, "
+                f"got {0 if filtered is None else len(filtered)}, using original audio"
+            )
+            return block
+
+        return filtered  # type: ignore[no-any-return]
+
+    @property
+    def latency(self) -> float:
+        """Delay added to the output in seconds, non-zero only when the input frames aren't a
+        multiple of frame_duration_ms."""
+        if self._framer is None or not self._sample_rate:
+            return 0.0
+        return self._framer.delay / self._sample_rate
 
     def process(self, frame: rtc.AudioFrame) -> rtc.AudioFrame:
         """Public method that calls _process (for backward compatibility)."""
@@ -298,6 +380,7 @@ class KrispVivaFilterFrameProcessor(rtc.FrameProcessor[rtc.AudioFrame]):
         """
         if self._session is not None:
             self._session = None
+        self._framer = None
 
         logger.debug("Krisp frame processor session closed")
 
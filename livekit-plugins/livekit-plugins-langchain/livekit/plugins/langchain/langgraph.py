@@ -14,10 +14,19 @@
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Callable
 from typing import Any, Generic
 
-from langchain_core.messages import AIMessage, BaseMessageChunk, HumanMessage, SystemMessage
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessageChunk,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+)
 from langchain_core.runnables import RunnableConfig
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
 from langgraph.pregel.protocol import PregelProtocol
 from langgraph.types import StreamMode
 from langgraph.typing import ContextT
@@ -34,6 +43,49 @@ from livekit.agents.types import (
 
 _SUPPORTED_MODES: set[StreamMode] = {"messages", "custom"}
 
+_Message = AIMessage | HumanMessage | SystemMessage
+
+
+class _ThreadSync:
+    """Tracks the messages the graph's checkpointer already holds for the adapter's thread."""
+
+    def __init__(self) -> None:
+        self.seen: list[tuple[str, str]] = []
+        """(chat item id, text) of the messages the thread has received, in order"""
+        self.replies: list[str] = []
+        """replies streamed by the graph that aren't matched with a chat item yet"""
+
+    def input_messages(self, messages: list[_Message]) -> list[_Message | RemoveMessage]:
+        """Messages to send for this turn: the ones the thread hasn't seen when the context
+        only grew since the last turn, the whole context replacing the thread's messages
+        otherwise (first turn, edited or truncated context)."""
+        num_seen = len(self.seen)
+        if not num_seen or _message_keys(messages[:num_seen]) != self.seen:
+            return [RemoveMessage(id=REMOVE_ALL_MESSAGES), *messages]
+
+        # the graph's own replies are already in the thread
+        return [
+            msg
+            for msg in messages[num_seen:]
+            if not (isinstance(msg, AIMessage) and self._match_reply(str(msg.content)))
+        ]
+
+    def mark_seen(self, messages: list[_Message]) -> None:
+        self.seen = _message_keys(messages)
+
+    def _match_reply(self, text: str) -> bool:
+        text = text.strip()
+        for i, reply in enumerate(self.replies):
+            # an interrupted reply only keeps what was played out
+            if text and reply.startswith(text):
+                del self.replies[i]
+                return True
+        return False
+
+
+def _message_keys(messages: list[_Message]) -> list[tuple[str, str]]:
+    return [(msg.id or "", str(msg.content)) for msg in messages]
+
 
 class LLMAdapter(llm.LLM, Generic[ContextT]):
     def __init__(
@@ -44,7 +96,16 @@ class LLMAdapter(llm.LLM, Generic[ContextT]):
         context: ContextT | None = None,
         subgraphs: bool = False,
         stream_mode: StreamMode | list[StreamMode] = "messages",
+        delta_state: bool = False,
     ) -> None:
+        """
+        Args:
+            delta_state: Send only the messages the graph hasn't seen yet instead of the whole
+                chat history every turn. Requires a graph compiled with a checkpointer, a
+                ``thread_id`` in ``config["configurable"]`` and a ``messages`` key using the
+                ``add_messages`` reducer. When the chat context was edited or truncated, the
+                thread's messages are replaced with the whole history.
+        """
         super().__init__()
         modes = {stream_mode} if isinstance(stream_mode, str) else set(stream_mode)
         unsupported = modes - _SUPPORTED_MODES
@@ -52,11 +113,15 @@ class LLMAdapter(llm.LLM, Generic[ContextT]):
             raise ValueError(
                 f"Unsupported stream mode(s): {unsupported}. Only {_SUPPORTED_MODES} are supported."
             )
+        if delta_state and not (config or {}).get("configurable", {}).get("thread_id"):
+            raise ValueError("delta_state requires a thread_id in config['configurable']")
+
         self._graph = graph
         self._config = config
         self._context = context
         self._subgraphs = subgraphs
         self._stream_mode = stream_mode
+        self._thread_sync = _ThreadSync() if delta_state else None
 
     @property
     def model(self) -> str:
@@ -87,6 +152,7 @@ class LLMAdapter(llm.LLM, Generic[ContextT]):
             context=self._context,
             subgraphs=self._subgraphs,
             stream_mode=self._stream_mode,
+            thread_sync=self._thread_sync,
         )
 
 
@@ -103,6 +169,7 @@ class LangGraphStream(llm.LLMStream, Generic[ContextT]):
         context: ContextT | None = None,
         subgraphs: bool = False,
         stream_mode: StreamMode | list[StreamMode] = "messages",
+        thread_sync: _ThreadSync | None = None,
     ):
         super().__init__(
             llm,
@@ -115,9 +182,36 @@ class LangGraphStream(llm.LLMStream, Generic[ContextT]):
         self._context = context
         self._subgraphs = subgraphs
         self._stream_mode = stream_mode
+        self._thread_sync = thread_sync
+        self._reply_parts: list[str] = []
 
     async def _run(self) -> None:
-        state = self._chat_ctx_to_state()
+        if self._thread_sync is None:
+            await self._stream(self._chat_ctx_to_state())
+            return
+
+        sync = self._thread_sync
+        messages = self._chat_ctx_messages()
+        try:
+            await self._stream(
+                {"messages": sync.input_messages(messages)},
+                on_input_accepted=functools.partial(sync.mark_seen, messages),
+            )
+        finally:
+            if reply := "".join(self._reply_parts).strip():
+                sync.replies.append(reply)
+
+    def _send_chunk(self, chat_chunk: llm.ChatChunk | None) -> None:
+        if chat_chunk is None:
+            return
+
+        if chat_chunk.delta and chat_chunk.delta.content:
+            self._reply_parts.append(chat_chunk.delta.content)
+        self._event_ch.send_nowait(chat_chunk)
+
+    async def _stream(
+        self, state: dict[str, Any], *, on_input_accepted: Callable[[], None] | None = None
+    ) -> None:
         is_multi_mode = isinstance(self._stream_mode, list)
 
         # Some LangGraph versions don't accept the `subgraphs` or `context` kwargs yet.
@@ -138,45 +232,47 @@ class LangGraphStream(llm.LLMStream, Generic[ContextT]):
             )
 
         async for item in aiter:
+            # the graph's checkpointer saved the input before running its first step
+            if on_input_accepted is not None:
+                on_input_accepted()
+                on_input_accepted = None
+
             # Multi-mode: item is (mode, data) tuple wrapper
             if is_multi_mode and isinstance(item, tuple) and len(item) == 2:
                 mode, data = item
                 if isinstance(mode, str):
                     if mode == "custom":
                         # data = payload (str, dict, object)
-                        chat_chunk = _to_chat_chunk(data)
-                        if chat_chunk:
-                            self._event_ch.send_nowait(chat_chunk)
+                        self._send_chunk(_to_chat_chunk(data))
                         continue
                     elif mode == "messages":
                         # data = (token, metadata)
                         token_like = _extract_message_chunk(data)
                         if token_like is None:
                             continue
-                        chat_chunk = _to_chat_chunk(token_like)
-                        if chat_chunk:
-                            self._event_ch.send_nowait(chat_chunk)
+                        self._send_chunk(_to_chat_chunk(token_like))
                         continue
 
             # Single-mode: item is data directly (no tuple wrapper)
             if self._stream_mode == "custom":
                 # item = payload (str, dict, object)
-                chat_chunk = _to_chat_chunk(item)
-                if chat_chunk:
-                    self._event_ch.send_nowait(chat_chunk)
+                self._send_chunk(_to_chat_chunk(item))
             elif self._stream_mode == "messages":
                 # item = (token, metadata)
                 token_like = _extract_message_chunk(item)
                 if token_like is None:
                     continue
-                chat_chunk = _to_chat_chunk(token_like)
-                if chat_chunk:
-                    self._event_ch.send_nowait(chat_chunk)
+                self._send_chunk(_to_chat_chunk(token_like))
+
+        if on_input_accepted is not None:  # the graph completed without any output
+            on_input_accepted()
 
     def _chat_ctx_to_state(self) -> dict[str, Any]:
         """Convert chat context to langgraph input"""
+        return {"messages": self._chat_ctx_messages()}
 
-        messages: list[AIMessage | HumanMessage | SystemMessage] = []
+    def _chat_ctx_messages(self) -> list[_Message]:
+        messages: list[_Message] = []
         for msg in self._chat_ctx.messages():
             content = msg.text_content
             if content:
@@ -187,7 +283,7 @@ class LangGraphStream(llm.LLMStream, Generic[ContextT]):
                 elif msg.role in ["system", "developer"]:
                     messages.append(SystemMessage(content=content, id=msg.id))
 
-        return {"messages": messages}
+        return messages
 
 
 def _extract_message_chunk(item: Any) -> BaseMessageChunk | str | None:
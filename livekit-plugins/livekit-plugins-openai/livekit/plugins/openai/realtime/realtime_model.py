@@ -8,7 +8,6 @@ import json
 import os
 import time
 import weakref
-from collections.abc import Iterator
 from dataclasses import dataclass, replace
 from typing import Any, Literal, overload
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
@@ -824,7 +823,6 @@ class RealtimeSession(
         self._opts = replace(realtime_model._opts)
         self._tools = llm.ToolContext.empty()
         self._msg_ch = utils.aio.Chan[RealtimeClientEvent | dict[str, Any]]()
-        self._input_resampler: rtc.AudioResampler | None = None
 
         self._instructions: str | None = None
         self._main_atask = asyncio.create_task(self._main_task(), name="RealtimeSession._main_task")
@@ -844,8 +842,8 @@ class RealtimeSession(
         self._update_fnc_ctx_lock = asyncio.Lock()
 
         # 100ms chunks
-        self._bstream = utils.audio.AudioByteStream(
-            SAMPLE_RATE, NUM_CHANNELS, samples_per_channel=SAMPLE_RATE // 10
+        self._audio_input = llm.RealtimeAudioInput(
+            sample_rate=SAMPLE_RATE, num_channels=NUM_CHANNELS, samples_per_packet=SAMPLE_RATE // 10
         )
         self._pushed_duration_s: float = 0  # duration of audio pushed to the OpenAI Realtime API
 
@@ -1517,16 +1515,11 @@ class RealtimeSession(
         self._instructions = instructions
 
     def push_audio(self, frame: rtc.AudioFrame) -> None:
-        for f in self._resample_audio(frame):
-            data = f.data.tobytes()
-            for nf in self._bstream.write(data):
-                self.send_event(
-                    InputAudioBufferAppendEvent(
-                        type="input_audio_buffer.append",
-                        audio=base64.b64encode(nf.data).decode("utf-8"),
-                    )
-                )
-                self._pushed_duration_s += nf.duration
+        for packet in self._audio_input.push_base64(frame):
+            self.send_event(
+                InputAudioBufferAppendEvent(type="input_audio_buffer.append", audio=packet)
+            )
+            self._pushed_duration_s += self._audio_input.packet_duration
 
     def push_video(self, frame: rtc.VideoFrame) -> None:
         message = llm.ChatMessage(
@@ -1669,27 +1662,6 @@ class RealtimeSession(
         if reason:
             logger.warning(f"in-progress generation discarded due to {reason}")
 
-    def _resample_audio(self, frame: rtc.AudioFrame) -> Iterator[rtc.AudioFrame]:
-        if self._input_resampler:
-            if frame.sample_rate != self._input_resampler._input_rate:
-                # input audio changed to a different sample rate
-                self._input_resampler = None
-
-        if self._input_resampler is None and (
-            frame.sample_rate != SAMPLE_RATE or frame.num_channels != NUM_CHANNELS
-        ):
-            self._input_resampler = rtc.AudioResampler(
-                input_rate=frame.sample_rate,
-                output_rate=SAMPLE_RATE,
-                num_channels=NUM_CHANNELS,
-            )
-
-        if self._input_resampler:
-            # TODO(long): flush the resampler when the input source is changed
-            yield from self._input_resampler.push(frame)
-        else:
-            yield frame
-
     def _handle_input_audio_buffer_speech_started(
         self, _: InputAudioBufferSpeechStartedEvent
     ) -> None:
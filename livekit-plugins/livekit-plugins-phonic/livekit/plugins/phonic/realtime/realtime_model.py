@@ -19,7 +19,7 @@ from livekit.agents.types import (
     APIConnectOptions,
     NotGivenOr,
 )
-from livekit.agents.utils import audio as audio_utils, is_given
+from livekit.agents.utils import is_given
 from phonic import AsyncPhonic
 from phonic.conversations.socket_client import (
     AsyncConversationsSocketClient,
@@ -259,13 +259,11 @@ class RealtimeSession(llm.RealtimeSession):
         self._tools = llm.ToolContext.empty()
         self._chat_ctx = llm.ChatContext.empty()
 
-        self._bstream = audio_utils.AudioByteStream(
+        self._audio_input = llm.RealtimeAudioInput(
             sample_rate=PHONIC_INPUT_SAMPLE_RATE,
             num_channels=PHONIC_NUM_CHANNELS,
-            samples_per_channel=PHONIC_INPUT_SAMPLE_RATE * PHONIC_INPUT_FRAME_MS // 1000,
+            samples_per_packet=PHONIC_INPUT_SAMPLE_RATE * PHONIC_INPUT_FRAME_MS // 1000,
         )
-        self._input_resampler: rtc.AudioResampler | None = None
-        self._input_resampler_rate: int | None = None
 
         self._client = AsyncPhonic(
             api_key=self._opts.api_key,
@@ -546,10 +544,8 @@ class RealtimeSession(llm.RealtimeSession):
         ):
             return
 
-        for f in self._resample_audio(frame):
-            for nf in self._bstream.write(f.data.tobytes()):
-                b64_audio = base64.b64encode(nf.data.tobytes()).decode("utf-8")
-                self._send_ch.send_nowait(AudioChunkPayload(audio=b64_audio))
+        for b64_audio in self._audio_input.push_base64(frame):
+            self._send_ch.send_nowait(AudioChunkPayload(audio=b64_audio))
 
     def push_video(self, frame: rtc.VideoFrame) -> None:
         logger.warning("push_video is not supported by the Phonic realtime model.")
@@ -1007,28 +1003,6 @@ class RealtimeSession(llm.RealtimeSession):
             llm.InputSpeechStoppedEvent(user_transcription_enabled=True),
         )
 
-    def _resample_audio(self, frame: rtc.AudioFrame) -> typing.Iterator[rtc.AudioFrame]:
-        if self._input_resampler is not None:
-            if frame.sample_rate != self._input_resampler_rate:
-                self._input_resampler = None
-                self._input_resampler_rate = None
-
-        if self._input_resampler is None and (
-            frame.sample_rate != PHONIC_INPUT_SAMPLE_RATE
-            or frame.num_channels != PHONIC_NUM_CHANNELS
-        ):
-            self._input_resampler = rtc.AudioResampler(
-                input_rate=frame.sample_rate,
-                output_rate=PHONIC_INPUT_SAMPLE_RATE,
-                num_channels=PHONIC_NUM_CHANNELS,
-            )
-            self._input_resampler_rate = frame.sample_rate
-
-        if self._input_resampler is not None:
-            yield from self._input_resampler.push(frame)
-        else:
-            yield frame
-
     def _emit_error(self, error: Exception, recoverable: bool) -> None:
         self.emit(
             "error",
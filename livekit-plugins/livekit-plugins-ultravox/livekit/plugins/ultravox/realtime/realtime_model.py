@@ -12,7 +12,6 @@ import json
 import os
 import time
 import weakref
-from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -272,7 +271,6 @@ class RealtimeSession(
         self._opts = realtime_model._opts
         self._tools = llm.ToolContext.empty()
         self._msg_ch = utils.aio.Chan[UltravoxEvent | dict[str, Any] | bytes]()
-        self._input_resampler: rtc.AudioResampler | None = None
 
         self._main_atask = asyncio.create_task(self._main_task(), name="UltravoxSession._main_task")
 
@@ -286,10 +284,10 @@ class RealtimeSession(
         self._last_seen_user_ord: int = -1
         self._last_seen_agent_ord: int = -1
 
-        self._bstream = utils.audio.AudioByteStream(
-            self._opts.input_sample_rate,
-            NUM_CHANNELS,
-            samples_per_channel=self._opts.input_sample_rate // 10,
+        self._audio_input = llm.RealtimeAudioInput(
+            sample_rate=self._opts.input_sample_rate,
+            num_channels=NUM_CHANNELS,
+            samples_per_packet=self._opts.input_sample_rate // 10,
         )
 
         self._closed = False
@@ -456,9 +454,8 @@ class RealtimeSession(
         if self._closed:
             return
 
-        for resampled_frame in self._resample_audio(frame):
-            for audio_frame in self._bstream.push(resampled_frame.data):
-                self._send_audio_bytes(audio_frame.data.tobytes())
+        for packet in self._audio_input.push(frame):
+            self._send_audio_bytes(packet)
 
     def push_video(self, frame: rtc.VideoFrame) -> None:
         """Push video frames (not supported by Ultravox)."""
@@ -1160,28 +1157,6 @@ class RealtimeSession(
     def clear_audio(self) -> None:
         logger.warning("clear audio is not supported by Ultravox.")
 
-    def _resample_audio(self, frame: rtc.AudioFrame) -> Iterator[rtc.AudioFrame]:
-        """Resample audio frame to the required sample rate."""
-        if self._input_resampler:
-            if frame.sample_rate != self._input_resampler._input_rate:
-                # Input audio changed to a different sample rate
-                self._input_resampler = None
-
-        if self._input_resampler is None and (
-            frame.sample_rate != self._realtime_model._opts.input_sample_rate
-            or frame.num_channels != NUM_CHANNELS
-        ):
-            self._input_resampler = rtc.AudioResampler(
-                input_rate=frame.sample_rate,
-                output_rate=self._realtime_model._opts.input_sample_rate,
-                num_channels=NUM_CHANNELS,
-            )
-
-        if self._input_resampler:
-            yield from self._input_resampler.push(frame)
-        else:
-            yield frame
-
     async def send_tool_result(self, call_id: str, result: str) -> None:
         """Send tool execution result back to Ultravox."""
         if lk_ultravox_debug:
@@ -94,7 +94,7 @@ class FakeLLMStream(LLMStream):
         num_chunks = max(1, len(resp.content) // chunk_size + 1)
         for i in range(num_chunks):
             delta = resp.content[i * chunk_size : (i + 1) * chunk_size]
-            self._send_chunk(delta=delta)
+            self._push_text(str(id(self)), delta)
 
         await asyncio.sleep(resp.duration - (time.perf_counter() - start_time))
 
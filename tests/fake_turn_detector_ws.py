@@ -97,6 +97,7 @@ def make_stream(
     connect_script: list[BaseException | None] | None = None,
     max_retry: int = 3,
     retry_interval: float = 0.0,
+    audio_packet_duration: float = 0.04,
 ) -> tuple[_BaseStreamingTurnDetectorStream, FakeTurnDetectorWS, ControlledCloudTransport]:
     """Construct a cloud-mode stream with a controlled transport.
 
@@ -116,6 +117,7 @@ def make_stream(
         api_key="x",
         api_secret="x",
         conn_options=conn_options,
+        audio_packet_duration=audio_packet_duration,
     )
     transport = ControlledCloudTransport(
         fake_ws=fake_ws,
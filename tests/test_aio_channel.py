@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import prometheus_client
+import pytest
+
+from livekit.agents import utils
+from livekit.agents.telemetry import metrics
+from livekit.agents.utils import aio
+
+pytestmark = [pytest.mark.unit, pytest.mark.virtual_time, pytest.mark.no_concurrent]
+
+
+def _drain(ch: aio.Chan[int]) -> list[int]:
+    items = []
+    while not ch.empty():
+        items.append(ch.recv_nowait())
+    return items
+
+
+async def test_block_is_the_default() -> None:
+    ch = aio.Chan[int](2)
+    ch.send_nowait(1)
+    ch.send_nowait(2)
+    with pytest.raises(aio.channel.ChanFull):
+        ch.send_nowait(3)
+
+    send = asyncio.create_task(ch.send(3))
+    await asyncio.sleep(0.1)
+    assert not send.done()
+    assert ch.recv_nowait() == 1
+    await send
+    assert _drain(ch) == [2, 3]
+
+
+async def test_drop_oldest() -> None:
+    ch = aio.Chan[int](3, overflow="drop_oldest")
+    for i in range(10):
+        await ch.send(i)  # never waits
+
+    assert _drain(ch) == [7, 8, 9]
+    stats = ch.stats()
+    assert stats.dropped == 7
+    assert stats.high_water == 3
+
+
+async def test_drop_newest() -> None:
+    ch = aio.Chan[int](3, overflow="drop_newest")
+    for i in range(10):
+        ch.send_nowait(i)
+
+    assert _drain(ch) == [0, 1, 2]
+    assert ch.stats().dropped == 7
+
+
+async def test_values_that_cant_be_dropped() -> None:
+    # negative values stand for markers (e.g. end of segment) that must always be delivered
+    def droppable(v: int) -> bool:
+        return v >= 0
+
+    oldest = aio.Chan[int](3, overflow="drop_oldest", droppable=droppable)
+    newest = aio.Chan[int](3, overflow="drop_newest", droppable=droppable)
+    for v in (-1, 0, 1, 2, -2, 3, -3, -4):
+        oldest.send_nowait(v)
+        newest.send_nowait(v)
+
+    # over capacity when nothing can be dropped
+    assert _drain(oldest) == [-1, -2, -3, -4]
+    assert _drain(newest) == [-1, 0, 1, -2, -3, -4]
+    assert oldest.stats().high_water == 4
+    assert newest.stats().dropped == 2
+
+
+async def test_coalesce() -> None:
+    def merge(queued: list[int], new: list[int]) -> list[int] | None:
+        if queued[0] < 0 or new[0] < 0:
+            return None  # markers are never merged
+        return queued + new
+
+    ch = aio.Chan[list[int]](2, overflow="coalesce", coalesce=merge)
+    for v in ([1], [2], [3], [4], [-1], [5]):
+        ch.send_nowait(v)
+
+    assert ch.recv_nowait() == [1]
+    assert ch.recv_nowait() == [2, 3, 4]
+    assert ch.recv_nowait() == [-1]
+    assert ch.recv_nowait() == [5]
+    assert ch.stats().coalesced == 2
+
+
+def test_invalid_options() -> None:
+    with pytest.raises(ValueError):
+        aio.Chan[int](overflow="drop_oldest")  # unbounded
+    with pytest.raises(ValueError):
+        aio.Chan[int](2, overflow="coalesce")  # no coalesce function
+    with pytest.raises(ValueError):
+        aio.Chan[int](2, overflow="block", coalesce=lambda a, b: b)
+    with pytest.raises(ValueError):
+        aio.Chan[int](2, overflow="drop_everything")  # type: ignore[arg-type]
+
+
+async def test_queue_age() -> None:
+    ch = aio.Chan[int]()
+    ch.send_nowait(1)
+    await asyncio.sleep(0.5)
+    ch.send_nowait(2)
+    await asyncio.sleep(0.25)
+
+    assert ch.stats().max_age == 0.0  # only known once received
+    _drain(ch)
+    stats = ch.stats()
+    assert stats.max_age == pytest.approx(0.75, abs=1e-3)
+    assert stats.qsize == 0
+    assert stats.high_water == 2
+
+
+async def test_close_wakes_up_waiting_senders() -> None:
+    ch = aio.Chan[int](1)
+    ch.send_nowait(1)
+    send = asyncio.create_task(ch.send(2))
+    await asyncio.sleep(0)
+    ch.close()
+    with pytest.raises(aio.ChanClosed):
+        await send
+
+
+async def test_telemetry() -> None:
+    def sample(name: str, **labels: str) -> float | None:
+        labels = {"nodename": utils.nodename(), "channel": "test_telemetry", **labels}
+        return prometheus_client.REGISTRY.get_sample_value(name, labels)
+
+    first = aio.Chan[int](2, overflow="drop_oldest", name="test_telemetry")
+    second = aio.Chan[int](2, overflow="coalesce", coalesce=lambda a, b: b, name="test_telemetry")
+    for i in range(5):
+        first.send_nowait(i)
+        second.send_nowait(i)
+    await asyncio.sleep(2.0)
+    _drain(first)
+
+    metrics._update_chan_metrics()
+    assert sample("lk_agents_chan_high_water") == 2
+    assert sample("lk_agents_chan_queue_age_seconds") == pytest.approx(2.0, abs=1e-3)
+    assert sample("lk_agents_chan_overflow_total", reason="dropped") == 3
+    assert sample("lk_agents_chan_overflow_total", reason="coalesced") == 3
+
+    # the gauges report the maximum since the previous update, the counters keep counting
+    first.send_nowait(5)
+    metrics._update_chan_metrics()
+    assert sample("lk_agents_chan_high_water") == 1
+    assert sample("lk_agents_chan_queue_age_seconds") == 0.0
+    assert sample("lk_agents_chan_overflow_total", reason="dropped") == 3
+
+
+class TestPerformance:
+    NUM_FRAMES = 1000  # 10s of 10ms frames
+
+    async def _slow_consumer(self, ch: aio.Chan[bytes]) -> float:
+        """10ms frames sent to a consumer taking 15ms per frame, returns the time to drain"""
+
+        async def _consume() -> None:
+            async for _ in ch:
+                await asyncio.sleep(0.015)
+
+        consumer = asyncio.create_task(_consume())
+        start = time.perf_counter()
+        for _ in range(self.NUM_FRAMES):
+            await ch.send(bytes(320))
+            await asyncio.sleep(0.01)
+        ch.close()
+        await consumer
+        return time.perf_counter() - start
+
+    async def test_slow_consumer(self) -> None:
+        unbounded = aio.Chan[bytes]()
+        bounded = aio.Chan[bytes](10, overflow="drop_oldest")
+        unbounded_time = await self._slow_consumer(unbounded)
+        bounded_time = await self._slow_consumer(bounded)
+        u, b = unbounded.stats(), bounded.stats()
+        print(
+            f"\nunbounded: high water {u.high_water}, max age {u.max_age * 1000:.0f}ms, "
+            f"drained after {unbounded_time:.1f}s\n"
+            f"drop_oldest(10): high water {b.high_water}, max age {b.max_age * 1000:.0f}ms, "
+            f"{b.dropped} dropped, drained after {bounded_time:.1f}s"
+        )
+
+        # the backlog of the unbounded channel keeps growing, the latency with it
+        assert u.high_water > 300 and u.max_age > 4.0
+        assert b.high_water == 10 and b.max_age < 0.2
+        assert b.dropped > 300
+
+    def test_send_recv_overhead(self) -> None:
+        """CPU time of a send_nowait/recv_nowait pair, the stats must stay cheap"""
+        ch = aio.Chan[int](16, overflow="drop_oldest", name="test_overhead")
+        n = 100_000
+        start = time.process_time()
+        for i in range(n):
+            ch.send_nowait(i)
+            ch.recv_nowait()
+        per_item = (time.process_time() - start) / n
+        print(f"\nsend+recv: {per_item * 1e6:.2f}µs")
+        assert per_item < 20e-6, f"{per_item * 1e6:.1f}µs per item"
@@ -1,8 +1,10 @@
 import asyncio
+import time
+import tracemalloc
 
 import pytest
 
-from livekit.agents.utils.aio.itertools import Tee
+from livekit.agents.utils.aio.itertools import Tee, TeePeerDetached
 
 pytestmark = [pytest.mark.unit, pytest.mark.virtual_time, pytest.mark.no_concurrent]
 
@@ -101,3 +103,149 @@ async def test_tee_empty_iterator():
     for peer in tee:
         result = [item async for item in peer]
         assert result == []
+
+
+async def _counter(n: int, produced: list[int] | None = None):
+    for i in range(n):
+        if produced is not None:
+            produced.append(i)
+        yield i
+
+
+@pytest.mark.asyncio
+async def test_tee_stats_report_lag():
+    tee = Tee(_counter(10), n=2)
+    fast = [item async for item in tee[0]]
+
+    assert fast == list(range(10))
+    stats = tee.stats()
+    assert (stats[0].lag, stats[0].max_lag) == (0, 1)
+    assert (stats[1].lag, stats[1].max_lag) == (10, 10)
+
+    assert await tee[1].__anext__() == 0
+    assert tee.stats()[1].lag == 9
+
+
+@pytest.mark.asyncio
+async def test_tee_drop_oldest():
+    tee = Tee(_counter(10), n=2, maxsize=3, overflow="drop_oldest")
+    fast = [item async for item in tee[0]]
+    slow = [item async for item in tee[1]]
+
+    assert fast == list(range(10))
+    assert slow == [7, 8, 9]
+    stats = tee.stats()[1]
+    assert (stats.dropped, stats.max_lag, stats.detached) == (7, 3, False)
+
+
+@pytest.mark.asyncio
+async def test_tee_detach():
+    tee = Tee(_counter(10), n=3, maxsize=3, overflow="detach")
+    assert await tee[2].__anext__() == 0
+
+    fast = [item async for item in tee[0]]
+    assert fast == list(range(10))
+
+    # the detached peers can still read what was buffered before they fell behind
+    slow = []
+    with pytest.raises(TeePeerDetached):
+        async for item in tee[1]:
+            slow.append(item)
+    assert slow == [0, 1, 2]
+    assert [s.detached for s in tee.stats()] == [False, True, True]
+
+
+@pytest.mark.asyncio
+async def test_tee_block():
+    produced: list[int] = []
+    tee = Tee(_counter(10, produced), n=2, maxsize=2, overflow="block")
+    fast: list[int] = []
+
+    async def consume_fast():
+        async for item in tee[0]:
+            fast.append(item)
+
+    task = asyncio.create_task(consume_fast())
+    await asyncio.sleep(1.0)
+    # the producer waits for the slow peer instead of buffering for it
+    assert fast == [0, 1]
+    assert produced == [0, 1]
+
+    slow = [await tee[1].__anext__()]
+    await asyncio.sleep(0)
+    assert fast == [0, 1, 2]
+
+    slow += [item async for item in tee[1]]
+    await task
+    assert fast == slow == list(range(10))
+    stats = tee.stats()[1]
+    assert stats.max_lag == 2
+    assert stats.blocked == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_tee_block_closed_peer_releases_the_others():
+    tee = Tee(_counter(10), n=2, maxsize=2, overflow="block")
+    fast: list[int] = []
+    assert await tee[1].__anext__() == 0
+
+    async def consume_fast():
+        async for item in tee[0]:
+            fast.append(item)
+
+    task = asyncio.create_task(consume_fast())
+    await asyncio.sleep(1.0)
+    assert fast == [0, 1, 2]
+
+    await tee[1].aclose()
+    await asyncio.wait_for(task, 1.0)
+    assert fast == list(range(10))
+
+
+def test_tee_invalid_overflow():
+    with pytest.raises(ValueError):
+        Tee(_async_iter([]), n=2, maxsize=1, overflow="drop_newest")  # type: ignore[arg-type]
+
+
+class TestPerformance:
+    NUM_ITEMS = 50_000
+
+    @staticmethod
+    async def _fan_out(tee: Tee) -> float:
+        start = time.perf_counter()
+        async for _ in tee[0]:
+            pass
+        return time.perf_counter() - start
+
+    @pytest.mark.real_time
+    @pytest.mark.asyncio
+    async def test_stalled_peer_memory(self):
+        """Traced memory of a fan-out whose second peer never reads, unbounded vs bounded"""
+        results = {}
+        for label, kwargs in {
+            "unbounded": {},
+            "drop_oldest": {"maxsize": 100, "overflow": "drop_oldest"},
+            "detach": {"maxsize": 100, "overflow": "detach"},
+        }.items():
+            tee = Tee(_counter(self.NUM_ITEMS), n=2, **kwargs)
+            tracemalloc.start()
+            try:
+                elapsed = await self._fan_out(tee)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            results[label] = (elapsed, peak, tee.stats()[1])
+            await tee.aclose()
+
+        for label, (elapsed, peak, stats) in results.items():
+            print(
+                f"\n{label}: {elapsed / self.NUM_ITEMS * 1e6:.2f}µs/item, "
+                f"{peak / 1024:.0f}KiB traced, slow peer lag={stats.lag} dropped={stats.dropped}"
+            )
+
+        unbounded_peak = results["unbounded"][1]
+        assert results["unbounded"][2].lag == self.NUM_ITEMS
+        for label in ("drop_oldest", "detach"):
+            _, peak, stats = results[label]
+            assert stats.lag <= 100
+            assert peak < unbounded_peak / 10, f"{label}: {peak}B, unbounded {unbounded_peak}B"
@@ -190,29 +190,30 @@ class TestDrainTimeout:
 
         mock_exit.assert_called_once_with(1)
 
-    def test_memory_monitor_does_not_swallow_exitcli(self) -> None:
+    def test_resource_sampler_does_not_swallow_exitcli(self) -> None:
         """SIGTERM/SIGINT should not be eaten by broad Exception handlers.
 
-        Issue #4664 showed _ExitCli being raised from a signal handler while
-        _memory_monitor_task() was inside psutil. Because _ExitCli inherited
-        from Exception, the blanket ``except Exception`` here swallowed the
-        shutdown signal and left the worker running instead of draining.
+        Issue #4664 showed _ExitCli being raised from a signal handler while the
+        memory monitor was inside psutil. Because _ExitCli inherited from
+        Exception, the blanket ``except Exception`` swallowed the shutdown signal
+        and left the worker running instead of draining.
         """
+        from livekit.agents.ipc.resource_sampler import ResourceSampler
+
+        loop = asyncio.get_event_loop()
         proc = _make_supervised_proc()
         proc._pid = 123
-
-        async def _fake_sleep(_: float) -> None:
-            proc._closing = True
+        sampler = ResourceSampler(loop=loop)
+        sampler.add(proc)
 
         with (
             patch(
-                "livekit.agents.ipc.supervised_proc.psutil.Process",
+                "livekit.agents.ipc.resource_sampler.psutil.Process",
                 side_effect=_ExitCli(),
             ),
-            patch("livekit.agents.ipc.supervised_proc.asyncio.sleep", side_effect=_fake_sleep),
-            patch("livekit.agents.ipc.supervised_proc.logger.exception") as mock_exception,
+            patch("livekit.agents.ipc.resource_sampler.logger.exception") as mock_exception,
         ):
             with pytest.raises(_ExitCli):
-                asyncio.get_event_loop().run_until_complete(proc._memory_monitor_task())
+                loop.run_until_complete(sampler.sample())
 
         mock_exception.assert_not_called()
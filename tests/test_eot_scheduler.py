@@ -0,0 +1,171 @@
+"""Tests for the per-process local EOT scheduler (latest-wins, capped concurrency, batching)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import pytest
+
+from livekit import rtc
+from livekit.agents.inference.eot import TurnDetector
+from livekit.agents.inference.eot.scheduler import _EOTResult, _EOTScheduler
+from livekit.agents.metrics import EOTInferenceMetrics
+
+pytestmark = pytest.mark.audio_eot
+
+
+class _BlockingModel:
+    """Fake model whose native calls block until released by the test."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []  # number of snapshots passed to every native call
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+        self._release = threading.Event()
+
+    def release(self) -> None:
+        self._release.set()
+
+    def _run(self, pcms: Sequence[np.ndarray]) -> list[float]:
+        with self._lock:
+            self.calls.append(len(pcms))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            self._release.wait(5.0)
+            return [float(pcm[0]) / 100.0 for pcm in pcms]
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def predict(self, pcm: np.ndarray) -> float:
+        return self._run([pcm])[0]
+
+    def predict_batch(self, pcms: Sequence[np.ndarray]) -> list[float]:
+        return self._run(pcms)
+
+
+def _pcm(value: int) -> np.ndarray:
+    return np.full(160, value, dtype=np.int16)
+
+
+async def _wait_until(predicate: Any, timeout: float = 2.0) -> None:
+    async def _poll() -> None:
+        while not predicate():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(_poll(), timeout)
+
+
+async def test_latest_request_of_a_stream_wins() -> None:
+    model = _BlockingModel()
+    scheduler = _EOTScheduler(predict=model.predict, max_concurrency=1)
+
+    busy = scheduler.submit("other", _pcm(1))  # occupies the only slot
+    await _wait_until(lambda: model.running == 1)
+
+    first = scheduler.submit("stream", _pcm(10))
+    second = scheduler.submit("stream", _pcm(20))
+    third = scheduler.submit("stream", _pcm(30))
+    assert first.result() is None and second.result() is None
+    assert scheduler.queued == 1
+
+    model.release()
+    await busy
+    result = await third
+    assert isinstance(result, _EOTResult)
+    assert result.probability == pytest.approx(0.3)
+    assert result.num_superseded == 2
+    assert result.queue_wait > 0.0
+    assert model.calls == [1, 1]
+
+
+async def test_concurrency_is_capped_and_backlog_is_batched() -> None:
+    model = _BlockingModel()
+    scheduler = _EOTScheduler(predict=model.predict, max_concurrency=2, max_batch_size=8)
+
+    blockers = [scheduler.submit(f"blocker_{i}", _pcm(i)) for i in range(2)]
+    await _wait_until(lambda: model.running == 2)
+
+    futs = [scheduler.submit(f"stream_{i}", _pcm(i)) for i in range(6)]
+    assert scheduler.inflight == 2
+    assert scheduler.queued == 6
+
+    model.release()
+    results = await asyncio.gather(*blockers, *futs)
+
+    assert model.max_running == 2
+    # without native batching the backlog is split over the two slots, one call per snapshot
+    assert model.calls == [1] * 8
+    assert [r.probability for r in results[2:] if r is not None] == pytest.approx(
+        [i / 100.0 for i in range(6)]
+    )
+    assert max(r.batch_size for r in results[2:] if r is not None) == 3
+
+
+async def test_native_batching() -> None:
+    model = _BlockingModel()
+    scheduler = _EOTScheduler(
+        predict=model.predict,
+        predict_batch=model.predict_batch,
+        max_concurrency=1,
+        max_batch_size=4,
+    )
+
+    blocker = scheduler.submit("blocker", _pcm(0))
+    await _wait_until(lambda: model.running == 1)
+    futs = [scheduler.submit(f"stream_{i}", _pcm(i)) for i in range(6)]
+
+    model.release()
+    await asyncio.gather(blocker, *futs)
+    assert model.calls == [1, 4, 2]
+
+
+async def test_failure_is_reported_to_the_whole_batch() -> None:
+    def predict(pcm: np.ndarray) -> float:
+        raise RuntimeError("boom")
+
+    scheduler = _EOTScheduler(predict=predict)
+    fut = scheduler.submit("stream", _pcm(0))
+    with pytest.raises(RuntimeError, match="boom"):
+        await fut
+
+    assert scheduler.inflight == 0
+
+
+async def test_local_transport_emits_scheduler_metrics() -> None:
+    model = _BlockingModel()
+    model.release()
+    loop = asyncio.get_running_loop()
+    _EOTScheduler._instances[loop] = _EOTScheduler(predict=model.predict)
+    try:
+        detector = TurnDetector(version="v1-mini")
+        collected: list[EOTInferenceMetrics] = []
+        detector.on("metrics_collected", collected.append)
+
+        stream = detector.stream()
+        frame = rtc.AudioFrame(
+            data=_pcm(50).tobytes(), sample_rate=16000, num_channels=1, samples_per_channel=160
+        )
+        stream.push_audio(frame)
+        await asyncio.sleep(0.01)
+
+        event = await asyncio.wait_for(stream.predict(), 2.0)
+        assert event.end_of_turn_probability == pytest.approx(0.5)
+        assert event.inference_duration is not None
+
+        (metrics,) = collected
+        assert metrics.metadata is not None
+        assert metrics.metadata.model_name == "turn-detector-v1-mini"
+        assert metrics.batch_size == 1
+        assert metrics.num_superseded == 0
+        assert metrics.queue_wait >= 0.0
+        assert metrics.detection_delay >= metrics.prediction_duration
+        await stream.aclose()
+    finally:
+        _EOTScheduler._instances.pop(loop, None)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import statistics
+import time
+
+import pytest
+
+from livekit.agents import AgentServer, WorkerOptions
+from livekit.agents.utils.aio import loop as loop_mod
+
+from .fake_session import FakeActions, create_session, run_session
+from .test_agent_session import MyAgent
+
+pytestmark = [pytest.mark.unit, pytest.mark.no_concurrent]
+
+_HAS_UVLOOP = importlib.util.find_spec("uvloop") is not None
+
+
+class _NoWakeupLoop(asyncio.SelectorEventLoop):
+    """loop whose call_soon_threadsafe doesn't wake up the selector"""
+
+    def _write_to_self(self) -> None:
+        pass
+
+
+async def _entrypoint(_: object) -> None:
+    pass
+
+
+def test_default_loop() -> None:
+    loop = loop_mod.new_event_loop()
+    try:
+        assert type(loop) is type(asyncio.new_event_loop())  # noqa: E721
+    finally:
+        loop.close()
+
+
+def test_custom_loop_passes_the_compat_check() -> None:
+    loop = loop_mod.new_event_loop(asyncio.SelectorEventLoop)
+    try:
+        assert isinstance(loop, asyncio.SelectorEventLoop)
+        assert not loop.is_closed()
+    finally:
+        loop.close()
+
+
+def test_incompatible_loop_falls_back_to_asyncio(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(loop_mod, "_CHECK_TIMEOUT", 0.2)
+    loop = loop_mod.new_event_loop(_NoWakeupLoop)
+    try:
+        assert not isinstance(loop, _NoWakeupLoop)
+    finally:
+        loop.close()
+
+
+def test_server_options() -> None:
+    server = AgentServer.from_server_options(
+        WorkerOptions(entrypoint_fnc=_entrypoint, event_loop=asyncio.SelectorEventLoop)
+    )
+    assert server._event_loop is asyncio.SelectorEventLoop
+
+    with pytest.raises(ValueError):
+        loop_mod.new_event_loop("trio")  # type: ignore[arg-type]
+
+
+@pytest.mark.skipif(_HAS_UVLOOP, reason="uvloop is installed")
+def test_uvloop_not_installed() -> None:
+    with pytest.raises(ImportError, match="uvloop"):
+        AgentServer(event_loop="uvloop")
+
+
+class TestPerformance:
+    NUM_SESSIONS = 8
+    SPEED_FACTOR = 4.0
+    LAG_PROBE_INTERVAL = 0.005
+
+    async def _run_sessions(self) -> tuple[list[float], float]:
+        lags: list[float] = []
+
+        async def _probe() -> None:
+            loop = asyncio.get_running_loop()
+            while True:
+                start = loop.time()
+                await asyncio.sleep(self.LAG_PROBE_INTERVAL)
+                lags.append(loop.time() - start - self.LAG_PROBE_INTERVAL)
+
+        async def _session() -> None:
+            actions = FakeActions()
+            actions.add_user_speech(0.5, 2.5, "Hello, how are you?", stt_delay=0.2)
+            actions.add_llm("I'm doing well, thank you! " * 4, ttft=0.1, duration=0.3)
+            actions.add_tts(2.0, ttfb=0.2, duration=0.3)
+            actions.add_user_speech(6.0, 7.5, "What's the weather like?", stt_delay=0.2)
+            actions.add_llm("It is sunny and warm today. " * 4, ttft=0.1, duration=0.3)
+            actions.add_tts(2.0, ttfb=0.2, duration=0.3)
+
+            session = create_session(actions, speed_factor=self.SPEED_FACTOR)
+            await run_session(session, MyAgent(), drain_delay=1.0)
+
+        probe = asyncio.create_task(_probe())
+        cpu_start = time.process_time()
+        try:
+            await asyncio.gather(*(_session() for _ in range(self.NUM_SESSIONS)))
+        finally:
+            cpu = time.process_time() - cpu_start
+            probe.cancel()
+
+        return lags, cpu / self.NUM_SESSIONS
+
+    @pytest.mark.parametrize(
+        "event_loop",
+        [
+            "asyncio",
+            pytest.param(
+                "uvloop", marks=pytest.mark.skipif(not _HAS_UVLOOP, reason="uvloop not installed")
+            ),
+        ],
+    )
+    def test_concurrent_sessions(self, event_loop: loop_mod.EventLoopType) -> None:
+        """Loop lag and CPU time per session of concurrent fake sessions (STT/LLM/TTS/VAD)."""
+        loop = loop_mod.new_event_loop(event_loop)
+        try:
+            lags, cpu_per_session = loop.run_until_complete(self._run_sessions())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
+
+        lags.sort()
+        p50 = statistics.median(lags)
+        p99 = lags[int(len(lags) * 0.99)]
+        print(
+            f"\n{event_loop}: {self.NUM_SESSIONS} sessions, loop lag p50={p50 * 1000:.2f}ms "
+            f"p99={p99 * 1000:.2f}ms max={lags[-1] * 1000:.2f}ms, "
+            f"cpu/session={cpu_per_session * 1000:.1f}ms"
+        )
+
+        assert p50 < 0.05, f"median loop lag {p50 * 1000:.1f}ms"
+        assert cpu_per_session < 2.0, f"{cpu_per_session:.2f}s of CPU per session"
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+# CPU time `import livekit.agents` may take in a fresh interpreter, the lazy namespace keeps it
+# at a few milliseconds (it used to be ~2s with the voice pipeline and the provider SDKs)
+IMPORT_BUDGET = 0.25
+
+# must only be imported once a name that needs them is accessed
+HEAVY_MODULES = (
+    "aiohttp",
+    "numpy",
+    "openai",
+    "opentelemetry",
+    "livekit.rtc",
+    "livekit.agents.cli",
+    "livekit.agents.voice",
+    "livekit.agents.inference",
+)
+
+_MEASURE = """
+import json, sys, time
+start = time.process_time()
+import livekit.agents
+elapsed = time.process_time() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def _slowest_imports(n: int = 10) -> str:
+    """Top cumulative entries of `python -X importtime`"""
+    stderr = _run("import livekit.agents", "-X", "importtime").stderr
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split("|")
+        entries.append((int(cumulative), name.strip()))
+    entries.sort(reverse=True)
+    return "\n".join(f"{us / 1000:8.1f}ms  {name}" for us, name in entries[:n])
+
+
+def test_import_does_not_load_heavy_modules() -> None:
+    modules = set(json.loads(_run(_MEASURE).stdout)["modules"])
+    loaded = [m for m in HEAVY_MODULES if m in modules]
+    assert not loaded, f"`import livekit.agents` loads {loaded}\n{_slowest_imports()}"
+
+
+def test_public_api() -> None:
+    code = (
+        "import livekit.agents as agents\n"
+        "missing = [n for n in agents.__all__ if not hasattr(agents, n)]\n"
+        "assert not missing, missing\n"
+        "assert set(agents.__all__) <= set(dir(agents))\n"
+        "assert agents.Agent is agents.voice.Agent\n"
+        "assert agents.AgentServer is agents.worker.AgentServer\n"
+        "assert agents.avatar.__name__ == 'livekit.agents.voice.avatar'\n"
+    )
+    _run(code)
+
+    with pytest.raises(subprocess.CalledProcessError):
+        _run("import livekit.agents as agents; agents.NotAName")
+
+
+class TestPerformance:
+    def test_import_time_budget(self) -> None:
+        # best of a few runs, the first one also pays for the bytecode cache
+        elapsed = min(json.loads(_run(_MEASURE).stdout)["elapsed"] for _ in range(3))
+        assert elapsed < IMPORT_BUDGET, (
+            f"`import livekit.agents` took {elapsed * 1000:.0f}ms of CPU time "
+            f"(budget {IMPORT_BUDGET * 1000:.0f}ms)\n{_slowest_imports()}"
+        )
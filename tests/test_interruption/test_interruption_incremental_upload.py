@@ -0,0 +1,322 @@
+"""Tests for the incremental upload mode of the adaptive interruption websocket stream.
+
+A local aiohttp websocket server stands in for the inference gateway: it implements both upload
+modes, rebuilds the window each request refers to and answers with ``inference_done``. The same
+script of agent/overlap events run in both modes must lead to the same inference windows.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+import time
+from collections.abc import Awaitable, Callable
+
+import aiohttp
+import numpy as np
+import pytest
+from aiohttp import web
+
+from livekit import rtc
+from livekit.agents.inference.interruption import (
+    AdaptiveInterruptionDetector,
+    InterruptionWebSocketStream,
+    OverlappingSpeechEvent,
+    _AgentSpeechEndedSentinel,
+    _AgentSpeechStartedSentinel,
+    _OverlapSpeechEndedSentinel,
+    _OverlapSpeechStartedSentinel,
+    _SlidingAudioWindow,
+)
+from livekit.agents.types import APIConnectOptions
+
+pytestmark = pytest.mark.unit
+
+CONN_OPTIONS = APIConnectOptions(max_retry=0, retry_interval=0.0, timeout=5.0)
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = 1600  # 100ms, one request per frame during overlaps
+
+
+class _StandInServer:
+    """Minimal `/bargein` endpoint, records the window of every inference request."""
+
+    def __init__(self) -> None:
+        self.sessions: list[dict] = []
+        self.windows: list[np.ndarray] = []
+        self.chunks: list[tuple[int, int, int]] = []
+        """(window_start, chunk_start, chunk size) of the incremental requests"""
+        self.bytes_received = 0
+        self._received = asyncio.Condition()
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/bargein", self._handler)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def aclose(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def wait_for(self, predicate: Callable[[], bool]) -> None:
+        async with self._received:
+            await asyncio.wait_for(self._received.wait_for(predicate), 5.0)
+
+    async def _handler(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        incremental = False
+        samples = np.zeros(0, dtype=np.int16)
+        start = 0  # absolute position of samples[0]
+
+        async for msg in ws:
+            if msg.type == aiohttp.WSMsgType.TEXT:
+                data = json.loads(msg.data)
+                if data["type"] == "session.create":
+                    incremental = data["settings"].get("upload_mode") == "incremental"
+                    async with self._received:
+                        self.sessions.append(data["settings"])
+                        self._received.notify_all()
+                    await ws.send_json({"type": "session.created", "default_threshold": 0.5})
+                elif data["type"] == "session.close":
+                    await ws.send_json({"type": "session.closed"})
+                continue
+
+            if msg.type != aiohttp.WSMsgType.BINARY:
+                continue
+
+            if incremental:
+                created_at, window_start, chunk_start = struct.unpack_from("<QQQ", msg.data)
+                chunk = np.frombuffer(msg.data, dtype=np.int16, offset=24)
+                if chunk_start == start + len(samples):
+                    samples = np.concatenate((samples, chunk))
+                else:
+                    samples, start = chunk, chunk_start
+                assert window_start >= start, "window starts before the uploaded audio"
+                samples, start = samples[window_start - start :], window_start
+                self.chunks.append((window_start, chunk_start, len(chunk)))
+                window = samples
+            else:
+                (created_at,) = struct.unpack_from("<Q", msg.data)
+                window = np.frombuffer(msg.data, dtype=np.int16, offset=8)
+
+            async with self._received:
+                self.bytes_received += len(msg.data)
+                self.windows.append(window.copy())
+                self._received.notify_all()
+            await ws.send_json(
+                {"type": "inference_done", "created_at": created_at, "probabilities": [0.1]}
+            )
+
+        return ws
+
+
+def _frame(index: int, num_samples: int = FRAME_SAMPLES) -> rtc.AudioFrame:
+    # distinct samples, so a misplaced chunk shows up in the rebuilt windows
+    samples = (np.arange(num_samples) + index * num_samples) % 30000
+    return rtc.AudioFrame(
+        data=samples.astype(np.int16).tobytes(),
+        sample_rate=SAMPLE_RATE,
+        num_channels=1,
+        samples_per_channel=num_samples,
+    )
+
+
+class _Driver:
+    def __init__(self, server: _StandInServer, stream: InterruptionWebSocketStream) -> None:
+        self._server = server
+        self._stream = stream
+        self._frame_index = 0
+
+    def agent_speech(self, started: bool) -> None:
+        self._stream.push_frame(
+            _AgentSpeechStartedSentinel() if started else _AgentSpeechEndedSentinel()
+        )
+
+    def audio(self, num_frames: int) -> None:
+        for _ in range(num_frames):
+            self._stream.push_frame(_frame(self._frame_index))
+            self._frame_index += 1
+
+    def _next_request(self, num_requests: int) -> Callable[[], bool]:
+        return lambda: len(self._server.windows) > num_requests
+
+    async def overlap(self, num_frames: int) -> OverlappingSpeechEvent:
+        self._stream.push_frame(
+            _OverlapSpeechStartedSentinel(speech_duration=0.2, started_at=time.time())
+        )
+        for _ in range(num_frames):
+            self.audio(1)
+            await self._server.wait_for(self._next_request(len(self._server.windows)))
+
+        # wait for the last answer, the event reports the last answered request
+        await asyncio.sleep(0.05)
+        self._stream.push_frame(_OverlapSpeechEndedSentinel(ended_at=time.time()))
+        return await self._stream.__anext__()
+
+
+_Script = Callable[[_Driver], Awaitable[list[OverlappingSpeechEvent]]]
+
+
+async def _run(
+    server: _StandInServer,
+    script: _Script,
+    *,
+    incremental: bool,
+) -> list[OverlappingSpeechEvent]:
+    async with aiohttp.ClientSession() as http_session:
+        detector = AdaptiveInterruptionDetector(
+            base_url=server.url,
+            api_key="test-key",
+            api_secret="test-secret",
+            http_session=http_session,
+            incremental_upload=incremental,
+        )
+        stream = detector.stream(conn_options=CONN_OPTIONS)
+        try:
+            await server.wait_for(lambda: len(server.sessions) >= 1)
+            events = await script(_Driver(server, stream))
+        finally:
+            await stream.aclose()
+    return events
+
+
+async def _run_both(
+    script: _Script,
+) -> tuple[_StandInServer, _StandInServer, list[OverlappingSpeechEvent]]:
+    window_server, incremental_server = _StandInServer(), _StandInServer()
+    await window_server.start()
+    await incremental_server.start()
+    try:
+        await _run(window_server, script, incremental=False)
+        events = await _run(incremental_server, script, incremental=True)
+    finally:
+        await window_server.aclose()
+        await incremental_server.aclose()
+    return window_server, incremental_server, events
+
+
+def _assert_same_windows(expected: _StandInServer, actual: _StandInServer) -> None:
+    assert len(actual.windows) == len(expected.windows)
+    for i, (a, e) in enumerate(zip(actual.windows, expected.windows, strict=True)):
+        np.testing.assert_array_equal(a, e, err_msg=f"request {i}")
+
+
+async def test_incremental_upload_rebuilds_the_same_windows() -> None:
+    async def script(driver: _Driver) -> list[OverlappingSpeechEvent]:
+        driver.agent_speech(True)
+        driver.audio(10)
+        events = [await driver.overlap(5)]
+        driver.audio(5)  # no overlap, nothing is uploaded
+        events.append(await driver.overlap(40))  # longer than the 3s window
+        driver.agent_speech(False)
+        driver.agent_speech(True)  # the window is reset
+        driver.audio(3)
+        events.append(await driver.overlap(3))
+        return events
+
+    window_server, incremental_server, events = await _run_both(script)
+
+    assert window_server.sessions[0].get("upload_mode") is None
+    assert incremental_server.sessions[0]["upload_mode"] == "incremental"
+    assert len(window_server.windows) == 48
+    _assert_same_windows(window_server, incremental_server)
+
+    # only the first request of each overlap carries more than the frame pushed since the last one
+    sizes = [size for _, _, size in incremental_server.chunks]
+    assert sizes.count(FRAME_SAMPLES) == len(sizes) - 3
+    assert sizes[5] == 6 * FRAME_SAMPLES  # audio between the overlaps is uploaded late
+    assert incremental_server.bytes_received < window_server.bytes_received / 5
+
+    for ev in events:
+        assert ev.speech_input is not None
+        assert not ev.speech_input.flags.writeable
+        assert any(np.array_equal(ev.speech_input, w) for w in incremental_server.windows)
+    assert events[1].speech_input is not None and len(events[1].speech_input) == 3 * SAMPLE_RATE
+
+
+async def test_reconnect_uploads_the_whole_window() -> None:
+    server = _StandInServer()
+    await server.start()
+
+    async def script(driver: _Driver) -> list[OverlappingSpeechEvent]:
+        driver.agent_speech(True)
+        driver.audio(10)
+        events = [await driver.overlap(5)]
+        # new options reconnect, the new session doesn't have the audio uploaded so far
+        driver._stream._model.update_options(threshold=0.7)
+        await server.wait_for(lambda: len(server.sessions) >= 2)
+        events.append(await driver.overlap(5))
+        return events
+
+    try:
+        await _run(server, script, incremental=True)
+    finally:
+        await server.aclose()
+
+    assert len(server.windows) == 10
+    window_start, chunk_start, _ = server.chunks[5]
+    assert chunk_start == window_start
+    np.testing.assert_array_equal(server.windows[5][:-FRAME_SAMPLES], server.windows[4])
+
+
+def test_window_views_are_not_overwritten() -> None:
+    window = _SlidingAudioWindow(buffer_size=4 * FRAME_SAMPLES, sample_rate=SAMPLE_RATE)
+    views = []
+    for i in range(20):
+        window.push_frame(_frame(i))
+        views.append((window.view(), window.read()))
+        if i == 10:
+            window.shift(FRAME_SAMPLES)
+        if i == 15:
+            window.reset()
+
+    for view, copy in views:
+        np.testing.assert_array_equal(view, copy)
+    assert len(window) == 4 * FRAME_SAMPLES
+    assert window.window_end == 20 * FRAME_SAMPLES
+    assert window.window_start == 16 * FRAME_SAMPLES
+
+
+class TestPerformance:
+    OVERLAP_FRAMES = 200  # 20s of overlapping speech
+
+    async def _long_overlap(self, *, incremental: bool) -> tuple[int, float]:
+        server = _StandInServer()
+        await server.start()
+
+        async def script(driver: _Driver) -> list[OverlappingSpeechEvent]:
+            driver.agent_speech(True)
+            driver.audio(10)
+            return [await driver.overlap(self.OVERLAP_FRAMES)]
+
+        cpu_start = time.process_time()
+        try:
+            await _run(server, script, incremental=incremental)
+        finally:
+            await server.aclose()
+        return server.bytes_received, time.process_time() - cpu_start
+
+    async def test_long_overlap(self) -> None:
+        """Bytes on the wire and CPU time (client and stand-in server) of a 20s overlap"""
+        window_runs = [await self._long_overlap(incremental=False) for _ in range(3)]
+        incremental_runs = [await self._long_overlap(incremental=True) for _ in range(3)]
+        window_bytes, window_cpu = window_runs[0][0], min(cpu for _, cpu in window_runs)
+        bytes_, cpu = incremental_runs[0][0], min(cpu for _, cpu in incremental_runs)
+        print(
+            f"\n{self.OVERLAP_FRAMES / 10:.0f}s overlap: window {window_bytes / 2**20:.2f}MiB "
+            f"{window_cpu * 1000:.0f}ms cpu, incremental {bytes_ / 2**20:.2f}MiB "
+            f"{cpu * 1000:.0f}ms cpu"
+        )
+
+        # 100ms of new audio per request instead of up to the whole 3s window
+        assert bytes_ < window_bytes / 10, f"{bytes_}B uploaded, {window_bytes}B with windows"
+        assert cpu < window_cpu * 1.5, f"{cpu * 1000:.0f}ms, {window_cpu * 1000:.0f}ms"
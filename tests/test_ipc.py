@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import ctypes
 import io
+import json
 import logging
 import multiprocessing as mp
 import socket
@@ -607,6 +608,25 @@ async def test_job_graceful_shutdown():
     assert start_args.shutdown_counter.value == 1
 
 
+async def test_profile_process():
+    mp_ctx = mp.get_context("spawn")
+    proc, _ = _create_proc(close_timeout=10.0, mp_ctx=mp_ctx)
+    await proc.start()
+    await proc.initialize()
+
+    folded = (await proc.profile(0.3, format="folded")).decode()
+    stacks = [line.rsplit(" ", 1)[0].split(";") for line in folded.splitlines()]
+    assert stacks
+    assert any(stack[0] == "(event loop)" for stack in stacks)
+    assert all(stack[0].startswith(("(event loop)", "task:", "thread:")) for stack in stacks)
+
+    speedscope = json.loads(await proc.profile(0.1))
+    assert speedscope["profiles"][0]["name"] == "event loop"
+
+    await proc.aclose()
+    assert proc.exitcode == 0
+
+
 def test_log_queue_drains_before_stop():
     """All log records must be received by the listener even when stop() is
     called right after the sender closes its end.  This reproduces a race where
@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 from livekit.agents.voice.ivr.ivr_activity import TfidfLoopDetector
@@ -96,3 +98,54 @@ def test_tfidf_real_human_small_talk_does_not_trigger_loop() -> None:
     ]
 
     assert _count_loops(transcripts) == 0
+
+
+def test_tfidf_matches_sklearn_similarity() -> None:
+    """The incremental scores are the ones sklearn computes by refitting the whole window."""
+
+    sklearn_text = pytest.importorskip("sklearn.feature_extraction.text")
+    sklearn_pairwise = pytest.importorskip("sklearn.metrics.pairwise")
+
+    transcripts = [
+        "Welcome to automated phone system",
+        "Type 1 for sales, type 2 for support, type 3 for billing",
+        "Again, type 1 for sales, type 2 for support, type 3 for billing",
+        "Your call is important to us, please stay on the line",
+        "Welcome to the automated phone system",
+        "Para español, oprima el dos",
+        "Type 1 for sales, type 2 for support",
+    ]
+
+    window_size = 4
+    detector = TfidfLoopDetector(window_size=window_size)
+    for i, transcript in enumerate(transcripts):
+        detector.add_chunk(transcript)
+        window = transcripts[max(0, i + 1 - window_size) : i + 1]
+        if len(window) < 2:
+            continue
+
+        doc_matrix = sklearn_text.TfidfVectorizer().fit_transform(window)
+        expected = sklearn_pairwise.cosine_similarity(doc_matrix)[-1][:-1].max()
+        assert detector._similarity_to_last() == pytest.approx(expected)
+
+
+class TestPerformance:
+    def test_long_ivr_menu(self) -> None:
+        """2000 STT finals through a full 20-chunk window stays cheap enough for the event loop."""
+
+        prompts = [
+            f"Press {i} for {topic} or say {topic} to be connected to our {topic} team"
+            for i, topic in enumerate(
+                ["sales", "support", "billing", "returns", "accounts", "technical help"]
+            )
+        ]
+        detector = TfidfLoopDetector()
+
+        start = time.process_time()
+        for i in range(2000):
+            detector.add_chunk(f"{prompts[i % len(prompts)]} reference {i}")
+            detector.check_loop_detection()
+        elapsed_ms = (time.process_time() - start) * 1000
+
+        # ~0.2ms per check, refitting sklearn's TfidfVectorizer on the window took ~3ms
+        assert elapsed_ms < 1000, f"took {elapsed_ms:.1f}ms, expected <1000ms"
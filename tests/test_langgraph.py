@@ -8,6 +8,7 @@ from typing import Annotated
 import pytest
 from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
 from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.types import StreamWriter
@@ -259,3 +260,89 @@ async def test_messages_mode_no_custom_output():
     chunks = await collect_chunks(stream)
 
     assert chunks == []
+
+
+# --- Tests: delta state ---
+
+
+def build_checkpointed_graph(inputs: list[int]):
+    """Messages graph with a checkpointer, records how many messages each run was sent."""
+    fake_llm = GenericFakeChatModel(messages=cycle([AIMessage(content="Hello world from fake")]))
+    graph = StateGraph(MessagesState)
+    graph.add_node("chat", lambda state: {"messages": [fake_llm.invoke(state["messages"])]})
+    graph.add_edge(START, "chat")
+    graph.add_edge("chat", END)
+    compiled = graph.compile(checkpointer=InMemorySaver())
+
+    astream = compiled.astream
+
+    def _recording_astream(input, *args, **kwargs):
+        inputs.append(len(input["messages"]))
+        return astream(input, *args, **kwargs)
+
+    compiled.astream = _recording_astream  # type: ignore[method-assign]
+    return compiled
+
+
+def _thread_messages(graph, config) -> list[tuple[str, str]]:
+    return [(m.type, m.content) for m in graph.get_state(config).values["messages"]]
+
+
+@pytest.mark.asyncio
+async def test_delta_state_sends_only_new_messages():
+    inputs: list[int] = []
+    graph = build_checkpointed_graph(inputs)
+    config = {"configurable": {"thread_id": "t1"}}
+    adapter = LLMAdapter(graph, config=config, delta_state=True)
+
+    chat_ctx = ChatContext()
+    chat_ctx.add_message(role="system", content="Be brief")
+    chat_ctx.add_message(role="user", content="Hi")
+    for text in ["How are you?", "Bye"]:
+        reply = "".join(await collect_chunks(adapter.chat(chat_ctx=chat_ctx)))
+        chat_ctx.add_message(role="assistant", content=reply)
+        chat_ctx.add_message(role="user", content=text)
+    await collect_chunks(adapter.chat(chat_ctx=chat_ctx))
+
+    # remove-all + 2 messages, then only the new user message: the reply came from the graph
+    assert inputs == [3, 1, 1]
+    reply = ("ai", "Hello world from fake")
+    assert _thread_messages(graph, config) == [
+        ("system", "Be brief"),
+        ("human", "Hi"),
+        reply,
+        ("human", "How are you?"),
+        reply,
+        ("human", "Bye"),
+        reply,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_delta_state_resyncs_edited_context():
+    inputs: list[int] = []
+    graph = build_checkpointed_graph(inputs)
+    config = {"configurable": {"thread_id": "t1"}}
+    adapter = LLMAdapter(graph, config=config, delta_state=True)
+
+    chat_ctx = ChatContext()
+    chat_ctx.add_message(role="user", content="Hi")
+    reply = "".join(await collect_chunks(adapter.chat(chat_ctx=chat_ctx)))
+    chat_ctx.add_message(role="assistant", content=reply)
+    chat_ctx.add_message(role="user", content="Tell me more")
+
+    # the context is truncated (e.g. summarized) before the next turn
+    chat_ctx.items[:] = chat_ctx.items[1:]
+    await collect_chunks(adapter.chat(chat_ctx=chat_ctx))
+
+    assert inputs == [2, 3]
+    assert _thread_messages(graph, config) == [
+        ("ai", "Hello world from fake"),
+        ("human", "Tell me more"),
+        ("ai", "Hello world from fake"),
+    ]
+
+
+def test_delta_state_requires_thread_id():
+    with pytest.raises(ValueError, match="thread_id"):
+        LLMAdapter(build_messages_graph(), delta_state=True)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pytest
+
+from livekit.agents import APIConnectionError, utils
+from livekit.agents.llm import LLM, AvailabilityChangedEvent, ChatContext, FallbackAdapter
+from livekit.agents.utils.aio.channel import ChanEmpty
+from livekit.agents.utils.hedging import HedgeTracker
+
+from .fake_llm import FakeLLM, FakeLLMResponse
+
+pytestmark = [pytest.mark.unit, pytest.mark.virtual_time, pytest.mark.no_concurrent]
+
+
+class FallbackAdapterTester(FallbackAdapter):
+    def __init__(self, llm: list[LLM], **kwargs) -> None:
+        super().__init__(llm, **kwargs)
+
+        self.on("llm_availability_changed", self._on_llm_availability_changed)
+
+        self._availability_changed_ch: dict[int, utils.aio.Chan[AvailabilityChangedEvent]] = {
+            id(t): utils.aio.Chan[AvailabilityChangedEvent]() for t in llm
+        }
+
+    def _on_llm_availability_changed(self, ev: AvailabilityChangedEvent) -> None:
+        self._availability_changed_ch[id(ev.llm)].send_nowait(ev)
+
+    def availability_changed_ch(self, llm: LLM) -> utils.aio.ChanReceiver[AvailabilityChangedEvent]:
+        return self._availability_changed_ch[id(llm)]
+
+
+def _fake_llm(content: str, *, ttft: float) -> FakeLLM:
+    return FakeLLM(
+        fake_responses=[FakeLLMResponse(input="hi", content=content, ttft=ttft, duration=ttft)]
+    )
+
+
+async def _collect(llm: LLM) -> str:
+    chat_ctx = ChatContext.empty()
+    chat_ctx.add_message(role="user", content="hi")
+
+    text = ""
+    async with llm.chat(chat_ctx=chat_ctx) as stream:
+        async for chunk in stream:
+            if chunk.delta and chunk.delta.content:
+                text += chunk.delta.content
+    return text
+
+
+async def test_llm_hedging() -> None:
+    slow = _fake_llm("slow answer", ttft=3.0)
+    fast = _fake_llm("fast answer", ttft=0.2)
+
+    fallback_adapter = FallbackAdapterTester([slow, fast], hedge_delay=0.5)
+    assert await _collect(fallback_adapter) == "fast answer"
+
+    # the primary was slow, not failing: it stays available
+    with pytest.raises(ChanEmpty):
+        fallback_adapter.availability_changed_ch(slow).recv_nowait()
+
+    await fallback_adapter.aclose()
+
+
+async def test_llm_hedging_primary_wins() -> None:
+    primary = _fake_llm("primary answer", ttft=0.7)
+    hedge = _fake_llm("hedge answer", ttft=1.0)
+
+    # the hedge is started at 0.5s but the primary still streams first
+    fallback_adapter = FallbackAdapterTester([primary, hedge], hedge_delay=0.5)
+    assert await _collect(fallback_adapter) == "primary answer"
+
+    await fallback_adapter.aclose()
+
+
+async def test_llm_hedging_primary_fails() -> None:
+    failing = FakeLLM()
+    failing.chat = _chat_raising(failing)  # type: ignore[method-assign]
+    fast = _fake_llm("fast answer", ttft=0.2)
+
+    fallback_adapter = FallbackAdapterTester([failing, fast], hedge_delay=5.0)
+    assert await _collect(fallback_adapter) == "fast answer"
+
+    # failing before the deadline starts the next LLM right away and marks the primary down
+    assert not fallback_adapter.availability_changed_ch(failing).recv_nowait().available
+
+    await fallback_adapter.aclose()
+
+
+def _chat_raising(llm: FakeLLM):
+    chat = llm.chat
+
+    def _chat(**kwargs):
+        stream = chat(**kwargs)
+
+        async def _run() -> None:
+            raise APIConnectionError("primary failed")
+
+        stream._run = _run  # type: ignore[method-assign]
+        return stream
+
+    return _chat
+
+
+def test_hedge_tracker_auto_delay() -> None:
+    tracker = HedgeTracker("auto", min_samples=10)
+    for i in range(9):
+        tracker.add_sample(0.1 * (i + 1))
+
+    # not enough samples to hedge yet
+    assert tracker.hedge_delay() is None
+
+    for i in range(91):
+        tracker.add_sample(0.1 * (i + 10))
+
+    # rolling p95 of 0.1..10.0
+    assert tracker.hedge_delay() == pytest.approx(9.6)
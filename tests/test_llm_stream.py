@@ -0,0 +1,133 @@
+"""LLMStream's internal text chunks: converted to ChatChunk for user code, forwarded as is
+through the default llm_node and the generation pipeline."""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from livekit.agents import Agent, ModelSettings
+from livekit.agents.llm import ChatChunk, ChatContext, FunctionToolCall, ToolContext
+from livekit.agents.llm.llm import _TextChunk
+from livekit.agents.metrics import LLMMetrics
+from livekit.agents.types import DEFAULT_API_CONNECT_OPTIONS, FlushSentinel
+from livekit.agents.voice.generation import perform_llm_inference
+
+from .fake_llm import FakeLLM, FakeLLMResponse
+
+pytestmark = pytest.mark.unit
+
+
+def _fake_llm(content: str, tool_calls: list[FunctionToolCall] | None = None) -> FakeLLM:
+    return FakeLLM(
+        fake_responses=[
+            FakeLLMResponse(
+                input="hi", content=content, ttft=0.0, duration=0.0, tool_calls=tool_calls or []
+            )
+        ]
+    )
+
+
+def _chat_ctx() -> ChatContext:
+    chat_ctx = ChatContext.empty()
+    chat_ctx.add_message(role="user", content="hi")
+    return chat_ctx
+
+
+def _fake_agent(llm: FakeLLM) -> Any:
+    session = SimpleNamespace(
+        conn_options=SimpleNamespace(llm_conn_options=DEFAULT_API_CONNECT_OPTIONS)
+    )
+    activity = SimpleNamespace(llm=llm, session=session)
+    return SimpleNamespace(_get_activity_or_raise=lambda: activity)
+
+
+async def _generate(node: Any) -> tuple[list[str], str]:
+    llm_task, data = perform_llm_inference(
+        node=node,
+        chat_ctx=_chat_ctx(),
+        tool_ctx=ToolContext.empty(),
+        model_settings=ModelSettings(),
+    )
+    received = [text async for text in data.text_ch if not isinstance(text, FlushSentinel)]
+    assert await llm_task
+    return received, data.generated_text
+
+
+async def test_user_code_receives_chat_chunks() -> None:
+    tool_call = FunctionToolCall(name="get_weather", arguments="{}", call_id="call_1")
+    llm = _fake_llm("hello world", tool_calls=[tool_call])
+
+    async with llm.chat(chat_ctx=_chat_ctx()) as stream:
+        chunks = [chunk async for chunk in stream]
+
+    assert all(isinstance(chunk, ChatChunk) for chunk in chunks)
+    assert "".join(c.delta.content or "" for c in chunks if c.delta) == "hello world"
+    assert chunks[0].delta is not None and chunks[0].delta.role == "assistant"
+    assert chunks[-1].delta is not None and chunks[-1].delta.tool_calls == [tool_call]
+
+
+async def test_collect_and_metrics_handle_text_chunks() -> None:
+    llm = _fake_llm("hello world")
+    metrics: list[LLMMetrics] = []
+    llm.on("metrics_collected", metrics.append)
+
+    response = await llm.chat(chat_ctx=_chat_ctx()).collect()
+    assert response.text == "hello world"
+
+    text = "".join([t async for t in llm.chat(chat_ctx=_chat_ctx()).to_str_iterable()])
+    assert text == "hello world"
+    assert len(metrics) == 2 and metrics[0].ttft >= 0.0
+
+
+async def test_default_llm_node_paths() -> None:
+    llm = _fake_llm("the quick brown fox jumps over the lazy dog")
+    agent = _fake_agent(llm)
+
+    async def _public_node(*args: Any) -> Any:
+        async for chunk in Agent.default.llm_node(agent, *args):
+            assert isinstance(chunk, ChatChunk)
+            yield chunk
+
+    async def _internal_node(*args: Any) -> Any:
+        async for chunk in Agent.default._llm_node_internal(agent, *args):
+            assert isinstance(chunk, (ChatChunk, _TextChunk))
+            yield chunk
+
+    public = await _generate(_public_node)
+    internal = await _generate(_internal_node)
+    assert public == internal
+    assert internal[1] == "the quick brown fox jumps over the lazy dog"
+
+
+class TestPerformance:
+    async def test_tokens_per_second(self) -> None:
+        """FakeLLM -> LLMStream (tee + metrics monitor) -> default llm_node -> generation."""
+        num_tokens = 20_000
+        llm = _fake_llm("abc" * num_tokens)
+        agent = _fake_agent(llm)
+
+        async def _measure(node: Any) -> float:
+            cpu_start = time.process_time()
+            received, generated_text = await _generate(node)
+            cpu_time = time.process_time() - cpu_start
+            assert len(generated_text) == 3 * num_tokens
+            return len(received) / cpu_time
+
+        def _public_node(*args: Any) -> Any:
+            return Agent.default.llm_node(agent, *args)
+
+        def _internal_node(*args: Any) -> Any:
+            return Agent.default._llm_node_internal(agent, *args)
+
+        await _measure(_internal_node)  # warm up
+        public_tps = await _measure(_public_node)
+        internal_tps = await _measure(_internal_node)
+
+        # tokens per CPU second: a session streams ~100 tokens/s, hundreds of them share a process
+        assert internal_tps > 10_000, (
+            f"{internal_tps:.0f} tokens/s (ChatChunk path: {public_tps:.0f} tokens/s)"
+        )
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from livekit.plugins.krisp.viva_filter import _BlockFramer
+
+pytestmark = pytest.mark.plugin("krisp")
+
+
+def _fake_krisp(blocks: list[int]):
+    def _process_block(block: np.ndarray) -> np.ndarray:
+        blocks.append(len(block))
+        return block // 2  # stands in for the model, keeps every sample recognizable
+
+    return _process_block
+
+
+def _run(framer: _BlockFramer, audio: np.ndarray, frame_sizes: list[int]) -> np.ndarray:
+    blocks: list[int] = []
+    outputs: list[np.ndarray] = []
+    pos = 0
+    for size in frame_sizes:
+        frame = audio[pos : pos + size].copy()
+        framer.process(frame, frame, _fake_krisp(blocks))  # in place, like the processor
+        outputs.append(frame)
+        pos += size
+
+    assert set(blocks) <= {framer.block_size}
+    return np.concatenate(outputs)
+
+
+def _audio(num_samples: int) -> np.ndarray:
+    return np.arange(2, num_samples * 2 + 2, 2, dtype=np.int16)
+
+
+def test_aligned_frames_add_no_latency() -> None:
+    framer = _BlockFramer(160)
+    audio = _audio(160 * 20)
+    out = _run(framer, audio, [160] * 10 + [320] * 5)
+
+    assert framer.delay == 0
+    np.testing.assert_array_equal(out, audio // 2)
+
+
+@pytest.mark.parametrize("frame_size", [100, 7, 441, 1000])
+def test_any_frame_size(frame_size: int) -> None:
+    framer = _BlockFramer(160)
+    num_frames = 50
+    audio = _audio(frame_size * num_frames)
+    out = _run(framer, audio, [frame_size] * num_frames)
+
+    assert len(out) == len(audio)
+    # the output is the processed input delayed by `delay` samples of silence
+    delay = framer.delay
+    assert 0 < delay < framer.block_size
+    assert not out[:delay].any()
+    np.testing.assert_array_equal(out[delay:], (audio // 2)[: len(audio) - delay])
+
+
+def test_reset() -> None:
+    framer = _BlockFramer(160)
+    _run(framer, _audio(100), [100])
+    assert framer.delay == 100  # on its way to 140, limited by the size of the frame
+
+    framer.reset()
+    audio = _audio(320)
+    np.testing.assert_array_equal(_run(framer, audio, [160, 160]), audio // 2)
+    assert framer.delay == 0
+
+
+class TestPerformance:
+    @pytest.mark.parametrize("sample_rate", [16000, 32000, 48000])
+    @pytest.mark.parametrize("frame_ms", [10, 20, 25], ids=["10ms", "20ms", "25ms"])
+    def test_per_frame_overhead(self, sample_rate: int, frame_ms: int) -> None:
+        """Framing cost per frame around a no-op model with 10 ms blocks."""
+        framer = _BlockFramer(sample_rate // 100)
+        frame = _audio(sample_rate * frame_ms // 1000)
+        num_frames = 2000
+
+        cpu_start = time.process_time()
+        for _ in range(num_frames):
+            framer.process(frame, frame, lambda block: block)
+        per_frame_us = (time.process_time() - cpu_start) * 1e6 / num_frames
+
+        assert framer.delay == (0 if frame_ms != 25 else framer.block_size // 2)
+        # Krisp itself takes ~0.5-1 ms per 10 ms block
+        assert per_frame_us < 50, f"{per_frame_us:.1f}us per frame"
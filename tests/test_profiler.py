@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from livekit.agents.ipc import channel, profiler, proto
+
+pytestmark = pytest.mark.unit
+
+
+def _burn(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def _busy_task(stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        _burn(0.005)
+        await asyncio.sleep(0)
+
+
+async def _profile_busy_task(fmt: profiler.ProfileFormat) -> bytes:
+    stop = asyncio.Event()
+    task = asyncio.create_task(_busy_task(stop), name="AgentActivity.tts_say")
+    try:
+        return await profiler.profile(0.3, interval=0.002, format=fmt, name="test")
+    finally:
+        stop.set()
+        await task
+
+
+async def test_folded_stacks_are_attributed_to_tasks() -> None:
+    data = (await _profile_busy_task("folded")).decode()
+
+    stacks: dict[str, int] = {}
+    for line in data.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        stacks[stack] = int(count)
+
+    busy = {s: c for s, c in stacks.items() if s.startswith("task:AgentActivity.tts_say;")}
+    assert busy, data
+    assert any("_burn (test_profiler.py:" in s for s in busy)
+    # the task owns most of the samples of the event loop
+    loop_samples = sum(c for s, c in stacks.items() if not s.startswith("thread:"))
+    assert sum(busy.values()) > loop_samples / 2
+
+
+async def test_speedscope_export() -> None:
+    data = json.loads(await _profile_busy_task("speedscope"))
+
+    assert data["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+    assert data["name"] == "test"
+    loop_profile = data["profiles"][0]
+    assert loop_profile["name"] == "event loop"
+    assert loop_profile["type"] == "sampled"
+    assert len(loop_profile["samples"]) == len(loop_profile["weights"])
+    assert 0 < loop_profile["endValue"] < 1.0
+
+    frames = data["shared"]["frames"]
+    roots = {frames[sample[0]]["name"] for sample in loop_profile["samples"]}
+    assert "task:AgentActivity.tts_say" in roots
+    assert all(0 <= i < len(frames) for sample in loop_profile["samples"] for i in sample)
+
+
+async def test_other_threads_are_sampled() -> None:
+    stop = threading.Event()
+    thread = threading.Thread(target=lambda: stop.wait(5.0), name="inference_runner")
+    thread.start()
+    try:
+        p = profiler._SamplingProfiler(asyncio.get_running_loop())
+        await asyncio.to_thread(p.sample, weight=0.01)
+    finally:
+        stop.set()
+        thread.join()
+
+    assert p.num_samples == 1
+    assert any(line.startswith("thread:inference_runner;") for line in p.to_folded().splitlines())
+
+
+async def test_unknown_format() -> None:
+    with pytest.raises(ValueError):
+        await profiler.profile(0.01, format="pprof")  # type: ignore[arg-type]
+
+
+def test_proto_roundtrip() -> None:
+    # durations and intervals are sent as 32-bit floats
+    req = proto.ProfileRequest(request_id="r", duration=2.5, interval=0.25, format="folded")
+    resp = proto.ProfileResponse(request_id="r", data=b"a;b 1\n", error="")
+
+    for msg in (req, resp):
+        assert channel._read_message(channel._write_message(msg), proto.IPC_MESSAGES) == msg
+
+
+class TestPerformance:
+    async def test_sampling_overhead(self) -> None:
+        """one sample of a process with a deep stack must stay well under the interval"""
+
+        def _deep(n: int) -> None:
+            if n:
+                _deep(n - 1)
+            else:
+                stop.wait(5.0)
+
+        stop = threading.Event()
+        thread = threading.Thread(target=_deep, args=(100,))
+        thread.start()
+        try:
+            p = profiler._SamplingProfiler(asyncio.get_running_loop())
+            n = 500
+            start = time.process_time()
+            for _ in range(n):
+                p.sample(weight=0.01)
+            per_sample = (time.process_time() - start) / n
+        finally:
+            stop.set()
+            thread.join()
+
+        assert per_sample < 0.001, f"{per_sample * 1e6:.0f}µs per sample"
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import base64
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from livekit import rtc
+from livekit.agents.llm import RealtimeAudioInput
+from livekit.agents.utils.audio import AudioByteStream
+
+pytestmark = pytest.mark.unit
+
+
+def _frame(samples: np.ndarray, sample_rate: int, num_channels: int = 1) -> rtc.AudioFrame:
+    return rtc.AudioFrame(
+        data=samples.astype(np.int16).tobytes(),
+        sample_rate=sample_rate,
+        num_channels=num_channels,
+        samples_per_channel=len(samples) // num_channels,
+    )
+
+
+def _tone(sample_rate: int, duration: float, *, freq: float = 440.0) -> np.ndarray:
+    t = np.arange(int(sample_rate * duration)) / sample_rate
+    return (np.sin(2 * np.pi * freq * t) * 8000).astype(np.int16)
+
+
+def _push_all(audio_input: RealtimeAudioInput, frames: list[rtc.AudioFrame]) -> list[bytes]:
+    packets = []
+    for frame in frames:
+        packets.extend(audio_input.push(frame))
+    return packets
+
+
+def test_rechunks_without_resampling() -> None:
+    samples = np.arange(3500, dtype=np.int16)
+    frames = [_frame(samples[i : i + 480], 24000) for i in range(0, len(samples), 480)]
+
+    audio_input = RealtimeAudioInput(sample_rate=24000, samples_per_packet=1000)
+    packets = _push_all(audio_input, frames)
+
+    assert [len(p) for p in packets] == [2000] * 3
+    assert b"".join(packets) == samples[:3000].tobytes()
+    # the rest is only sent on flush
+    assert audio_input.flush() == [samples[3000:].tobytes()]
+    assert audio_input.flush() == []
+
+
+def test_base64_packets() -> None:
+    samples = np.arange(960, dtype=np.int16)
+    audio_input = RealtimeAudioInput(sample_rate=16000, samples_per_packet=320)
+
+    packets = audio_input.push_base64(_frame(samples, 16000))
+
+    assert len(packets) == 3
+    assert all(isinstance(p, str) for p in packets)
+    assert b"".join(base64.b64decode(p) for p in packets) == samples.tobytes()
+    assert audio_input.packet_duration == pytest.approx(0.02)
+
+
+def test_resamples_to_the_target_rate() -> None:
+    audio = _tone(48000, 1.0)
+    frames = [_frame(audio[i : i + 480], 48000) for i in range(0, len(audio), 480)]
+
+    audio_input = RealtimeAudioInput(sample_rate=16000, samples_per_packet=800)
+    packets = _push_all(audio_input, frames) + audio_input.flush()
+
+    assert all(len(p) == 1600 for p in packets[:-1])
+    assert sum(len(p) for p in packets) // 2 == pytest.approx(16000, abs=16)
+
+
+def test_input_rate_change_flushes_the_resampler() -> None:
+    audio_input = RealtimeAudioInput(sample_rate=24000, samples_per_packet=2400)
+
+    first = _tone(48000, 0.5)
+    second = _tone(16000, 0.5)
+    frames = [_frame(first[i : i + 480], 48000) for i in range(0, len(first), 480)]
+    frames += [_frame(second[i : i + 160], 16000) for i in range(0, len(second), 160)]
+    frames += [_frame(_tone(24000, 0.5), 24000)]
+    packets = _push_all(audio_input, frames) + audio_input.flush()
+
+    # nothing held back by the previous resamplers is lost
+    assert sum(len(p) for p in packets) // 2 == pytest.approx(36000, abs=24)
+
+
+def test_downmix_to_mono() -> None:
+    left = np.arange(480, dtype=np.int16)
+    stereo = np.stack([left, left + 2], axis=1).reshape(-1)
+
+    audio_input = RealtimeAudioInput(sample_rate=24000, samples_per_packet=480)
+    (packet,) = audio_input.push(_frame(stereo, 24000, num_channels=2))
+
+    assert packet == (left + 1).tobytes()
+
+    with pytest.raises(ValueError):
+        RealtimeAudioInput(sample_rate=24000, num_channels=2, samples_per_packet=480).push(
+            _frame(left, 24000)
+        )
+
+
+def test_clear() -> None:
+    audio_input = RealtimeAudioInput(sample_rate=24000, samples_per_packet=480)
+    assert audio_input.push(_frame(np.ones(400), 24000)) == []
+
+    audio_input.clear()
+
+    assert audio_input.push(_frame(np.zeros(480), 24000)) == [bytes(960)]
+
+
+class _LegacyAudioInput:
+    """The path the realtime plugins used before RealtimeAudioInput: per-frame resample,
+    AudioByteStream, tobytes() and base64 of the emitted frames"""
+
+    def __init__(self, *, sample_rate: int, samples_per_packet: int, b64: bool) -> None:
+        self._sample_rate = sample_rate
+        self._b64 = b64
+        self._resampler: rtc.AudioResampler | None = None
+        self._bstream = AudioByteStream(sample_rate, 1, samples_per_channel=samples_per_packet)
+
+    def push(self, frame: rtc.AudioFrame) -> list[bytes] | list[str]:
+        if self._resampler is None and frame.sample_rate != self._sample_rate:
+            self._resampler = rtc.AudioResampler(frame.sample_rate, self._sample_rate)
+        frames = self._resampler.push(frame) if self._resampler else [frame]
+
+        out = []
+        for f in frames:
+            for nf in self._bstream.write(f.data.tobytes()):
+                if self._b64:
+                    out.append(base64.b64encode(nf.data).decode("utf-8"))
+                else:
+                    out.append(nf.data.tobytes())
+        return out
+
+
+# plugin: (sample rate, samples per packet, base64)
+_PLUGINS = {
+    "openai": (24000, 2400, True),
+    "google": (16000, 800, False),
+    "aws": (16000, 512, False),
+    "ultravox": (16000, 1600, False),
+    "phonic": (44100, 882, True),
+}
+
+
+class TestPerformance:
+    NUM_FRAMES = 1000  # 10s of 10ms frames
+
+    def _measure(self, push: Callable[[rtc.AudioFrame], object], frame: rtc.AudioFrame) -> tuple:
+        for _ in range(20):
+            push(frame)
+
+        start = time.process_time()
+        for _ in range(self.NUM_FRAMES):
+            push(frame)
+        cpu = (time.process_time() - start) / self.NUM_FRAMES
+
+        tracemalloc.start()
+        try:
+            for _ in range(100):
+                push(frame)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return cpu, peak
+
+    @pytest.mark.parametrize("input_rate", [48000, 24000, 16000])
+    @pytest.mark.parametrize("plugin", list(_PLUGINS))
+    def test_per_frame_cost(self, plugin: str, input_rate: int) -> None:
+        """CPU time and traced memory per 10ms input frame, legacy path vs RealtimeAudioInput"""
+        sample_rate, samples_per_packet, b64 = _PLUGINS[plugin]
+        frame = _frame(_tone(input_rate, 0.01), input_rate)
+
+        legacy = _LegacyAudioInput(
+            sample_rate=sample_rate, samples_per_packet=samples_per_packet, b64=b64
+        )
+        audio_input = RealtimeAudioInput(
+            sample_rate=sample_rate, samples_per_packet=samples_per_packet
+        )
+        push = audio_input.push_base64 if b64 else audio_input.push
+
+        legacy_cpu, legacy_peak = self._measure(legacy.push, frame)
+        cpu, peak = self._measure(push, frame)
+        print(
+            f"\n{plugin} {input_rate}->{sample_rate}: "
+            f"legacy {legacy_cpu * 1e6:.1f}µs/{legacy_peak / 1024:.1f}KiB, "
+            f"shared {cpu * 1e6:.1f}µs/{peak / 1024:.1f}KiB per frame"
+        )
+
+        assert cpu < 0.0005, f"{cpu * 1e6:.0f}µs per frame"
+        assert peak <= legacy_peak * 1.2, f"traced {peak}B, legacy {legacy_peak}B"
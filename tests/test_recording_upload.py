@@ -0,0 +1,152 @@
+"""Upload of the session recording to a local stand-in for the LiveKit Cloud endpoint.
+
+The audio part must be streamed from the OGG file on disk (never loaded whole), and a
+retried request must send the full recording again.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from google.protobuf import duration_pb2
+from google.rpc import error_details_pb2, status_pb2  # type: ignore[import-untyped]
+
+from livekit.agents.telemetry import traces
+from livekit.agents.telemetry.traces import _upload_session_report
+from livekit.agents.voice.agent_session import _RECORDING_ALL_ON
+
+pytestmark = pytest.mark.unit
+
+
+def _retryable_error_body(delay: float) -> bytes:
+    retry_info = error_details_pb2.RetryInfo(
+        retry_delay=duration_pb2.Duration(seconds=0, nanos=int(delay * 1e9))
+    )
+    status = status_pb2.Status(code=14, message="unavailable")
+    status.details.add().Pack(retry_info)
+    return status.SerializeToString()
+
+
+class _RecordingServer:
+    def __init__(self, *, fail_first: int = 0) -> None:
+        self.uploads: list[dict[str, bytes]] = []
+        self.attempts = 0
+        self._fail_first = fail_first
+
+        app = web.Application()
+        app.router.add_post("/observability/recordings/v0", self._handle)
+        self.server = TestServer(app)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.attempts += 1
+        parts: dict[str, bytes] = {}
+        reader = await request.multipart()
+        async for part in reader:
+            assert isinstance(part, aiohttp.BodyPartReader)
+            parts[part.name or ""] = await part.read()
+
+        if self.attempts <= self._fail_first:
+            return web.Response(status=503, body=_retryable_error_body(0.01))
+
+        self.uploads.append(parts)
+        return web.Response(status=200)
+
+    @property
+    def url(self) -> str:
+        return str(self.server.make_url("")).rstrip("/")
+
+
+def _make_report(audio_path: Path) -> MagicMock:
+    report = MagicMock()
+    report.recording_options = _RECORDING_ALL_ON.copy()
+    report.room_id = "room-1"
+    report.job_id = "job-1"
+    report.room = "test-room"
+    report.chat_history.items = []
+    report.chat_history.to_dict.return_value = {"items": []}
+    report.audio_recording_path = str(audio_path)
+    report.audio_recording_started_at = 1000.0
+    report.started_at = 1000.0
+    report.timestamp = 1010.0
+    report.model_usage = []
+    report.options = MagicMock()
+    return report
+
+
+async def _upload(report: MagicMock, url: str) -> None:
+    tagger = MagicMock()
+    tagger.evaluations = []
+    tagger.outcome = None
+    tagger._tags = {}
+
+    with (
+        patch.object(traces, "get_logger_provider"),
+        patch.object(traces.api, "AccessToken") as mock_at,
+    ):
+        token = mock_at.return_value
+        token.with_observability_grants.return_value = token
+        token.with_ttl.return_value = token
+        token.to_jwt.return_value = "test-jwt"
+
+        async with aiohttp.ClientSession() as http_session:
+            await _upload_session_report(
+                agent_name="test-agent",
+                observability_url=url,
+                report=report,
+                tagger=tagger,
+                http_session=http_session,
+            )
+
+
+async def test_recording_is_streamed_from_disk(tmp_path: Path) -> None:
+    audio = bytes(range(256)) * 4096  # 1 MiB, several upload chunks
+    audio_path = tmp_path / "recording.ogg"
+    audio_path.write_bytes(audio)
+
+    chunk_sizes: list[int] = []
+    read_file_chunks = traces._read_file_chunks
+
+    async def _tracking_read(path: str, chunk_size: int = traces._RECORDING_UPLOAD_CHUNK_SIZE):
+        async for chunk in read_file_chunks(path, chunk_size):
+            chunk_sizes.append(len(chunk))
+            yield chunk
+
+    rec_server = _RecordingServer()
+    async with rec_server.server:
+        with patch.object(traces, "_read_file_chunks", _tracking_read):
+            await _upload(_make_report(audio_path), rec_server.url)
+
+    (upload,) = rec_server.uploads
+    assert set(upload) == {"header", "chat_history", "audio"}
+    assert upload["audio"] == audio
+    # the recording never had to be held in memory as a single buffer
+    assert len(chunk_sizes) > 1
+    assert max(chunk_sizes) <= traces._RECORDING_UPLOAD_CHUNK_SIZE
+
+
+async def test_retried_upload_resends_full_recording(tmp_path: Path) -> None:
+    audio = b"OggS" + b"\x01" * (traces._RECORDING_UPLOAD_CHUNK_SIZE + 123)
+    audio_path = tmp_path / "recording.ogg"
+    audio_path.write_bytes(audio)
+
+    rec_server = _RecordingServer(fail_first=1)
+    async with rec_server.server:
+        await _upload(_make_report(audio_path), rec_server.url)
+
+    assert rec_server.attempts == 2
+    (upload,) = rec_server.uploads
+    assert upload["audio"] == audio
+
+
+async def test_missing_recording_file_uploads_transcript_only(tmp_path: Path) -> None:
+    rec_server = _RecordingServer()
+    async with rec_server.server:
+        await _upload(_make_report(tmp_path / "missing.ogg"), rec_server.url)
+
+    (upload,) = rec_server.uploads
+    assert set(upload) == {"header", "chat_history"}
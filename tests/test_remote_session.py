@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import AsyncIterator
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from livekit.agents.llm import ChatContext, ChatMessage
 from livekit.agents.metrics import AgentSessionUsage
+from livekit.agents.voice import remote_session
 from livekit.agents.voice.remote_session import (
     RemoteSession,
+    RoomSessionTransport,
     SessionHost,
     SessionTransport,
 )
@@ -201,3 +204,158 @@ async def test_run_input():
 
     await client.aclose()
     await host.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_chat_history_reuses_converted_items():
+    host_transport, client_transport = PairedTransport.create_pair()
+
+    session = _make_mock_session()
+    host = SessionHost(host_transport)
+    host.register_session(session)
+    await host.start()
+
+    client = RemoteSession(client_transport)
+    await client.start()
+
+    with patch.object(
+        remote_session, "_chat_item_to_proto", wraps=remote_session._chat_item_to_proto
+    ) as to_proto:
+        await client.get_chat_history()
+        assert to_proto.call_count == 2
+
+        session.history.items.append(ChatMessage(role="user", content=["bye"], id="msg-3"))
+        resp = await client.get_chat_history()
+        assert to_proto.call_count == 3  # only the new item was converted
+        assert [item.message.id for item in resp.items] == ["msg-1", "msg-2", "msg-3"]
+
+        # a replaced item is converted again, a removed one is forgotten
+        session.history.items[0] = ChatMessage(role="user", content=["hey"], id="msg-1")
+        del session.history.items[1]
+        resp = await client.get_chat_history()
+        assert to_proto.call_count == 4
+        assert resp.items[0].message.content[0].text == "hey"
+        assert set(host._chat_item_protos) == {"msg-1", "msg-3"}
+
+    await client.aclose()
+    await host.aclose()
+
+
+class _FakeByteStreamWriter:
+    def __init__(self, attributes: dict[str, str] | None) -> None:
+        self.attributes = attributes or {}
+        self.writes: list[bytes] = []
+        self.closed = False
+
+    async def write(self, data: bytes) -> None:
+        self.writes.append(data)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class _FakeByteStreamReader:
+    def __init__(self, writer: _FakeByteStreamWriter, *, chunk_size: int) -> None:
+        self.info = MagicMock(attributes=writer.attributes)
+        data = b"".join(writer.writes)
+        self._chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._iter()
+
+    async def _iter(self) -> AsyncIterator[bytes]:
+        for chunk in self._chunks:
+            yield chunk
+
+
+class _FakeRoom:
+    def __init__(self) -> None:
+        self.writers: list[_FakeByteStreamWriter] = []
+        self.local_participant = MagicMock()
+        self.local_participant.stream_bytes = self._stream_bytes
+
+    async def _stream_bytes(self, *, attributes: dict[str, str] | None = None, **kwargs: Any):
+        writer = _FakeByteStreamWriter(attributes)
+        self.writers.append(writer)
+        return writer
+
+    def isconnected(self) -> bool:
+        return True
+
+    def register_byte_stream_handler(self, topic: str, handler: Any) -> None:
+        pass
+
+    def unregister_byte_stream_handler(self, topic: str) -> None:
+        pass
+
+
+def _transcript_msg(text: str) -> agent_pb.AgentSessionMessage:
+    return agent_pb.AgentSessionMessage(
+        event=agent_pb.AgentSessionEvent(
+            user_input_transcribed=agent_pb.AgentSessionEvent.UserInputTranscribed(
+                transcript=text, is_final=False
+            )
+        )
+    )
+
+
+def _state_msg() -> agent_pb.AgentSessionMessage:
+    return agent_pb.AgentSessionMessage(
+        event=agent_pb.AgentSessionEvent(
+            agent_state_changed=agent_pb.AgentSessionEvent.AgentStateChanged(
+                old_state=agent_pb.AS_LISTENING, new_state=agent_pb.AS_THINKING
+            )
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_multiplexed_transport_coalesces_events():
+    room = _FakeRoom()
+    transport = RoomSessionTransport(room, multiplexed=True)  # type: ignore[arg-type]
+    await transport.start()
+
+    for i in range(20):
+        await transport.send_message(_transcript_msg(f"partial {i}"))
+    await asyncio.sleep(remote_session._BATCH_INTERVAL * 2)
+
+    # the interim transcripts were coalesced into a single write
+    (writer,) = room.writers
+    assert len(writer.writes) == 1
+    assert writer.attributes[remote_session._FRAMING_ATTRIBUTE] == "length-prefixed"
+
+    # latency sensitive events skip the batch interval, on the same stream
+    await transport.send_message(_transcript_msg("final"))
+    await transport.send_message(_state_msg())
+    await asyncio.sleep(0.01)
+    assert len(room.writers) == 1
+    assert len(writer.writes) == 2
+
+    await transport.send_message(_transcript_msg("after close"))
+    await transport.close()
+    assert writer.closed
+    assert len(writer.writes) == 3
+
+    # the receiving side splits the frames, whatever the chunking
+    receiver = RoomSessionTransport(room, multiplexed=True)  # type: ignore[arg-type]
+    await receiver._read_stream(_FakeByteStreamReader(writer, chunk_size=7))  # type: ignore[arg-type]
+    received = [receiver._recv_ch.recv_nowait() for _ in range(23)]
+    kinds = [m.event.WhichOneof("event") for m in received]
+    assert kinds[:21] == ["user_input_transcribed"] * 21
+    assert kinds[21] == "agent_state_changed"
+    assert received[0].event.user_input_transcribed.transcript == "partial 0"
+    assert received[22].event.user_input_transcribed.transcript == "after close"
+    await receiver.close()
+
+
+@pytest.mark.asyncio
+async def test_room_transport_reads_single_message_streams():
+    room = _FakeRoom()
+    legacy = _FakeByteStreamWriter(None)
+    legacy.writes.append(_state_msg().SerializeToString())
+
+    transport = RoomSessionTransport(room)  # type: ignore[arg-type]
+    await transport._read_stream(_FakeByteStreamReader(legacy, chunk_size=3))  # type: ignore[arg-type]
+    msg = transport._recv_ch.recv_nowait()
+    assert msg.event.WhichOneof("event") == "agent_state_changed"
+    await transport.close()
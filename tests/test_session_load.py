@@ -0,0 +1,175 @@
+"""Load benchmark of the voice pipeline: how many AgentSessions one process can sustain.
+
+N scripted sessions (fake STT/LLM/TTS/VAD and audio output, with transcription sync) run
+concurrently through AgentSession/AgentActivity, on the virtual-time loop (deterministic, no real
+time passes) and on the real clock. Each run reports:
+
+- CPU time per simulated session-minute
+- peak RSS of the process and the RSS growth of the run
+- loop lag percentiles: on the real clock how late a 5ms timer fires, on virtual time the real
+  time the loop spent to get through each 5ms tick (how late it would have been on a real loop)
+- traced memory and retained allocations per turn (tracemalloc, separate run)
+
+Run with `-s` to see the numbers. The budgets are loose on purpose, they catch hot paths
+(tokenization, synchronization, resampling) going quadratic, not a few percent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import gc
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+
+import psutil
+import pytest
+
+from livekit.agents import AgentSession
+
+from .fake_session import FakeActions, create_session, run_session
+from .test_agent_session import MyAgent
+from .virtual_time import _REAL_PERF, _VirtualTimeLoop
+
+pytestmark = [pytest.mark.unit, pytest.mark.virtual_time, pytest.mark.no_concurrent]
+
+LAG_PROBE_INTERVAL = 0.005
+
+
+@dataclasses.dataclass
+class _LoadReport:
+    sessions: int
+    turns: int
+    simulated: float
+    """simulated seconds per session"""
+    cpu: float
+    lags: list[float]
+    peak_rss: int
+    rss_growth: int
+
+    @property
+    def cpu_per_minute(self) -> float:
+        return self.cpu / (self.sessions * self.simulated / 60)
+
+    def percentile(self, p: float) -> float:
+        lags = sorted(self.lags)
+        return lags[min(int(len(lags) * p), len(lags) - 1)]
+
+    def summary(self, label: str) -> str:
+        return (
+            f"\n{label}: {self.sessions} sessions, {self.turns} turns, "
+            f"{self.simulated:.1f}s simulated each\n"
+            f"  cpu/session-minute={self.cpu_per_minute * 1000:.0f}ms "
+            f"cpu/turn={self.cpu / self.turns * 1000:.1f}ms\n"
+            f"  loop lag p50={statistics.median(self.lags) * 1000:.2f}ms "
+            f"p99={self.percentile(0.99) * 1000:.2f}ms max={max(self.lags) * 1000:.2f}ms\n"
+            f"  peak rss={self.peak_rss / 2**20:.0f}MiB (+{self.rss_growth / 2**20:.1f}MiB)"
+        )
+
+
+def _script() -> FakeActions:
+    actions = FakeActions()
+    actions.add_user_speech(0.5, 2.5, "Hello, how are you?", stt_delay=0.2)
+    actions.add_llm("I'm doing well, thank you! How can I help you today? " * 3)
+    actions.add_tts(4.0)
+    actions.add_user_speech(8.0, 10.0, "Can you tell me what the weather is like?", stt_delay=0.2)
+    actions.add_llm("It is sunny and warm today, with a light breeze in the afternoon. " * 3)
+    actions.add_tts(5.0)
+    actions.add_user_speech(16.5, 17.5, "Thanks, goodbye!", stt_delay=0.2)
+    actions.add_llm("You're welcome, have a great day!")
+    actions.add_tts(2.0)
+    return actions
+
+
+def _user_turns(session: AgentSession) -> int:
+    return sum(
+        1 for item in session.history.items if item.type == "message" and item.role == "user"
+    )
+
+
+def _peak_rss() -> int:
+    # ru_maxrss is in KiB on Linux, in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+async def _run_load(num_sessions: int, *, speed_factor: float = 1.0) -> _LoadReport:
+    loop = asyncio.get_running_loop()
+    virtual = isinstance(loop, _VirtualTimeLoop)
+    lags: list[float] = []
+
+    async def _probe() -> None:
+        while True:
+            start, start_real = loop.time(), _REAL_PERF()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            if virtual:
+                lags.append(_REAL_PERF() - start_real)
+            else:
+                lags.append(loop.time() - start - LAG_PROBE_INTERVAL)
+
+    sessions = [create_session(_script(), speed_factor=speed_factor) for _ in range(num_sessions)]
+    process = psutil.Process()
+    rss_start = process.memory_info().rss
+
+    probe = asyncio.create_task(_probe())
+    start, cpu_start = loop.time(), time.process_time()
+    try:
+        await asyncio.gather(*(run_session(s, MyAgent(), drain_delay=1.0) for s in sessions))
+    finally:
+        cpu = time.process_time() - cpu_start
+        elapsed = loop.time() - start
+        probe.cancel()
+
+    return _LoadReport(
+        sessions=num_sessions,
+        turns=sum(_user_turns(s) for s in sessions),
+        simulated=elapsed * speed_factor,
+        cpu=cpu,
+        lags=lags,
+        peak_rss=_peak_rss(),
+        rss_growth=process.memory_info().rss - rss_start,
+    )
+
+
+class TestPerformance:
+    @pytest.mark.parametrize(
+        ("num_sessions", "speed_factor"),
+        [
+            pytest.param(24, 1.0, id="virtual"),
+            pytest.param(8, 4.0, id="real", marks=pytest.mark.real_time),
+        ],
+    )
+    async def test_concurrent_sessions(self, num_sessions: int, speed_factor: float) -> None:
+        report = await _run_load(num_sessions, speed_factor=speed_factor)
+        print(report.summary(f"speed x{speed_factor:g}"))
+
+        assert report.turns == num_sessions * 3
+        assert report.cpu_per_minute < 5.0, report.summary("cpu budget exceeded")
+        assert statistics.median(report.lags) < 0.05, report.summary("loop lag budget exceeded")
+
+    async def test_allocations_per_turn(self) -> None:
+        # warm up the caches (tokenizers, resamplers, pydantic validators) first
+        await _run_load(1)
+
+        gc.collect()
+        blocks_start = sys.getallocatedblocks()
+        tracemalloc.start()
+        try:
+            report = await _run_load(8)
+            _, traced_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        gc.collect()
+        retained = (sys.getallocatedblocks() - blocks_start) / report.turns
+        traced = traced_peak / report.turns
+
+        print(
+            f"\n{report.sessions} sessions, {report.turns} turns: traced peak/turn="
+            f"{traced / 1024:.0f}KiB, retained blocks/turn={retained:.0f}"
+        )
+        assert traced < 4 * 2**20, f"{traced / 2**20:.1f}MiB traced per turn"
+        # closed sessions must not leave their turns behind
+        assert retained < 2000, f"{retained:.0f} blocks retained per turn"
@@ -31,12 +31,14 @@ class FallbackAdapterTester(FallbackAdapter):
         attempt_timeout: float = 10.0,
         max_retry_per_stt: int = 1,
         retry_interval: float = 5,
+        hedge_delay: float | None = None,
     ) -> None:
         super().__init__(
             stt,
             attempt_timeout=attempt_timeout,
             max_retry_per_stt=max_retry_per_stt,
             retry_interval=retry_interval,
+            hedge_delay=hedge_delay,
         )
 
         self.on("stt_availability_changed", self._on_stt_availability_changed)
@@ -238,3 +240,30 @@ async def test_stt_stream_recovery_failure_doesnt_block_main() -> None:
     assert events[0].alternatives[0].text == "hello world"
 
     await fallback.aclose()
+
+
+async def test_stt_recognize_hedging() -> None:
+    fake1 = FakeSTT(fake_transcript="slow", fake_timeout=3.0)
+    fake2 = FakeSTT(fake_transcript="fast", fake_timeout=0.1)
+
+    fallback_adapter = FallbackAdapterTester([fake1, fake2], hedge_delay=0.5)
+
+    # the primary is slow but alive: the second STT is started after 0.5s and wins
+    ev = await fallback_adapter.recognize([])
+    assert ev.alternatives[0].text == "fast"
+    assert fake1.recognize_ch.recv_nowait()
+    assert fake2.recognize_ch.recv_nowait()
+
+    # a slow primary isn't marked as unavailable
+    with pytest.raises(ChanEmpty):
+        fallback_adapter.availability_changed_ch(fake1).recv_nowait()
+
+    # the primary answers before the deadline, the hedge is never started
+    fake1.update_options(fake_timeout=0.1)
+    ev = await fallback_adapter.recognize([])
+    assert ev.alternatives[0].text == "slow"
+    assert fake1.recognize_ch.recv_nowait()
+    with pytest.raises(ChanEmpty):
+        fake2.recognize_ch.recv_nowait()
+
+    await fallback_adapter.aclose()
@@ -169,3 +169,64 @@ def test_subclassing_without_process_kind_is_rejected() -> None:
             mp_ctx=mp.get_context("spawn"),
             loop=asyncio.get_event_loop(),
         )
+
+
+class _FakeUsage:
+    def __init__(self, memory_mb: float) -> None:
+        self.memory_mb = memory_mb
+
+
+async def test_resource_usage_above_limit_kills_process() -> None:
+    proc = _make_proc(memory_warn_mb=0, memory_limit_mb=500)
+    killed: list[bool] = []
+
+    async def _kill() -> None:
+        killed.append(True)
+
+    proc._send_kill_signal = _kill  # type: ignore[method-assign]
+
+    await proc._on_resource_usage(_FakeUsage(300.0))  # type: ignore[arg-type]
+    assert proc._memory_baseline_mb == 300.0
+    assert not killed
+
+    await proc._on_resource_usage(_FakeUsage(600.0))  # type: ignore[arg-type]
+    assert killed == [True]
+
+
+async def test_resource_sampler_samples_registered_processes() -> None:
+    import os
+
+    from livekit.agents.ipc.resource_sampler import ResourceSampler
+
+    # sample the test process itself, it's always alive
+    proc = _make_proc(memory_warn_mb=0)
+    proc._pid = os.getpid()
+    proc._loop_lag_ms = 12.5
+
+    received = []
+
+    async def _on_usage(usage) -> None:
+        received.append(usage)
+
+    proc._on_resource_usage = _on_usage  # type: ignore[method-assign]
+
+    sampler = ResourceSampler(loop=asyncio.get_running_loop())
+    sampler.add(proc)
+
+    (first,) = await sampler.sample()
+    sum(i * i for i in range(200_000))  # burn some CPU between the two samples
+    (second,) = await sampler.sample()
+
+    assert received == [first, second]
+    assert first.pid == os.getpid()
+    assert first.process_kind == "job"
+    assert first.job_id is None
+    assert first.loop_lag_ms == 12.5
+    assert first.rss_mb > 0
+    assert first.memory_mb > 0
+    assert second.cpu_seconds >= first.cpu_seconds
+    assert sampler.get_usage(os.getpid()) is second
+
+    sampler.remove(proc)
+    assert sampler.usage == []
+    assert await sampler.sample() == []
@@ -23,11 +23,13 @@ class FallbackAdapterTester(FallbackAdapter):
         *,
         max_retry_per_tts: int = 1,  # only retry once by default
         sample_rate: int | None = None,
+        hedge_delay: float | None = None,
     ) -> None:
         super().__init__(
             tts,
             max_retry_per_tts=max_retry_per_tts,
             sample_rate=sample_rate,
+            hedge_delay=hedge_delay,
         )
 
         self.on("tts_availability_changed", self._on_tts_availability_changed)
@@ -265,3 +267,28 @@ async def test_timeout():
     assert await asyncio.wait_for(fake2.stream_ch.recv(), 1.0)
 
     await fallback_adapter.aclose()
+
+
+async def test_tts_synthesize_hedging() -> None:
+    fake1 = FakeTTS(fake_timeout=3.0, fake_audio_duration=2.0)
+    fake2 = FakeTTS(fake_audio_duration=1.0)
+
+    fallback_adapter = FallbackAdapterTester([fake1, fake2], hedge_delay=0.5)
+
+    start_time = asyncio.get_running_loop().time()
+    async with fallback_adapter.synthesize("hello test") as stream:
+        frames = []
+        async for data in stream:
+            frames.append(data.frame)
+
+    # the second TTS was started after 0.5s and won, the primary was cancelled
+    assert asyncio.get_running_loop().time() - start_time < 1.0
+    assert fake1.synthesize_ch.recv_nowait()
+    assert fake2.synthesize_ch.recv_nowait()
+    assert rtc.combine_audio_frames(frames).duration == pytest.approx(1.0, abs=0.02)
+
+    # a slow primary isn't marked as unavailable
+    with pytest.raises(ChanEmpty):
+        fallback_adapter.availability_changed_ch(fake1).recv_nowait()
+
+    await fallback_adapter.aclose()
@@ -8,16 +8,23 @@ deterministically. Covers:
   the session lifetime don't accumulate toward ``max_retry``).
 - All outbound messages are FIFO-ordered on the wire, even when control
   hooks fire synchronously between two awaited audio frames.
+- Audio frames are coalesced into fixed-size packets, and the partial packet
+  is sent before any inference request or flush.
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
+
+import numpy as np
 import pytest
 
 from livekit import rtc
 from livekit.agents._exceptions import APIConnectionError
 
 from .fake_turn_detector_ws import (
+    FakeTurnDetectorWS,
     drain_send_queue,
     make_stream,
     wait_until_connected,
@@ -26,15 +33,27 @@ from .fake_turn_detector_ws import (
 pytestmark = pytest.mark.audio_eot
 
 
-def _pcm_frame(samples: int = 320) -> rtc.AudioFrame:
+def _pcm_frame(samples: int = 320, *, start: int = 0) -> rtc.AudioFrame:
     return rtc.AudioFrame(
-        data=b"\x00\x00" * samples,
+        data=np.arange(start, start + samples, dtype=np.int16).tobytes(),
         sample_rate=16000,
         num_channels=1,
         samples_per_channel=samples,
     )
 
 
+def _sent_kinds(fake_ws: FakeTurnDetectorWS) -> list[str | None]:
+    return [m.WhichOneof("message") for m in fake_ws.sent]
+
+
+async def _wait_for_sent(fake_ws: FakeTurnDetectorWS, kind: str, count: int = 1) -> None:
+    async def _poll() -> None:
+        while _sent_kinds(fake_ws).count(kind) < count:
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(_poll(), 1.0)
+
+
 class TestCloudStreamRetry:
     """``_num_retries`` lifecycle across reconnects."""
 
@@ -70,7 +89,7 @@ class TestCloudStreamSendOrdering:
         try:
             await wait_until_connected(transport)
             stream.predict()
-            stream.push_audio(_pcm_frame())
+            stream.push_audio(_pcm_frame(640))  # one full 40 ms packet
             await drain_send_queue(transport)
 
             kinds = [m.WhichOneof("message") for m in fake_ws.sent]
@@ -102,3 +121,92 @@ class TestCloudStreamSendOrdering:
             assert start_ids == [first_id, second_id]
         finally:
             await stream.aclose()
+
+
+class TestCloudStreamPacketizer:
+    """Frames are coalesced into ``audio_packet_duration`` packets."""
+
+    async def test_frames_coalesced_into_packets(self) -> None:
+        stream, fake_ws, transport = make_stream(connect_script=[None])
+        try:
+            await wait_until_connected(transport)
+            for i in range(10):  # 10 ms frames, 2.5 packets
+                stream.push_audio(_pcm_frame(160, start=i * 160))
+            await _wait_for_sent(fake_ws, "input_audio", 2)
+
+            stream.predict()
+            await _wait_for_sent(fake_ws, "inference_start")
+
+            # the partial packet is sent before the request, so it is part of the inference
+            assert _sent_kinds(fake_ws)[-4:] == [
+                "input_audio",
+                "input_audio",
+                "input_audio",
+                "inference_start",
+            ]
+            packets = [m.input_audio for m in fake_ws.sent if m.HasField("input_audio")]
+            assert [p.num_samples for p in packets] == [640, 640, 320]
+            audio = np.frombuffer(b"".join(p.audio for p in packets), dtype=np.int16)
+            assert np.array_equal(audio, np.arange(1600, dtype=np.int16))
+            assert packets[0].created_at.ToNanoseconds() <= packets[1].created_at.ToNanoseconds()
+        finally:
+            await stream.aclose()
+
+    async def test_flush_sends_partial_packet(self) -> None:
+        stream, fake_ws, transport = make_stream(connect_script=[None])
+        try:
+            await wait_until_connected(transport)
+            stream.push_audio(_pcm_frame(1000))  # larger than a packet
+            stream.flush()
+            await _wait_for_sent(fake_ws, "session_flush")
+
+            kinds = [k for k in _sent_kinds(fake_ws) if k != "session_create"]
+            assert kinds[-3:] == ["input_audio", "input_audio", "session_flush"]
+            packets = [m.input_audio for m in fake_ws.sent if m.HasField("input_audio")]
+            assert [p.num_samples for p in packets] == [640, 360]
+        finally:
+            await stream.aclose()
+
+    def test_packet_duration_bounds(self) -> None:
+        with pytest.raises(ValueError):
+            make_stream(audio_packet_duration=0.02)
+
+
+class TestPerformance:
+    @pytest.mark.parametrize("packet_duration", [0.04, 0.1], ids=["40ms", "100ms"])
+    async def test_many_streams_10ms_frames(self, packet_duration: float) -> None:
+        """50 streams each pushing 5s of audio in 10 ms frames to a stand-in server."""
+        num_streams, frame_samples, total_s = 50, 160, 5
+        num_frames = total_s * 16000 // frame_samples
+        frame = _pcm_frame(frame_samples)
+
+        streams = [
+            make_stream(connect_script=[None], audio_packet_duration=packet_duration)
+            for _ in range(num_streams)
+        ]
+        try:
+            for _, _, transport in streams:
+                await wait_until_connected(transport)
+
+            cpu_start = time.process_time()
+            for i in range(num_frames):
+                for stream, _, _ in streams:
+                    stream.push_audio(frame)
+                if i % 10 == 9:
+                    await asyncio.sleep(0)  # let the pipeline drain like a live session
+            for stream, _, _ in streams:
+                stream.flush()
+            for _, fake_ws, _ in streams:
+                await _wait_for_sent(fake_ws, "session_flush")
+            cpu_per_stream_ms = (time.process_time() - cpu_start) * 1000 / num_streams
+        finally:
+            await asyncio.gather(*(stream.aclose() for stream, _, _ in streams))
+
+        for _, fake_ws, _ in streams:
+            packets = [m.input_audio for m in fake_ws.sent if m.HasField("input_audio")]
+            assert sum(p.num_samples for p in packets) == num_frames * frame_samples
+            messages_per_sec = len(packets) / total_s
+            assert messages_per_sec <= 1 / packet_duration + 1
+
+        # 5s of audio per stream, including the stand-in server parsing every message
+        assert cpu_per_stream_ms < 30, f"took {cpu_per_stream_ms:.1f}ms CPU per stream"
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import struct
+import time
+import wave
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import Any
+
+import aiofiles
+import av
+import numpy as np
+import pytest
+
+from livekit import rtc
+from livekit.agents.utils.audio import audio_frames_from_file
+from livekit.agents.utils.codecs import AudioStreamDecoder
+
+pytestmark = pytest.mark.unit
+
+
+def _tone(sample_rate: int, duration: float, num_channels: int = 1) -> np.ndarray:
+    t = np.arange(int(sample_rate * duration)) / sample_rate
+    mono = (np.sin(2 * np.pi * 440 * t) * 8000).astype(np.int16)
+    return np.repeat(mono, num_channels)
+
+
+def _write_wav(path: Path, samples: np.ndarray, sample_rate: int, num_channels: int = 1) -> Path:
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(num_channels)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(samples.tobytes())
+    return path
+
+
+def _write_flac(path: Path, samples: np.ndarray, sample_rate: int) -> Path:
+    with av.open(str(path), "w", format="flac") as container:
+        stream = container.add_stream("flac", rate=sample_rate, layout="mono")
+        frame = av.AudioFrame.from_ndarray(samples.reshape(1, -1), format="s16", layout="mono")
+        frame.sample_rate = sample_rate
+        for packet in stream.encode(frame):
+            container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+    return path
+
+
+async def _read(path: Path, **kwargs: Any) -> list[rtc.AudioFrame]:
+    return [frame async for frame in audio_frames_from_file(str(path), **kwargs)]
+
+
+def _samples(frames: list[rtc.AudioFrame]) -> np.ndarray:
+    return np.frombuffer(rtc.combine_audio_frames(frames).data, dtype=np.int16)
+
+
+async def test_wav_samples_are_not_decoded(tmp_path: Path) -> None:
+    samples = _tone(48000, 2.5)
+    path = _write_wav(tmp_path / "tone.wav", samples, 48000)
+
+    frames = await _read(path, samples_per_channel=480)
+
+    assert [f.samples_per_channel for f in frames] == [480] * 250
+    assert all(f.sample_rate == 48000 and f.num_channels == 1 for f in frames)
+    np.testing.assert_array_equal(_samples(frames), samples)
+
+
+async def test_wav_conversion(tmp_path: Path) -> None:
+    stereo = _tone(16000, 1.0, num_channels=2)
+    path = _write_wav(tmp_path / "stereo.wav", stereo, 16000, num_channels=2)
+
+    frames = await _read(path, sample_rate=24000, samples_per_channel=240)
+
+    assert all(f.samples_per_channel == 240 for f in frames[:-1])
+    assert all(f.sample_rate == 24000 and f.num_channels == 1 for f in frames)
+    assert len(_samples(frames)) == pytest.approx(24000, abs=24)
+
+    # mono to stereo duplicates the samples
+    mono = _write_wav(tmp_path / "mono.wav", _tone(48000, 0.1), 48000)
+    frames = await _read(mono, num_channels=2)
+    interleaved = _samples(frames).reshape(-1, 2)
+    np.testing.assert_array_equal(interleaved[:, 0], interleaved[:, 1])
+    np.testing.assert_array_equal(interleaved[:, 0], _tone(48000, 0.1))
+
+
+async def test_wav_chunks_around_the_data(tmp_path: Path) -> None:
+    samples = _tone(16000, 0.5)
+    data = samples.tobytes()
+    fmt = struct.pack("<HHIIHH", 1, 1, 16000, 32000, 2, 16)
+    list_chunk = b"INFOISFT\x05\x00\x00\x00test\x00"  # odd size, padded
+    body = (
+        b"WAVE"
+        + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + b"LIST" + struct.pack("<I", len(list_chunk)) + list_chunk + b"\x00"
+        + b"data" + struct.pack("<I", len(data)) + data
+        + b"id3 " + struct.pack("<I", 4) + b"tags"
+    )  # fmt: skip
+    path = tmp_path / "chunks.wav"
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+    frames = await _read(path, sample_rate=16000)
+
+    np.testing.assert_array_equal(_samples(frames), samples)
+
+
+async def test_other_formats_are_decoded(tmp_path: Path) -> None:
+    path = _write_flac(tmp_path / "tone.flac", _tone(16000, 1.0), 16000)
+
+    frames = await _read(path, sample_rate=16000, samples_per_channel=320)
+    decoded = [f async for f in _legacy_audio_frames_from_file(str(path), sample_rate=16000)]
+
+    # same samples as the decoder, in frames of the requested size
+    assert all(f.samples_per_channel == 320 for f in frames[:-1])
+    np.testing.assert_array_equal(_samples(frames), _samples(decoded))
+
+
+async def test_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        await _read(tmp_path / "missing.wav")
+
+
+async def _legacy_audio_frames_from_file(
+    file_path: str, sample_rate: int = 48000, num_channels: int = 1
+) -> AsyncIterator[rtc.AudioFrame]:
+    """audio_frames_from_file before the large-block reads: 4KiB aiofiles reads, decoded"""
+    decoder = AudioStreamDecoder(sample_rate=sample_rate, num_channels=num_channels)
+
+    async def file_reader() -> None:
+        try:
+            async with aiofiles.open(file_path, mode="rb") as f:
+                while chunk := await f.read(4096):
+                    decoder.push(chunk)
+        finally:
+            decoder.end_input()
+
+    reader_task = asyncio.create_task(file_reader())
+    try:
+        async for frame in decoder:
+            yield frame
+    finally:
+        await reader_task
+        await decoder.aclose()
+
+
+class TestPerformance:
+    async def _measure(
+        self, source: Callable[[str], AsyncIterator[rtc.AudioFrame]], path: Path
+    ) -> tuple[float, float, int]:
+        """time to first frame, time to last frame, default executor round trips"""
+        loop = asyncio.get_running_loop()
+        run_in_executor = loop.run_in_executor
+        executor_calls = 0
+
+        def _counting(executor: Any, fnc: Callable[..., Any], *args: Any) -> asyncio.Future[Any]:
+            nonlocal executor_calls
+            if executor is None:
+                executor_calls += 1
+            return run_in_executor(executor, fnc, *args)
+
+        loop.run_in_executor = _counting  # type: ignore[method-assign]
+        try:
+            start = time.perf_counter()
+            first_frame = None
+            async for _ in source(str(path)):
+                if first_frame is None:
+                    first_frame = time.perf_counter() - start
+            total = time.perf_counter() - start
+        finally:
+            del loop.run_in_executor
+        assert first_frame is not None
+        return first_frame, total, executor_calls
+
+    @pytest.mark.parametrize("duration", [1, 10, 60])
+    async def test_wav_file(self, tmp_path: Path, duration: int) -> None:
+        path = _write_wav(tmp_path / "tone.wav", _tone(48000, duration), 48000)
+
+        legacy = min([await self._measure(_legacy_audio_frames_from_file, path) for _ in range(3)])
+        first_frame, total, executor_calls = min(
+            [await self._measure(audio_frames_from_file, path) for _ in range(3)]
+        )
+        print(
+            f"\n{duration}s wav: legacy first frame {legacy[0] * 1000:.1f}ms, "
+            f"all {legacy[1] * 1000:.0f}ms, {legacy[2]} executor calls; "
+            f"large blocks first frame {first_frame * 1000:.1f}ms, all {total * 1000:.0f}ms, "
+            f"{executor_calls} executor calls"
+        )
+
+        # open, one read per block and the final empty read
+        size = duration * 48000 * 2
+        assert executor_calls <= 3 + size // 2**20
+        assert executor_calls < legacy[2] / 5
+        assert first_frame < 0.05, f"{first_frame * 1000:.1f}ms to the first frame"
+        assert total < legacy[1]
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import io
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from livekit import rtc
+from livekit.agents.utils import images
+from livekit.agents.utils.images import image as image_mod
+from livekit.agents.voice import VoiceActivityVideoSampler
+
+pytestmark = pytest.mark.unit
+
+PIL = pytest.importorskip("PIL.Image")
+
+
+def _rgba_pattern(width: int, height: int, *, shift: int = 0) -> np.ndarray:
+    """Smooth gradients with a few large blocks, survives scaling and chroma subsampling."""
+    ys, xs = np.mgrid[0:height, 0:width]
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+    rgba[..., 0] = (xs * 255 // width + shift) % 256
+    rgba[..., 1] = ys * 255 // height
+    rgba[..., 2] = np.where(((xs // (width // 4)) + (ys // (height // 3))) % 2 == 0, 220, 30)
+    rgba[..., 3] = 255
+    return rgba
+
+
+def _i420_frame(width: int, height: int, *, shift: int = 0) -> rtc.VideoFrame:
+    rgba = _rgba_pattern(width, height, shift=shift)
+    frame = rtc.VideoFrame(width, height, rtc.VideoBufferType.RGBA, rgba.tobytes())
+    return frame.convert(rtc.VideoBufferType.I420)
+
+
+def _decode(data: bytes) -> np.ndarray:
+    return np.asarray(PIL.open(io.BytesIO(data)).convert("RGB"), dtype=np.int16)
+
+
+class TestEncode:
+    @pytest.mark.parametrize(
+        "strategy",
+        [
+            "scale_aspect_fit",
+            "scale_aspect_cover",
+            "center_aspect_fit",
+            "center_aspect_cover",
+            "skew",
+        ],
+    )
+    def test_yuv_downscale_matches_rgb_path(self, strategy: Any) -> None:
+        """Scaling I420 planes first gives the same picture as converting at full resolution."""
+        frame = _i420_frame(1920, 1080)
+        opts = images.EncodeOptions(
+            format="PNG",
+            resize_options=images.ResizeOptions(width=640, height=480, strategy=strategy),
+        )
+
+        fast = _decode(images.encode(frame, opts))
+
+        # reference: convert the full frame to RGB, then resize
+        image_mod.import_pil()
+        reference_img = image_mod._resize_image(image_mod._image_from_frame(frame), opts)
+        reference = np.asarray(reference_img, dtype=np.int16)
+
+        assert fast.shape == reference.shape
+        assert np.abs(fast - reference).mean() < 3.0
+
+    def test_no_resize_keeps_full_resolution(self) -> None:
+        frame = _i420_frame(320, 240)
+        decoded = _decode(images.encode(frame, images.EncodeOptions(format="PNG")))
+        assert decoded.shape == (240, 320, 3)
+
+    async def test_encode_async(self) -> None:
+        frame = _i420_frame(1280, 720)
+        opts = images.EncodeOptions(
+            resize_options=images.ResizeOptions(width=512, height=512, strategy="scale_aspect_fit")
+        )
+        data = await images.encode_async(frame, opts)
+        assert _decode(data).shape == (288, 512, 3)
+
+
+class TestPerceptualHash:
+    def test_same_content_across_formats_and_sizes(self) -> None:
+        rgba = _rgba_pattern(1280, 720)
+        rgba_frame = rtc.VideoFrame(1280, 720, rtc.VideoBufferType.RGBA, rgba.tobytes())
+        small = _i420_frame(640, 360)
+
+        h = images.perceptual_hash(_i420_frame(1280, 720))
+        assert images.hash_distance(h, images.perceptual_hash(rgba_frame)) <= 2
+        assert images.hash_distance(h, images.perceptual_hash(small)) <= 2
+
+    def test_changed_content(self) -> None:
+        a = images.perceptual_hash(_i420_frame(1280, 720))
+        b = images.perceptual_hash(_i420_frame(1280, 720, shift=128))
+        assert images.hash_distance(a, b) > 8
+
+
+class TestVideoSampler:
+    def test_skips_unchanged_frames(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = 1000.0
+        monkeypatch.setattr(time, "time", lambda: now)
+
+        sampler = VoiceActivityVideoSampler(speaking_fps=1.0, silent_fps=1.0)
+        session: Any = SimpleNamespace(user_state="listening")
+        still = _i420_frame(640, 360)
+        changed = _i420_frame(640, 360, shift=128)
+
+        assert sampler(still, session)
+        now += 2.0
+        assert not sampler(still, session)  # unchanged screen
+        now += 0.1
+        assert sampler(changed, session)  # sent as soon as it changes
+        now += 0.1
+        assert not sampler(still, session)  # rate limited
+
+        sampler = VoiceActivityVideoSampler(silent_fps=1.0, duplicate_threshold=None)
+        assert sampler(still, session)
+        now += 2.0
+        assert sampler(still, session)